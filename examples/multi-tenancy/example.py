@@ -10,8 +10,8 @@ import asyncio
 from uuid import UUID
 
 from pydantic import BaseModel
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 import agentexec as ax
 
@@ -36,12 +36,22 @@ class ProcessedDocument(BaseModel):
 
 # --- Setup ---
 
-# Create in-memory SQLite database for demo
-engine = create_engine("sqlite:///multi_tenant_demo.db", echo=False)
-SessionLocal = sessionmaker(bind=engine)
+# Create SQLite database for demo
+engine = create_async_engine("sqlite+aiosqlite:///multi_tenant_demo.db", echo=False)
 
-# Create tables
-ax.Base.metadata.create_all(bind=engine)
+
+@event.listens_for(engine.sync_engine, "connect")
+def _sqlite_pragmas(dbapi_connection, _connection_record):
+    """WAL lets readers run alongside the writer; NORMAL sync skips an fsync per commit."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.close()
+
+
+SessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 # Create worker pool
 pool = ax.Pool(engine=engine)
@@ -57,15 +67,17 @@ async def process_document(
     context: DocumentContext,
 ) -> ProcessedDocument:
     """Simulate document processing."""
-    # Simulate some work
-    ax.activity.update(agent_id, "Extracting text...", percentage=25)
-    await asyncio.sleep(0.1)
+    # Simulate some work; intermediate steps are coalesced into at most
+    # one activity write per flush interval.
+    async with ax.activity.ProgressBuffer(agent_id) as progress:
+        progress.update("Extracting text...", percentage=25)
+        await asyncio.sleep(0.1)
 
-    ax.activity.update(agent_id, "Analyzing content...", percentage=50)
-    await asyncio.sleep(0.1)
+        progress.update("Analyzing content...", percentage=50)
+        await asyncio.sleep(0.1)
 
-    ax.activity.update(agent_id, "Generating summary...", percentage=75)
-    await asyncio.sleep(0.1)
+        progress.update("Generating summary...", percentage=75)
+        await asyncio.sleep(0.1)
 
     return ProcessedDocument(
         file_id=context.file_id,
@@ -78,69 +90,85 @@ async def process_document(
 
 
 async def enqueue_tasks_for_tenants():
-    """Enqueue tasks for different organizations."""
+    """Enqueue tasks for different organizations.
+
+    All tasks go through one ``enqueue_many`` call: the activity records are
+    written in a single transaction and the queue push is one round-trip.
+    """
     print("\n=== Enqueueing Tasks ===\n")
 
-    # Organization A: Enqueue 2 tasks
-    task1 = await ax.enqueue(
+    jobs = [
+        # Organization A: Enqueue 2 tasks
+        (
+            "Org A - Task 1",
+            DocumentContext(file_id="doc-001", filename="report.pdf"),
+            {"organization_id": "org-A", "user_id": "user-1"},
+        ),
+        (
+            "Org A - Task 2",
+            DocumentContext(file_id="doc-002", filename="invoice.pdf"),
+            {"organization_id": "org-A", "user_id": "user-2"},
+        ),
+        # Organization B: Enqueue 1 task
+        (
+            "Org B - Task 1",
+            DocumentContext(file_id="doc-003", filename="contract.pdf"),
+            {"organization_id": "org-B", "user_id": "user-3"},
+        ),
+    ]
+
+    tasks = await ax.enqueue_many(
         "process_document",
-        DocumentContext(file_id="doc-001", filename="report.pdf"),
-        metadata={"organization_id": "org-A", "user_id": "user-1"},
+        [context for _, context, _ in jobs],
+        metadata=[metadata for _, _, metadata in jobs],
     )
-    print(f"Org A - Task 1: {task1.agent_id}")
 
-    task2 = await ax.enqueue(
-        "process_document",
-        DocumentContext(file_id="doc-002", filename="invoice.pdf"),
-        metadata={"organization_id": "org-A", "user_id": "user-2"},
-    )
-    print(f"Org A - Task 2: {task2.agent_id}")
+    for (label, _, _), task in zip(jobs, tasks):
+        print(f"{label}: {task.agent_id}")
 
-    # Organization B: Enqueue 1 task
-    task3 = await ax.enqueue(
-        "process_document",
-        DocumentContext(file_id="doc-003", filename="contract.pdf"),
-        metadata={"organization_id": "org-B", "user_id": "user-3"},
-    )
-    print(f"Org B - Task 1: {task3.agent_id}")
+    return tuple(tasks)
 
-    return task1, task2, task3
 
+async def list_activities_for_tenant(org_id: str) -> list[str]:
+    """List activities filtered by organization.
 
-def list_activities_for_tenant(org_id: str):
-    """List activities filtered by organization."""
-    print(f"\n=== Activities for {org_id} ===\n")
+    Returns the report lines instead of printing them so several tenants can
+    be queried concurrently and still print in a stable order.
+    """
+    lines = [f"\n=== Activities for {org_id} ===\n"]
 
-    with SessionLocal() as session:
-        result = ax.activity.list(
+    async with SessionLocal() as session:
+        result = await ax.activity.list(
             session,
             metadata_filter={"organization_id": org_id},
         )
 
-        print(f"Total activities: {result.total}")
-        for item in result.items:
-            print(f"  - {item.agent_id}: {item.agent_type} ({item.status})")
-            print(f"    Metadata: {item.metadata}")
+    lines.append(f"Total activities: {result.total}")
+    for item in result.items:
+        lines.append(f"  - {item.agent_id}: {item.agent_type} ({item.status})")
+        lines.append(f"    Metadata: {item.metadata}")
+    return lines
 
 
-def get_activity_detail_with_tenant_check(agent_id: UUID, org_id: str):
+async def get_activity_detail_with_tenant_check(agent_id: UUID, org_id: str) -> list[str]:
     """Get activity detail with tenant validation."""
-    print(f"\n=== Detail for {agent_id} (checking {org_id}) ===\n")
+    lines = [f"\n=== Detail for {agent_id} (checking {org_id}) ===\n"]
 
-    with SessionLocal() as session:
+    async with SessionLocal() as session:
         # This returns None if the activity doesn't belong to the org
-        detail = ax.activity.detail(
+        detail = await ax.activity.detail(
             session,
             agent_id,
             metadata_filter={"organization_id": org_id},
         )
 
-        if detail:
-            print(f"Found: {detail.agent_type}")
-            print(f"Metadata: {detail.metadata}")
-            print(f"Logs: {len(detail.logs)} entries")
-        else:
-            print(f"Not found (or doesn't belong to {org_id})")
+    if detail:
+        lines.append(f"Found: {detail.agent_type}")
+        lines.append(f"Metadata: {detail.metadata}")
+        lines.append(f"Logs: {len(detail.logs)} entries")
+    else:
+        lines.append(f"Not found (or doesn't belong to {org_id})")
+    return lines
 
 
 async def main():
@@ -148,33 +176,42 @@ async def main():
     print("Multi-Tenancy Demo with Activity Metadata")
     print("=" * 50)
 
+    # Create tables
+    async with engine.begin() as conn:
+        await conn.run_sync(ax.Base.metadata.create_all)
+
     # 1. Enqueue tasks for different organizations
     task1, task2, task3 = await enqueue_tasks_for_tenants()
 
     # 2. List all activities (no filter)
     print("\n=== All Activities (no filter) ===\n")
-    with SessionLocal() as session:
-        all_activities = ax.activity.list(session)
+    async with SessionLocal() as session:
+        all_activities = await ax.activity.list(session)
         print(f"Total: {all_activities.total}")
         for item in all_activities.items:
             print(f"  - {item.agent_type}: {item.metadata}")
 
-    # 3. List activities filtered by organization
-    list_activities_for_tenant("org-A")  # Should show 2 tasks
-    list_activities_for_tenant("org-B")  # Should show 1 task
-    list_activities_for_tenant("org-C")  # Should show 0 tasks
-
-    # 4. Detail view with tenant validation
-    # Try to access Org A's task as Org A (should work)
-    get_activity_detail_with_tenant_check(task1.agent_id, "org-A")
-
-    # Try to access Org A's task as Org B (should return None)
-    get_activity_detail_with_tenant_check(task1.agent_id, "org-B")
+    # 3-4. The tenant queries are independent, so run them concurrently
+    async with asyncio.TaskGroup() as tg:
+        reports = [
+            # List activities filtered by organization
+            tg.create_task(list_activities_for_tenant("org-A")),  # Should show 2 tasks
+            tg.create_task(list_activities_for_tenant("org-B")),  # Should show 1 task
+            tg.create_task(list_activities_for_tenant("org-C")),  # Should show 0 tasks
+            # Detail view with tenant validation
+            # Try to access Org A's task as Org A (should work)
+            tg.create_task(get_activity_detail_with_tenant_check(task1.agent_id, "org-A")),
+            # Try to access Org A's task as Org B (should return None)
+            tg.create_task(get_activity_detail_with_tenant_check(task1.agent_id, "org-B")),
+        ]
+
+    for report in reports:
+        print("\n".join(report.result()))
 
     # 5. Filter by multiple metadata fields
     print("\n=== Filter by org AND user ===\n")
-    with SessionLocal() as session:
-        result = ax.activity.list(
+    async with SessionLocal() as session:
+        result = await ax.activity.list(
             session,
             metadata_filter={"organization_id": "org-A", "user_id": "user-1"},
         )
@@ -183,6 +220,8 @@ async def main():
     print("\n" + "=" * 50)
     print("Demo complete!")
 
+    await engine.dispose()
+
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,183 @@
+"""Redis-backed cache for LLM calls.
+
+Research for the same company repeats the same prompts against the same
+model. Caching the structured result in Redis (through agentexec's state
+backend) short-circuits repeat calls: no tokens billed, no network round-trip.
+Prompts are normalized before hashing so cosmetic differences ("Research
+Acme", "research acme!") still hit the same entry.
+
+Paraphrases ("Research Acme Corp" vs "research acme corporation") can
+optionally be matched too: with ``semantic=True`` an exact-key miss falls
+back to the most similar earlier prompt by embedding cosine similarity.
+That can serve an answer to a question that wasn't quite asked, so it is
+opt-in per call site.
+"""
+
+import functools
+import hashlib
+import json
+import math
+import re
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+import agentexec as ax
+from agentexec.state import backend
+
+from clients import openai_client
+
+CACHE_TTL = 7200  # seconds
+EMBEDDING_MODEL = "text-embedding-3-small"
+SIMILARITY_THRESHOLD = 0.85
+SEMANTIC_INDEX_SIZE = 1024  # prompts remembered per scope, per worker process
+
+ResultT = TypeVar("ResultT", bound=BaseModel)
+LLMCall = Callable[[UUID, str, str], Awaitable[ResultT]]
+CachedLLMCall = Callable[..., Awaitable[ResultT]]
+
+
+def _normalize_prompt(prompt: str) -> str:
+    """Lowercase, collapse whitespace and strip punctuation."""
+    return re.sub(r"[^\w\s]", "", re.sub(r"\s+", " ", prompt.lower())).strip()
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    instructions: str,
+    prompt: str,
+    tools: Sequence[str] = (),
+) -> str:
+    """Build the Redis key for an LLM call.
+
+    sha256 of provider, model, instructions, the normalized prompt and the
+    sorted tool names, so changing the agent's toolset invalidates the entry.
+    """
+    tools_hash = hashlib.sha256(",".join(sorted(tools)).encode()).hexdigest()
+    norm = _normalize_prompt(prompt)
+    digest = hashlib.sha256(
+        f"{provider}:{model}:{instructions}:{norm}:{tools_hash}".encode()
+    ).hexdigest()
+    return backend.format_key(ax.CONF.key_prefix, "llm_cache", digest)
+
+
+async def embed(text: str) -> list[float]:
+    """Embed normalized text, caching the vector in Redis by ``(model, text)``."""
+    norm = _normalize_prompt(text)
+    digest = hashlib.sha256(f"{EMBEDDING_MODEL}:{norm}".encode()).hexdigest()
+    key = backend.format_key(ax.CONF.key_prefix, "embedding_cache", digest)
+    if (data := await backend.state.get(key)) is not None:
+        return json.loads(data)
+
+    response = await openai_client.embeddings.create(model=EMBEDDING_MODEL, input=norm)
+    vector = response.data[0].embedding
+    await backend.state.set(key, json.dumps(vector).encode(), ttl_seconds=CACHE_TTL)
+    return vector
+
+
+def _cosine(a: list[float], b: list[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+class SemanticIndex:
+    """In-process nearest-neighbour lookup from prompt embeddings to cache keys.
+
+    Entries are scoped by everything but the prompt (provider, model,
+    instructions, tools) so a match never crosses agent configurations. The
+    index is a bounded brute-force scan held per worker process; the cached
+    results themselves live in Redis and expire there.
+    """
+
+    def __init__(self, threshold: float = SIMILARITY_THRESHOLD, size: int = SEMANTIC_INDEX_SIZE):
+        self.threshold = threshold
+        self.size = size
+        self._entries: dict[str, deque[tuple[list[float], str]]] = {}
+
+    def add(self, scope: str, vector: list[float], key: str) -> None:
+        self._entries.setdefault(scope, deque(maxlen=self.size)).append((vector, key))
+
+    def nearest(self, scope: str, vector: list[float]) -> str | None:
+        """Return the cache key of the closest prompt at or above the threshold."""
+        best_key, best_score = None, self.threshold
+        for candidate, key in self._entries.get(scope, ()):
+            if (score := _cosine(vector, candidate)) >= best_score:
+                best_key, best_score = key, score
+        return best_key
+
+    def discard(self, scope: str, key: str) -> None:
+        if entries := self._entries.get(scope):
+            self._entries[scope] = deque(
+                (e for e in entries if e[1] != key), maxlen=self.size
+            )
+
+
+semantic_index = SemanticIndex()
+
+
+def cached_call(
+    *,
+    provider: str,
+    model: str,
+    tools: Sequence[str] = (),
+    ttl: int = CACHE_TTL,
+    semantic: bool = False,
+) -> Callable[[LLMCall[ResultT]], CachedLLMCall[ResultT]]:
+    """Cache the result of an LLM call keyed by ``(provider, model, instructions, prompt, tools)``.
+
+    The wrapped coroutine receives ``(agent_id, instructions, prompt)`` and must
+    return a Pydantic model, which is stored with the state backend's
+    self-describing serializer.
+
+    With ``semantic=True``, an exact miss is retried against earlier prompts
+    whose embeddings are at least ``SIMILARITY_THRESHOLD`` similar. Callers
+    can override it per call with the ``semantic`` keyword.
+
+    Example::
+
+        @cached_call(provider="openai", model="gpt-4o-mini", tools=["search"])
+        async def run_agent(agent_id: UUID, instructions: str, prompt: str) -> Report:
+            ...
+    """
+
+    default_semantic = semantic
+
+    def decorator(func: LLMCall[ResultT]) -> CachedLLMCall[ResultT]:
+        @functools.wraps(func)
+        async def wrapper(
+            agent_id: UUID,
+            instructions: str,
+            prompt: str,
+            *,
+            semantic: bool = default_semantic,
+        ) -> ResultT:
+            key = cache_key(provider, model, instructions, prompt, tools)
+            if (data := await backend.state.get(key)) is not None:
+                await ax.activity.update(agent_id, "Served from cache", percentage=100)
+                return backend.deserialize(data)  # type: ignore[return-value]
+
+            if semantic:
+                scope = cache_key(provider, model, instructions, "", tools)
+                vector = await embed(prompt)
+                if (similar := semantic_index.nearest(scope, vector)) is not None:
+                    if (data := await backend.state.get(similar)) is not None:
+                        await ax.activity.update(
+                            agent_id, "Served from cache (similar request)", percentage=100
+                        )
+                        return backend.deserialize(data)  # type: ignore[return-value]
+                    semantic_index.discard(scope, similar)  # expired in Redis
+
+            result = await func(agent_id, instructions, prompt)
+            await backend.state.set(key, backend.serialize(result), ttl_seconds=ttl)
+            if semantic:
+                semantic_index.add(scope, vector, key)
+            return result
+
+        return wrapper
+
+    return decorator
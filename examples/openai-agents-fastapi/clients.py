@@ -0,0 +1,20 @@
+"""Process-wide OpenAI client shared by every task.
+
+The Agents SDK builds a new ``AsyncOpenAI`` (and with it a new httpx
+connection pool) for each run unless a default client is set. Registering
+one client at import keeps TLS sessions alive across tasks and lets
+concurrent requests multiplex over HTTP/2.
+"""
+
+import httpx
+from agents import set_default_openai_client
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+openai_client = AsyncOpenAI(
+    http_client=DefaultAsyncHttpxClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    ),
+)
+set_default_openai_client(openai_client)
@@ -11,6 +11,10 @@ class ResearchCompanyContext(BaseModel):
 
     company_name: str = Field(..., min_length=1, description="Name of the company to research")
     input_prompt: str | None = Field(None, description="Custom research prompt (optional)")
+    allow_similar_cache: bool = Field(
+        False,
+        description="Reuse a cached report for a similar (not identical) prompt",
+    )
 
     class Config:
         json_schema_extra = {
@@ -1,27 +1,64 @@
 """Database configuration and session management."""
 
 import os
-from collections.abc import Generator
+from asyncio import current_task
+from collections.abc import AsyncGenerator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_scoped_session,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-# Database setup - users manage their own connection
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///agents.db")
+from agentexec.core.db import json_deserializer, json_serializer
+
+# Database setup - users manage their own connection.
+# Use an async driver: postgresql+asyncpg://... in production.
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///agents.db")
 
 # Create engine and session factory
-engine = create_engine(DATABASE_URL, echo=False)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    pool_recycle=3600,
+    # asyncpg decodes json/jsonb with these through its per-connection codecs
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _sqlite_pragmas(dbapi_connection, _connection_record):
+        """WAL lets the API read while workers write; NORMAL sync skips an fsync per commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+
+# One session per asyncio task. FastAPI runs a request's dependencies and
+# handler in the same task, so everything in a request shares one session
+# (and at most one pooled connection) instead of checking out several.
+ScopedSession = async_scoped_session(SessionLocal, scopefunc=current_task)
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Provide a database session for each request."""
-    db = SessionLocal()
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provide the request-scoped database session."""
     try:
-        yield db
-        db.commit()
+        yield ScopedSession()
+        await ScopedSession.commit()
     except Exception:
-        db.rollback()
+        await ScopedSession.rollback()
         raise
     finally:
-        db.close()
+        # Close the session and return its connection before the response is sent.
+        await ScopedSession.remove()
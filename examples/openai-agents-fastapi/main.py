@@ -1,32 +1,60 @@
 """FastAPI application demonstrating agentexec integration."""
 
 from contextlib import asynccontextmanager
+from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse
 import agentexec as ax
 
+from clients import openai_client
 from db import SessionLocal
 from views import router
 
+# Importing the worker module creates the Pool, which configures the engine
+# so `ax.enqueue()` works in request handlers.
+from worker import pool  # noqa: F401
+
+# Built UI (`cd ui && npm run build`); served by the API when present
+FRONTEND_DIR = Path(__file__).parent / "ui" / "dist"
+
+
+def scan_frontend(root: Path) -> frozenset[str]:
+    """Relative paths of every file in the built UI, scanned once at startup."""
+    if not root.is_dir():
+        return frozenset()
+    return frozenset(p.relative_to(root).as_posix() for p in root.rglob("*") if p.is_file())
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: setup and teardown."""
     print("✓ Activity tracking configured")
     print(f"✓ Redis URL: {ax.CONF.redis_url}")
-    print(f"✓ Queue name: {ax.CONF.queue_name}")
+    print(f"✓ Queue prefix: {ax.CONF.queue_prefix}")
     print(f"✓ Number of workers: {ax.CONF.num_workers}")
 
+    app.state.static_files = scan_frontend(FRONTEND_DIR)
+    if app.state.static_files:
+        print(f"✓ Serving UI from {FRONTEND_DIR}")
+
     yield
 
     # Cleanup: cancel any pending agents
-    with SessionLocal() as db:
+    async with SessionLocal() as db:
         try:
-            canceled = ax.activity.cancel_pending(db)
+            canceled = await ax.activity.cancel_pending(db)
             print(f"✓ Canceled {canceled} pending agents")
         except Exception as e:
             print(f"✗ Error canceling pending agents: {e}")
 
+    from agentexec.core.db import dispose_engine
+    from agentexec.state import backend
+
+    await backend.close()
+    await dispose_engine()
+    await openai_client.close()
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -39,6 +67,21 @@ app = FastAPI(
 app.include_router(router)
 
 
+@app.get("/{path:path}", include_in_schema=False)
+async def serve_frontend_routes(request: Request, path: str):
+    """Serve the built UI, falling back to index.html for client-side routes.
+
+    Membership in the startup scan replaces a stat() per request; the build
+    output doesn't change while the server is running.
+    """
+    static_files: frozenset[str] = request.app.state.static_files
+    if path in static_files:
+        return FileResponse(FRONTEND_DIR / path)
+    if path.startswith("api/") or "index.html" not in static_files:
+        raise HTTPException(status_code=404)
+    return FileResponse(FRONTEND_DIR / "index.html")
+
+
 if __name__ == "__main__":
     import uvicorn
 
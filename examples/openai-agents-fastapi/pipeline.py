@@ -1,12 +1,11 @@
 from uuid import UUID
 
 from pydantic import BaseModel, Field
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine
 
 import agentexec as ax
 
-engine = create_engine("sqlite:///agents.db", echo=False)
-ax.Base.metadata.create_all(engine)
+engine = create_async_engine("sqlite+aiosqlite:///agents.db", echo=False)
 
 pool = ax.Pool(engine=engine)
 
@@ -225,9 +224,9 @@ if __name__ == "__main__":
     if len(sys.argv) > 1 and sys.argv[1] == "worker":
         # Run as worker: python pipeline.py worker
         print("Starting workers...")
-        print(f"Queue: {ax.CONF.queue_name}")
+        print(f"Queue: {ax.CONF.queue_prefix}")
         print("Press Ctrl+C to stop")
-        pool.run()
+        asyncio.run(pool.start())
     else:
         # Run pipeline: python pipeline.py
         # NOTE: Workers must be running in another terminal first!
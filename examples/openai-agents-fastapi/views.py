@@ -1,8 +1,9 @@
 import uuid
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 import agentexec as ax
 
 from context import ResearchCompanyContext
@@ -17,6 +18,7 @@ class ResearchCompanyRequest(BaseModel):
 
     company_name: str
     input_prompt: str | None = None
+    allow_similar_cache: bool = False
     priority: ax.Priority = ax.Priority.LOW
 
 
@@ -31,10 +33,7 @@ class TaskResponse(BaseModel):
     "/api/tasks/research_company",
     response_model=TaskResponse,
 )
-async def queue_research_company(
-    request: ResearchCompanyRequest,
-    db: Session = Depends(get_db),
-):
+async def queue_research_company(request: ResearchCompanyRequest):
     """Queue a company research task.
 
     The task will be picked up by a worker and executed asynchronously.
@@ -50,6 +49,7 @@ async def queue_research_company(
     context = ResearchCompanyContext(
         company_name=request.company_name,
         input_prompt=request.input_prompt,
+        allow_similar_cache=request.allow_similar_cache,
     )
 
     task = await ax.enqueue(
@@ -71,27 +71,64 @@ async def queue_research_company(
 async def list_agents(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """List all activities with pagination.
 
     Uses agentexec's public API: activity.list()
     The database session is automatically managed by FastAPI dependency injection.
     """
-    return ax.activity.list(db, page=page, page_size=page_size)
+    return await ax.activity.list(db, page=page, page_size=page_size)
+
+
+@router.get(
+    "/api/agents/feed",
+    response_model=ax.activity.ActivityCursorListSchema,
+)
+async def list_agents_feed(
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    db: AsyncSession = Depends(get_db),
+):
+    """List activities newest first with cursor pagination.
+
+    Uses agentexec's public API: activity.list_after()
+    Unlike the page-numbered listing, deep pages are as cheap as the first
+    since rows are seeked past the cursor instead of skipped with OFFSET.
+    """
+    try:
+        return await ax.activity.list_after(db, cursor=cursor, page_size=page_size)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/api/agents/stream")
+async def stream_agents():
+    """Stream every activity summary, newest first, as newline-delimited JSON.
+
+    Uses agentexec's public API: activity.stream_list()
+    Rows are written as they are fetched, so exports of the whole history
+    never materialize in memory.
+    """
+
+    async def body():
+        async for item in ax.activity.stream_list():
+            yield item.model_dump_json() + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
 
 
 @router.get(
     "/api/agents/activity/{agent_id}",
     response_model=ax.activity.ActivityDetailSchema,
 )
-async def get_agent(agent_id: str, db: Session = Depends(get_db)):
+async def get_agent(agent_id: str, db: AsyncSession = Depends(get_db)):
     """Get detailed information about a specific agent including full log history.
 
     Uses agentexec's public API: activity.detail()
     The database session is automatically managed by FastAPI dependency injection.
     """
-    activity_obj = ax.activity.detail(db, agent_id)
+    activity_obj = await ax.activity.detail(db, agent_id)
 
     if not activity_obj:
         raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
@@ -99,6 +136,29 @@ async def get_agent(agent_id: str, db: Session = Depends(get_db)):
     return activity_obj
 
 
+@router.get("/api/agents/activity/{agent_id}/logs")
+async def stream_agent_logs(agent_id: uuid.UUID):
+    """Stream an agent's log history as newline-delimited JSON.
+
+    Uses agentexec's public API: activity.stream_logs()
+    Logs are written as they are read from the database, so long histories
+    never materialize in memory. The generator opens its own session since
+    dependency-managed sessions are closed before the response body is sent.
+    """
+    logs = ax.activity.stream_logs(agent_id=agent_id)
+    # Every activity has at least its initial log entry
+    first = await anext(logs, None)
+    if first is None:
+        raise HTTPException(status_code=404, detail=f"Agent {agent_id} not found")
+
+    async def body():
+        yield first.model_dump_json() + "\n"
+        async for log in logs:
+            yield log.model_dump_json() + "\n"
+
+    return StreamingResponse(body(), media_type="application/x-ndjson")
+
+
 class ActiveCountResponse(BaseModel):
     """Response for active agent count."""
 
@@ -109,10 +169,10 @@ class ActiveCountResponse(BaseModel):
     "/api/agents/active/count",
     response_model=ActiveCountResponse,
 )
-async def get_active_count(db: Session = Depends(get_db)):
+async def get_active_count(db: AsyncSession = Depends(get_db)):
     """Get count of currently active (queued or running) agents.
 
     Uses agentexec's public API: activity.count_active()
     """
-    count = ax.activity.count_active(db)
+    count = await ax.activity.count_active(db)
     return ActiveCountResponse(count=count)
@@ -5,12 +5,28 @@ from agents import Agent
 
 import agentexec as ax
 
+import clients  # noqa: F401  (registers the shared OpenAI client)
+from cache import cached_call
 from context import ResearchCompanyContext
 from db import engine
 from tools import analyze_financial_data, search_company_info
 
 
-ax.Base.metadata.create_all(engine)
+MODEL = "gpt-4o-mini"
+
+# Byte-identical across tasks so the provider's prompt cache can reuse the
+# prefix; anything task-specific (company, user question) goes in the input.
+RESEARCH_INSTRUCTIONS = """You are a thorough company research analyst.
+Research the company named in the request and provide a comprehensive report covering:
+- Financial performance and metrics
+- Recent news and developments
+- Products and services offered
+- Team and organizational structure
+
+Use the available tools to gather information and synthesize a detailed report."""
+
+# Task-independent tools, built once at import; only report_status is bound per agent.
+RESEARCH_TOOLS = [search_company_info, analyze_financial_data]
 
 
 class ResearchCompanyResult(BaseModel):
@@ -20,9 +36,46 @@ class ResearchCompanyResult(BaseModel):
     team_structure: str
 
 
+# Template agent wired once at import; each task clones it with its own
+# report_status tool rather than rebuilding and re-validating the agent.
+RESEARCH_AGENT = Agent(
+    name="Company Research Agent",
+    tools=RESEARCH_TOOLS,
+    model=MODEL,
+    output_type=ResearchCompanyResult,
+)
+
+
 pool = ax.Pool(engine=engine)
 
 
+@cached_call(provider="openai", model=MODEL, tools=[tool.name for tool in RESEARCH_TOOLS])
+async def run_research_agent(
+    agent_id: UUID,
+    instructions: str,
+    prompt: str,
+) -> ResearchCompanyResult:
+    """Run the research agent; identical prompts are served from Redis."""
+    runner = ax.OpenAIRunner(
+        agent_id,
+        max_turns_recovery=True,
+        wrap_up_prompt="Please summarize your findings and provide a final report.",
+    )
+
+    research_agent = RESEARCH_AGENT.clone(
+        instructions=f"{instructions}\n\n{runner.prompts.report_status}",
+        tools=[*RESEARCH_TOOLS, runner.tools.report_status],
+    )
+
+    result = await runner.run(
+        agent=research_agent,
+        input=prompt,
+        max_turns=15,
+    )
+    # `result` is a native OpenAI Agents `RunResult` object
+    return result.final_output_as(ResearchCompanyResult)
+
+
 @pool.task("research_company")
 async def research_company(
     agent_id: UUID,
@@ -35,52 +88,21 @@ async def research_company(
     - Automatic activity tracking via OpenAIRunner
     - Agent self-reporting progress via update_status tool
     - Type-safe context object (automatically deserialized from queue)
+    - Redis-backed caching of repeated LLM calls
+    - Static instructions so the provider can cache the prompt prefix
     """
     # Type-safe context access with IDE autocomplete!
     company_name = context.company_name
     input_prompt = context.input_prompt or f"Research the company {company_name}."
+    prompt = f"Company: {company_name}\n\n{input_prompt}"
 
-    runner = ax.OpenAIRunner(
+    return await run_research_agent(
         agent_id,
-        max_turns_recovery=True,
-        wrap_up_prompt="Please summarize your findings and provide a final report.",
-    )
-
-    research_agent = Agent(
-        name="Company Research Agent",
-        instructions=f"""You are a thorough company research analyst.
-        Research {company_name} and provide a comprehensive report covering:
-        - Financial performance and metrics
-        - Recent news and developments
-        - Products and services offered
-        - Team and organizational structure
-
-        Use the available tools to gather information and synthesize a detailed report.
-
-        {runner.prompts.report_status}""",
-        tools=[
-            search_company_info,
-            analyze_financial_data,
-            runner.tools.report_status,
-        ],
-        model="gpt-4o-mini",
-        output_type=ResearchCompanyResult,
+        RESEARCH_INSTRUCTIONS,
+        prompt,
+        semantic=context.allow_similar_cache,
     )
 
-    result = await runner.run(
-        agent=research_agent,
-        input=input_prompt,
-        max_turns=15,
-    )
-    # `result` is a native OpenAI Agents `RunResult` object
-    return result.final_output_as(ResearchCompanyResult)
-
-
-if __name__ == "__main__":
-    print("Starting agent-runner worker pool...")
-    print(f"Workers: {ax.CONF.num_workers}")
-    print(f"Queue: {ax.CONF.queue_name}")
-    print("Press Ctrl+C to shutdown gracefully")
 
-    # run() blocks and handles log streaming from workers
-    pool.run()
+# Start the pool with the CLI:
+#   agentexec run worker:pool
@@ -26,17 +26,22 @@ Example:
 """
 
 from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any
 
 from agentexec.config import CONF
 from agentexec.core.db import Base
-from agentexec.core.queue import Priority, enqueue
+from agentexec.core.queue import Priority, enqueue, enqueue_many
 from agentexec.core.results import TaskFailedError, gather, get_result
 from agentexec.core.task import Task
 from agentexec import activity
-from agentexec.worker import Pool
-from agentexec.pipeline import Pipeline
 from agentexec.runners import BaseAgentRunner
-from agentexec.tracker import Tracker
+
+if TYPE_CHECKING:
+    from agentexec.pipeline import Pipeline
+    from agentexec.runners.openai import OpenAIRunner
+    from agentexec.tracker import Tracker
+    from agentexec.worker import Pool
 
 try:
     __version__ = version("agentexec")
@@ -55,13 +60,33 @@ __all__ = [
     "Priority",
     "activity",
     "enqueue",
+    "enqueue_many",
     "gather",
     "get_result",
 ]
 
-try:
-    from agentexec.runners.openai import OpenAIRunner  # type: ignore[possibly-missing-import]
+# Not needed to enqueue work, so imported on first access (PEP 562). Keeps
+# `import agentexec` in web handlers free of the worker and `agents` SDK.
+_LAZY_IMPORTS = {
+    "OpenAIRunner": "agentexec.runners.openai",
+    "Pipeline": "agentexec.pipeline",
+    "Pool": "agentexec.worker",
+    "Tracker": "agentexec.tracker",
+}
 
+if find_spec("agents") is not None:
     __all__.append("OpenAIRunner")
-except ImportError:
-    pass
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    try:
+        value = getattr(import_module(_LAZY_IMPORTS[name]), name)
+    except ImportError as e:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r} ({e})") from e
+    globals()[name] = value
+    return value
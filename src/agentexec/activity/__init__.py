@@ -1,13 +1,20 @@
 import uuid
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agentexec.activity.handlers import ActivityHandler, PostgresHandler
 from agentexec.activity.models import Activity, ActivityLog
 from agentexec.activity.producer import (
+    ProgressBuffer,
     create,
+    create_many,
     update,
+    update_many,
     complete,
     error,
     cancel_pending,
@@ -15,6 +22,7 @@ from agentexec.activity.producer import (
     normalize_agent_id,
 )
 from agentexec.activity.schemas import (
+    ActivityCursorListSchema,
     ActivityDetailSchema,
     ActivityListItemSchema,
     ActivityListSchema,
@@ -33,23 +41,39 @@ __all__ = [
     "ActivityDetailSchema",
     "ActivityListItemSchema",
     "ActivityListSchema",
+    "ActivityCursorListSchema",
     # Lifecycle API
     "create",
+    "create_many",
     "update",
+    "update_many",
     "complete",
     "error",
     "cancel_pending",
     "generate_agent_id",
     "normalize_agent_id",
+    "ProgressBuffer",
     # Query API
     "list",
+    "list_after",
     "detail",
+    "stream_list",
+    "stream_logs",
     "count_active",
 ]
 
 handler: ActivityHandler = PostgresHandler()
 
 
+_LIST_ITEMS = TypeAdapter(list[ActivityListItemSchema])
+
+
+def _list_items(rows: Sequence[RowMapping]) -> list[ActivityListItemSchema]:
+    # Plain dicts validate much faster than RowMapping, and one adapter call
+    # covers the whole page.
+    return _LIST_ITEMS.validate_python([dict(row) for row in rows])
+
+
 async def list(
     session: AsyncSession | None = None,
     page: int = 1,
@@ -64,30 +88,99 @@ async def list(
         page_size: Number of items per page.
         metadata_filter: Optional dict to filter by metadata fields.
     """
-    from sqlalchemy import func, select
-
     async with session or get_session() as db:
-        count_query = select(func.count(Activity.id))
-        if metadata_filter:
-            for key, value in metadata_filter.items():
-                count_query = count_query.where(Activity.metadata_[key].as_string() == str(value))
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
         rows = await Activity.get_list(
             db,
             page=page,
             page_size=page_size,
             metadata_filter=metadata_filter,
+            count_total=True,
         )
+        if rows:
+            total = rows[0]["total"]
+        elif page > 1:
+            # Past the last page the window has no row to ride on.
+            total = await Activity.get_count(db, metadata_filter=metadata_filter)
+        else:
+            total = 0
         return ActivityListSchema(
-            items=[ActivityListItemSchema.model_validate(row) for row in rows],
+            items=_list_items(rows),
             total=total,
             page=page,
             page_size=page_size,
         )
 
 
+def _encode_cursor(created_at: datetime, agent_id: uuid.UUID) -> str:
+    return f"{created_at.isoformat()}|{agent_id}"
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    created_at, _, agent_id = cursor.partition("|")
+    try:
+        return datetime.fromisoformat(created_at), uuid.UUID(agent_id)
+    except ValueError:
+        raise ValueError(f"Invalid activity cursor: {cursor!r}") from None
+
+
+async def list_after(
+    session: AsyncSession | None = None,
+    cursor: str | None = None,
+    page_size: int = 50,
+    metadata_filter: dict[str, Any] | None = None,
+) -> ActivityCursorListSchema:
+    """List activities newest first with cursor (keyset) pagination.
+
+    Deep pages cost the same as the first one, and no total count is
+    computed. Use ``list()`` when page numbers are needed.
+
+    Args:
+        session: Optional async SQLAlchemy session. Falls back to ``get_session()``.
+        cursor: ``next_cursor`` from the previous page, or None to start.
+        page_size: Number of items per page.
+        metadata_filter: Optional dict to filter by metadata fields.
+
+    Raises:
+        ValueError: If ``cursor`` is malformed.
+    """
+    position = _decode_cursor(cursor) if cursor is not None else None
+
+    async with session or get_session() as db:
+        rows = await Activity.get_list_after(
+            db,
+            cursor=position,
+            page_size=page_size,
+            metadata_filter=metadata_filter,
+        )
+
+    next_cursor = None
+    if len(rows) == page_size:
+        next_cursor = _encode_cursor(rows[-1]["created_at"], rows[-1]["agent_id"])
+    return ActivityCursorListSchema(
+        items=_list_items(rows),
+        page_size=page_size,
+        next_cursor=next_cursor,
+    )
+
+
+async def stream_list(
+    session: AsyncSession | None = None,
+    metadata_filter: dict[str, Any] | None = None,
+) -> AsyncIterator[ActivityListItemSchema]:
+    """Yield every activity summary newest first, without loading them all.
+
+    For exports and NDJSON endpoints; use ``list()`` or ``list_after()`` for
+    paged views.
+
+    Args:
+        session: Optional async SQLAlchemy session. Falls back to ``get_session()``.
+        metadata_filter: Optional dict to filter by metadata fields.
+    """
+    async with session or get_session() as db:
+        async for row in Activity.stream_list(db, metadata_filter=metadata_filter):
+            yield ActivityListItemSchema.model_validate(row)
+
+
 async def detail(
     session: AsyncSession | None = None,
     agent_id: str | uuid.UUID | None = None,
@@ -102,14 +195,32 @@ async def detail(
     """
     if agent_id is None:
         return None
-    if isinstance(agent_id, str):
-        agent_id = uuid.UUID(agent_id)
+    agent_id = normalize_agent_id(agent_id)
 
     async with session or get_session() as db:
-        item = await Activity.get_by_agent_id(db, agent_id, metadata_filter=metadata_filter)
-        if item is not None:
-            return ActivityDetailSchema.model_validate(item)
-        return None
+        item = await Activity.get_detail(db, agent_id, metadata_filter=metadata_filter)
+        if item is None:
+            return None
+        return ActivityDetailSchema.model_validate(item)
+
+
+async def stream_logs(
+    session: AsyncSession | None = None,
+    agent_id: str | uuid.UUID | None = None,
+) -> AsyncIterator[ActivityLogSchema]:
+    """Yield an activity's log entries oldest first, without loading them all.
+
+    Args:
+        session: Optional async SQLAlchemy session. Falls back to ``get_session()``.
+        agent_id: The agent_id whose logs to stream.
+    """
+    if agent_id is None:
+        return
+    agent_id = normalize_agent_id(agent_id)
+
+    async with session or get_session() as db:
+        async for log in Activity.stream_logs(db, agent_id):
+            yield ActivityLogSchema.model_validate(log)
 
 
 async def count_active(session: AsyncSession | None = None) -> int:
@@ -26,12 +26,16 @@ during startup; everything else uses the default Postgres handler::
     # → writes directly to Postgres
 
 Custom handlers can be implemented by conforming to the ``ActivityHandler``
-protocol — any callable that accepts ``ActivityEvent``.
+protocol — any callable that accepts ``ActivityEvent``. A handler may also
+provide ``create_many(events)`` and ``update_many(events)`` to persist a
+batch of ``ActivityCreated`` / ``ActivityUpdated`` events at once; callers
+fall back to one call per event when they are missing.
 """
 
 from __future__ import annotations
 
 import multiprocessing as mp
+from collections.abc import Sequence
 from typing import Protocol
 
 from agentexec.activity.events import ActivityCreated, ActivityEvent, ActivityUpdated
@@ -76,6 +80,31 @@ class PostgresHandler:
                         percentage=event.percentage,
                     )
 
+    async def update_many(self, events: Sequence[ActivityUpdated]) -> None:
+        """Write several ``ActivityUpdated`` events in a single transaction."""
+        if not events:
+            return
+        async with get_session() as db:
+            await Activity.append_logs(
+                session=db,
+                entries=[
+                    (event.agent_id, event.message, event.status, event.percentage)
+                    for event in events
+                ],
+            )
+
+    async def create_many(self, events: Sequence[ActivityCreated]) -> None:
+        """Write several ``ActivityCreated`` events of one task in a single transaction."""
+        if not events:
+            return
+        async with get_session() as db:
+            await Activity.create_many(
+                session=db,
+                task_name=events[0].task_name,
+                message=events[0].message,
+                entries=[(event.agent_id, event.metadata) for event in events],
+            )
+
 
 class IPCHandler:
     """Sends activity events to the pool via multiprocessing queue.
@@ -1,47 +1,163 @@
 from __future__ import annotations
 
+import functools
 import logging
+import time
 import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterable
 from datetime import UTC, datetime
 
 from typing import Any
 
 from sqlalchemy import (
+    Boolean,
     DateTime,
-    Enum,
     ForeignKey,
+    Index,
     Integer,
     JSON,
+    Select,
+    SmallInteger,
     String,
     Text,
+    TypeDecorator,
     Uuid,
+    and_,
+    bindparam,
     case,
+    cast,
     func,
     insert,
+    literal_column,
     select,
+    text,
+    update,
 )
-from sqlalchemy.engine import RowMapping
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, aggregate_order_by
+from sqlalchemy.engine import Engine, RowMapping
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Mapped, aliased, mapped_column, relationship, declared_attr, selectinload
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr, selectinload
+from sqlalchemy.orm.exc import StaleDataError
+from sqlalchemy.sql.elements import BindParameter, ColumnElement
+from sqlalchemy.sql.visitors import InternalTraversal
 
+from agentexec.activity.producer import normalize_agent_id
 from agentexec.activity.status import Status
 from agentexec.config import CONF
 from agentexec.core.db import Base
 
 logger = logging.getLogger(__name__)
 
+_ACTIVE_STATUSES = (Status.RUNNING, Status.QUEUED)
+
+
+# Stored status codes. Append only: existing rows depend on these values.
+_STATUS_CODES: dict[Status, int] = {
+    Status.QUEUED: 1,
+    Status.RUNNING: 2,
+    Status.COMPLETE: 3,
+    Status.ERROR: 4,
+    Status.CANCELED: 5,
+}
+_STATUS_BY_CODE: dict[int, Status] = {code: status for status, code in _STATUS_CODES.items()}
+
+
+def _active_predicate_sql() -> Any:
+    codes = ", ".join(str(_STATUS_CODES[status]) for status in sorted(_ACTIVE_STATUSES))
+    return text(f"latest_status IN ({codes})")
+
+
+class StatusType(TypeDecorator[Status]):
+    """Stores ``Status`` as a SMALLINT code instead of an ENUM/VARCHAR."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Status | None, dialect: Any) -> int | None:
+        # Status is a str enum, so plain "queued" strings hit the same keys
+        return None if value is None else _STATUS_CODES[value]
+
+    def process_result_value(self, value: int | None, dialect: Any) -> Status | None:
+        return None if value is None else _STATUS_BY_CODE[value]
+
+
+# agent_id -> activity id. Both are immutable once written, so a cached
+# mapping lets ``append_logs`` skip the lookup query for known agents.
+_ACTIVITY_ID_CACHE_SIZE = 8192
+_activity_id_cache: OrderedDict[uuid.UUID, uuid.UUID] = OrderedDict()
+
+
+# Short-lived results of the polled status queries, keyed by engine and
+# query name: (expires_at, value). Cleared by this process's own status
+# writes; other processes' writes show up once the TTL lapses.
+_status_query_cache: weakref.WeakKeyDictionary[Engine, dict[str, tuple[float, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_status_query(session: AsyncSession, name: str) -> Any | None:
+    entry = _status_query_cache.get(session.get_bind().engine, {}).get(name)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _cache_status_query(session: AsyncSession, name: str, value: Any) -> None:
+    if CONF.activity_count_ttl > 0:
+        entries = _status_query_cache.setdefault(session.get_bind().engine, {})
+        entries[name] = (time.monotonic() + CONF.activity_count_ttl, value)
+
+
+def _remember_activity_ids(pairs: Iterable[tuple[uuid.UUID, uuid.UUID]]) -> None:
+    for agent_id, activity_id in pairs:
+        _activity_id_cache[agent_id] = activity_id
+        _activity_id_cache.move_to_end(agent_id)
+    while len(_activity_id_cache) > _ACTIVITY_ID_CACHE_SIZE:
+        _activity_id_cache.popitem(last=False)
+
 
 class Activity(Base):
     """Tracks background agent execution sessions.
 
-    Each record represents a single agent run. The current status is inferred
-    from the latest log message.
+    Each record represents a single agent run. The full history lives in
+    ``ActivityLog``; the latest entry is also copied onto the ``latest_*``
+    columns in the same transaction, so list and count queries read one row
+    per activity without touching the log table.
     """
 
     @declared_attr.directive
     def __tablename__(cls) -> str:
         return f"{CONF.table_prefix}activity"
 
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Index, ...]:
+        return (
+            Index(
+                f"ix_{CONF.table_prefix}activity_status_started",
+                "latest_status",
+                "started_at",
+            ),
+            # Only queued/running rows: pending-id and active-count queries
+            # become index-only scans sized by active work, not history.
+            Index(
+                f"ix_{CONF.table_prefix}activity_active",
+                "agent_id",
+                postgresql_where=_active_predicate_sql(),
+                sqlite_where=_active_predicate_sql(),
+            ),
+            # Serves metadata_filter containment lookups; PostgreSQL only.
+            Index(
+                f"ix_{CONF.table_prefix}activity_metadata",
+                "metadata",
+                postgresql_using="gin",
+                postgresql_ops={"metadata": "jsonb_path_ops"},
+            ).ddl_if(dialect="postgresql"),
+        )
+
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     agent_id: Mapped[uuid.UUID] = mapped_column(Uuid, nullable=False, unique=True, index=True)
     agent_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
@@ -50,19 +166,30 @@ class Activity(Base):
         nullable=False,
         default=lambda: datetime.now(UTC),
     )
+    # Log writes set created_at/latest_log_at explicitly so ordering keys
+    # keep full precision; updated_at is informational, so the database
+    # stamps it on every UPDATE.
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
         default=lambda: datetime.now(UTC),
-        onupdate=lambda: datetime.now(UTC),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
     metadata_: Mapped[dict[str, Any] | None] = mapped_column(
         "metadata",
-        JSON,
+        JSON().with_variant(JSONB(), "postgresql"),
         nullable=True,
         default=None,
     )
 
+    # Denormalized from the latest ActivityLog entry
+    latest_status: Mapped[Status | None] = mapped_column(StatusType, nullable=True)
+    latest_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    latest_percentage: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    latest_log_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
     logs: Mapped[list[ActivityLog]] = relationship(
         "ActivityLog",
         back_populates="activity",
@@ -91,24 +218,99 @@ class Activity(Base):
         Returns:
             The created Activity record.
         """
+        now = datetime.now(UTC)
+        # Assigning the id up front lets the log row reference it without a
+        # separate flush; the commit writes both rows in one unit of work.
         record = cls(
+            id=uuid.uuid4(),
             agent_id=agent_id,
             agent_type=task_name,
             metadata_=metadata,
+            created_at=now,
+            updated_at=now,
+            latest_status=Status.QUEUED,
+            latest_message=message,
+            latest_percentage=0,
+            latest_log_at=now,
+            started_at=now,
         )
         session.add(record)
-        await session.flush()
         session.add(
             ActivityLog(
                 activity_id=record.id,
                 message=message,
                 status=Status.QUEUED,
                 percentage=0,
+                created_at=now,
             )
         )
         await session.commit()
+        _status_query_cache.clear()
+        _remember_activity_ids([(agent_id, record.id)])
         return record
 
+    @classmethod
+    async def create_many(
+        cls,
+        session: AsyncSession,
+        task_name: str,
+        message: str,
+        entries: list[tuple[uuid.UUID, dict[str, Any] | None]],
+    ) -> None:
+        """Create several activity records, each with a queued log entry.
+
+        Writes all activities and all log entries with one multi-row INSERT
+        each and a single commit.
+
+        Args:
+            session: Async SQLAlchemy session.
+            task_name: The registered task name shared by every record.
+            message: Initial log message.
+            entries: ``(agent_id, metadata)`` pairs, one per activity.
+        """
+        if not entries:
+            return
+
+        now = datetime.now(UTC)
+        activity_ids = [uuid.uuid4() for _ in entries]
+        await session.execute(
+            insert(cls),
+            [
+                {
+                    "id": activity_id,
+                    "agent_id": agent_id,
+                    "agent_type": task_name,
+                    "metadata_": metadata,
+                    "created_at": now,
+                    "updated_at": now,
+                    "latest_status": Status.QUEUED,
+                    "latest_message": message,
+                    "latest_percentage": 0,
+                    "latest_log_at": now,
+                    "started_at": now,
+                }
+                for activity_id, (agent_id, metadata) in zip(activity_ids, entries)
+            ],
+        )
+        await session.execute(
+            insert(ActivityLog),
+            [
+                {
+                    "activity_id": activity_id,
+                    "message": message,
+                    "status": Status.QUEUED,
+                    "percentage": 0,
+                    "created_at": now,
+                }
+                for activity_id in activity_ids
+            ],
+        )
+        await session.commit()
+        _status_query_cache.clear()
+        _remember_activity_ids(
+            (agent_id, activity_id) for activity_id, (agent_id, _) in zip(activity_ids, entries)
+        )
+
     @classmethod
     async def append_log(
         cls,
@@ -131,25 +333,98 @@ class Activity(Base):
             status: Current status of the agent.
             percentage: Optional completion percentage (0-100).
         """
-        result = await session.execute(select(cls.id).where(cls.agent_id == agent_id))
-        activity_id = result.scalar_one_or_none()
+        await cls.append_logs(session, [(agent_id, message, status, percentage)])
 
-        if activity_id is None:
-            logger.warning(
-                f"No activity record for agent_id {agent_id}, skipping log append. "
-                f"This can happen when a stale task from a previous session is picked up."
-            )
+    @classmethod
+    async def append_logs(
+        cls,
+        session: AsyncSession,
+        entries: list[tuple[uuid.UUID, str, Status, int | None]],
+    ) -> None:
+        """Append several log entries in one transaction.
+
+        Resolves agent_ids from the in-process id cache, falling back to a
+        single ``IN`` query for any not seen yet, inserts all rows
+        with one multi-row INSERT, refreshes each activity's ``latest_*``
+        columns from its last entry and commits once. Entries for agents
+        without an activity record are skipped with a warning. Rows are
+        inserted in the given order.
+
+        If the write fails because a cached activity has since been deleted,
+        the transaction is rolled back, the cached ids are dropped and the
+        entries are appended again against freshly resolved ids.
+
+        Args:
+            session: Async SQLAlchemy session.
+            entries: ``(agent_id, message, status, percentage)`` tuples.
+        """
+        if not entries:
             return
 
-        await session.execute(
-            insert(ActivityLog).values(
-                activity_id=activity_id,
-                message=message,
-                status=status,
-                percentage=percentage,
+        activity_ids: dict[uuid.UUID, uuid.UUID] = {}
+        missing: set[uuid.UUID] = set()
+        for agent_id, *_ in entries:
+            if (activity_id := _activity_id_cache.get(agent_id)) is not None:
+                activity_ids[agent_id] = activity_id
+            else:
+                missing.add(agent_id)
+        cached = set(activity_ids)
+
+        if missing:
+            result = await session.execute(_activity_ids_stmt(), {"agent_ids": list(missing)})
+            found = result.all()
+            activity_ids.update(found)
+            _remember_activity_ids(found)
+
+        rows = []
+        latest: dict[uuid.UUID, dict[str, Any]] = {}
+        for agent_id, message, status, percentage in entries:
+            if (activity_id := activity_ids.get(agent_id)) is None:
+                logger.warning(
+                    f"No activity record for agent_id {agent_id}, skipping log append. "
+                    f"This can happen when a stale task from a previous session is picked up."
+                )
+                continue
+            now = datetime.now(UTC)
+            rows.append(
+                {
+                    "activity_id": activity_id,
+                    "message": message,
+                    "status": status,
+                    "percentage": percentage,
+                    "created_at": now,
+                }
             )
-        )
-        await session.commit()
+            latest[activity_id] = {
+                "id": activity_id,
+                "latest_status": status,
+                "latest_message": message,
+                "latest_percentage": percentage,
+                "latest_log_at": now,
+            }
+
+        if not rows:
+            return
+
+        try:
+            if session.get_bind().dialect.name == "postgresql":
+                # One round-trip: the log INSERT rides along as a CTE
+                await session.execute(_append_logs_pg_stmt(), _append_logs_pg_params(rows, latest))
+            else:
+                await session.execute(_insert_log_stmt(), rows)
+                await session.execute(_update_latest_stmt(), list(latest.values()))
+            await session.commit()
+        except (IntegrityError, StaleDataError):
+            await session.rollback()
+            if not cached:
+                raise
+            # A cached activity was deleted after it was resolved: forget the
+            # cached ids so the retry looks them up and skips missing ones.
+            for agent_id in cached:
+                _activity_id_cache.pop(agent_id, None)
+            await cls.append_logs(session, entries)
+            return
+        _status_query_cache.clear()
 
     @classmethod
     async def get_by_agent_id(
@@ -168,17 +443,85 @@ class Activity(Base):
         Returns:
             Activity object or None if not found or metadata doesn't match.
         """
-        if isinstance(agent_id, str):
-            agent_id = uuid.UUID(agent_id)
+        agent_id = normalize_agent_id(agent_id)
 
-        query = select(cls).options(selectinload(cls.logs)).where(cls.agent_id == agent_id)
+        activity_id = _activity_id_cache.get(agent_id)
+        if activity_id is not None and not metadata_filter:
+            # A primary-key get is answered from the session's identity map
+            # when the activity is already loaded.
+            record = await session.get(cls, activity_id, options=[selectinload(cls.logs)])
+            if record is not None:
+                return record
+            _activity_id_cache.pop(agent_id, None)
 
-        if metadata_filter:
-            for key, value in metadata_filter.items():
-                query = query.where(cls.metadata_[key].as_string() == str(value))
+        keys, params = _metadata_params(metadata_filter)
+        result = await session.execute(_by_agent_id_stmt(keys), {"agent_id": agent_id, **params})
+        record = result.scalar_one_or_none()
+        if record is not None:
+            _remember_activity_ids([(agent_id, record.id)])
+        return record
+
+    @classmethod
+    async def get_detail(
+        cls,
+        session: AsyncSession,
+        agent_id: str | uuid.UUID,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Get an activity and its logs as plain data, in one query.
+
+        The read-only counterpart to ``get_by_agent_id``: logs are aggregated
+        into a JSON array by the database instead of loaded as ORM objects
+        with a second ``selectinload`` query.
+
+        Args:
+            session: Async SQLAlchemy session.
+            agent_id: The agent_id to look up (string or UUID).
+            metadata_filter: Optional dict of key-value pairs to filter by.
+
+        Returns:
+            Dict with the activity's columns and a ``logs`` list of dicts
+            (oldest first), or None if not found or metadata doesn't match.
+        """
+        agent_id = normalize_agent_id(agent_id)
+
+        keys, params = _metadata_params(metadata_filter)
+        result = await session.execute(_detail_stmt(keys), {"agent_id": agent_id, **params})
+        row = result.mappings().one_or_none()
+        if row is None:
+            return None
 
-        result = await session.execute(query)
-        return result.scalar_one_or_none()
+        detail = dict(row)
+        logs = detail["logs"] or []
+        for log in logs:
+            # JSON hands back the stored code, bypassing StatusType
+            log["status"] = _STATUS_BY_CODE[log["status"]]
+        # Only PostgreSQL orders the aggregate (see _LogsJson); timestamps
+        # serialize in a fixed format per dialect, so they sort as strings.
+        logs.sort(key=lambda log: log["created_at"])
+        detail["logs"] = logs
+        return detail
+
+    @classmethod
+    def _summary_query(cls, metadata_keys: tuple[tuple[str, bool], ...] = ()) -> Select:
+        """Build the activity summary select shared by the list queries.
+
+        Reads only the denormalized ``latest_*`` columns: no joins against
+        the log table. Each metadata key is compared against a
+        ``filter_<n>`` bind parameter (see ``_metadata_params``).
+        """
+        query = select(
+            cls.agent_id,
+            cls.agent_type,
+            cls.latest_message.label("latest_log_message"),
+            cls.latest_status.label("status"),
+            cls.latest_log_at.label("latest_log_timestamp"),
+            cls.latest_percentage.label("percentage"),
+            cls.started_at,
+            cls.metadata_.label("metadata"),
+            cls.created_at,
+        )
+        return _where_metadata(query, metadata_keys)
 
     @classmethod
     async def get_list(
@@ -187,6 +530,7 @@ class Activity(Base):
         page: int = 1,
         page_size: int = 50,
         metadata_filter: dict[str, Any] | None = None,
+        count_total: bool = False,
     ) -> list[RowMapping]:
         """Get a paginated list of activities with summary information.
 
@@ -195,138 +539,234 @@ class Activity(Base):
             page: Page number (1-indexed).
             page_size: Number of items per page.
             metadata_filter: Optional dict of key-value pairs to filter by.
+            count_total: Add a ``total`` column holding the number of matching
+                activities, computed as a window over the same filtered scan
+                instead of a separate COUNT query.
 
         Returns:
             List of RowMapping objects with activity summary fields.
         """
-        latest_log_subq = select(
-            ActivityLog.activity_id,
-            ActivityLog.message,
-            ActivityLog.status,
-            ActivityLog.created_at,
-            ActivityLog.percentage,
-            func.row_number()
-            .over(
-                partition_by=ActivityLog.activity_id,
-                order_by=ActivityLog.created_at.desc(),
-            )
-            .label("rn"),
-        ).subquery()
-
-        started_at_subq = (
-            select(
-                ActivityLog.activity_id,
-                func.min(ActivityLog.created_at).label("started_at"),
-            )
-            .group_by(ActivityLog.activity_id)
-            .subquery()
+        keys, params = _metadata_params(metadata_filter)
+        result = await session.execute(
+            _list_stmt(keys, count_total),
+            {"offset": (page - 1) * page_size, "limit": page_size, **params},
         )
+        return list(result.mappings().all())
 
-        latest_log = aliased(latest_log_subq)
-        started_at = aliased(started_at_subq)
+    @classmethod
+    async def get_list_after(
+        cls,
+        session: AsyncSession,
+        cursor: tuple[datetime, uuid.UUID] | None = None,
+        page_size: int = 50,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> list[RowMapping]:
+        """Get a keyset-paginated list of activities, newest first.
 
-        query = (
-            select(
-                cls.agent_id,
-                cls.agent_type,
-                latest_log.c.message.label("latest_log_message"),
-                latest_log.c.status,
-                latest_log.c.created_at.label("latest_log_timestamp"),
-                latest_log.c.percentage,
-                started_at.c.started_at,
-                cls.metadata_.label("metadata"),
-            )
-            .outerjoin(
-                latest_log,
-                (cls.id == latest_log.c.activity_id) & (latest_log.c.rn == 1),
-            )
-            .outerjoin(started_at, cls.id == started_at.c.activity_id)
-        )
+        Unlike ``get_list``, the cost of a page doesn't grow with its depth:
+        rows are seeked past ``(created_at, agent_id)`` rather than skipped
+        with ``OFFSET``.
 
-        if metadata_filter:
-            for key, value in metadata_filter.items():
-                query = query.where(cls.metadata_[key].as_string() == str(value))
+        Args:
+            session: Async SQLAlchemy session.
+            cursor: ``(created_at, agent_id)`` of the last row of the previous
+                page, or None for the first page.
+            page_size: Number of items per page.
+            metadata_filter: Optional dict of key-value pairs to filter by.
 
-        is_active = case(
-            (latest_log.c.status.in_([Status.RUNNING, Status.QUEUED]), 0),
-            else_=1,
-        )
-        active_priority = case(
-            (latest_log.c.status == Status.RUNNING, 1),
-            (latest_log.c.status == Status.QUEUED, 2),
-            else_=3,
-        )
-        query = query.order_by(is_active, active_priority, started_at.c.started_at.desc().nullslast())
+        Returns:
+            List of RowMapping objects with activity summary fields.
+        """
+        keys, params = _metadata_params(metadata_filter)
+        params["limit"] = page_size
+        if cursor is not None:
+            params["cursor_created_at"], params["cursor_agent_id"] = cursor
 
-        offset = (page - 1) * page_size
-        result = await session.execute(query.offset(offset).limit(page_size))
+        result = await session.execute(_list_after_stmt(keys, cursor is not None), params)
         return list(result.mappings().all())
 
+    @classmethod
+    async def stream_list(
+        cls,
+        session: AsyncSession,
+        metadata_filter: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[RowMapping]:
+        """Yield every matching activity summary newest first, without loading them all.
+
+        Rows are fetched from a server-side cursor ``batch_size`` at a time.
+
+        Args:
+            session: Async SQLAlchemy session.
+            metadata_filter: Optional dict of key-value pairs to filter by.
+            batch_size: Rows fetched per round-trip.
+
+        Yields:
+            RowMapping objects with activity summary fields.
+        """
+        keys, params = _metadata_params(metadata_filter)
+        result = await session.stream(
+            _stream_list_stmt(keys),
+            params,
+            execution_options={"yield_per": batch_size},
+        )
+        async for row in result.mappings():
+            yield row
+
+    @classmethod
+    async def stream_logs(
+        cls,
+        session: AsyncSession,
+        agent_id: uuid.UUID,
+    ) -> AsyncIterator[ActivityLog]:
+        """Yield the log entries for an agent in order, without loading them all.
+
+        Args:
+            session: Async SQLAlchemy session.
+            agent_id: The agent_id whose logs to stream.
+
+        Yields:
+            ActivityLog rows, oldest first.
+        """
+        query = (
+            select(ActivityLog)
+            .join(cls, cls.id == ActivityLog.activity_id)
+            .where(cls.agent_id == agent_id)
+            .order_by(ActivityLog.created_at)
+        )
+        result = await session.stream_scalars(query)
+        async for log in result:
+            yield log
+
     @classmethod
     async def get_pending_ids(cls, session: AsyncSession) -> list[uuid.UUID]:
         """Get agent_ids for all activities with QUEUED or RUNNING status.
 
+        Results are reused for ``CONF.activity_count_ttl`` seconds unless this
+        process writes a status change first.
+
         Args:
             session: Async SQLAlchemy session.
 
         Returns:
             List of agent_id UUIDs for pending (queued or running) activities.
         """
-        latest_log_subq = select(
-            ActivityLog.activity_id,
-            ActivityLog.status,
-            func.row_number()
-            .over(
-                partition_by=ActivityLog.activity_id,
-                order_by=ActivityLog.created_at.desc(),
+        if (cached := _cached_status_query(session, "pending_ids")) is not None:
+            return list(cached)
+
+        result = await session.execute(_pending_ids_stmt())
+        pending = [row[0] for row in result.all()]
+        _cache_status_query(session, "pending_ids", tuple(pending))
+        return pending
+
+    @classmethod
+    async def cancel_pending(
+        cls,
+        session: AsyncSession,
+        message: str = "Canceled due to shutdown",
+    ) -> int:
+        """Append a CANCELED log entry to every QUEUED or RUNNING activity.
+
+        The activities' ``latest_*`` columns are set with a single
+        ``UPDATE ... RETURNING id`` (a SELECT then UPDATE where the dialect
+        lacks RETURNING), the entries written with a single multi-row INSERT,
+        and one commit, so the cost doesn't scale with round-trips per
+        activity. On PostgreSQL both happen in one statement and no ids leave
+        the server.
+
+        Args:
+            session: Async SQLAlchemy session.
+            message: Log message for the cancel entries.
+
+        Returns:
+            Number of activities canceled.
+        """
+        now = datetime.now(UTC)
+        if session.get_bind().dialect.name == "postgresql":
+            result = await session.execute(
+                _cancel_pending_pg_stmt(), {"message": message, "now": now}
             )
-            .label("rn"),
-        ).subquery()
+            await session.commit()
+            _status_query_cache.clear()
+            return result.rowcount
 
-        query = (
-            select(cls.agent_id)
-            .join(
-                latest_log_subq,
-                (cls.id == latest_log_subq.c.activity_id) & (latest_log_subq.c.rn == 1),
+        latest = {
+            "latest_status": Status.CANCELED,
+            "latest_message": message,
+            "latest_percentage": None,
+            "latest_log_at": now,
+        }
+        if session.get_bind().dialect.update_returning:
+            result = await session.execute(
+                update(cls).where(_is_active()).values(latest).returning(cls.id)
             )
-            .where(latest_log_subq.c.status.in_([Status.QUEUED, Status.RUNNING]))
+            activity_ids = list(result.scalars())
+        else:
+            result = await session.execute(select(cls.id).where(_is_active()))
+            activity_ids = list(result.scalars())
+            if activity_ids:
+                await session.execute(
+                    update(cls).where(cls.id.in_(activity_ids)).values(latest)
+                )
+        if not activity_ids:
+            return 0
+
+        await session.execute(
+            insert(ActivityLog),
+            [
+                {
+                    "activity_id": activity_id,
+                    "message": message,
+                    "status": Status.CANCELED,
+                    "percentage": None,
+                    "created_at": now,
+                }
+                for activity_id in activity_ids
+            ],
         )
+        await session.commit()
+        _status_query_cache.clear()
+        return len(activity_ids)
 
-        result = await session.execute(query)
-        return [row[0] for row in result.all()]
+    @classmethod
+    async def get_count(
+        cls,
+        session: AsyncSession,
+        metadata_filter: dict[str, Any] | None = None,
+    ) -> int:
+        """Get the total count of activities matching a metadata filter.
+
+        Args:
+            session: Async SQLAlchemy session.
+            metadata_filter: Optional dict of key-value pairs to filter by.
+
+        Returns:
+            Count of matching activities.
+        """
+        keys, params = _metadata_params(metadata_filter)
+        result = await session.execute(_count_stmt(keys), params)
+        return result.scalar() or 0
 
     @classmethod
     async def get_active_count(cls, session: AsyncSession) -> int:
         """Get count of activities with QUEUED or RUNNING status.
 
+        Results are reused for ``CONF.activity_count_ttl`` seconds unless this
+        process writes a status change first.
+
         Args:
             session: Async SQLAlchemy session.
 
         Returns:
             Count of active (queued or running) activities.
         """
-        latest_log_subq = select(
-            ActivityLog.activity_id,
-            ActivityLog.status,
-            func.row_number()
-            .over(
-                partition_by=ActivityLog.activity_id,
-                order_by=ActivityLog.created_at.desc(),
-            )
-            .label("rn"),
-        ).subquery()
+        if (cached := _cached_status_query(session, "active_count")) is not None:
+            return cached
 
-        query = (
-            select(func.count(cls.id))
-            .join(
-                latest_log_subq,
-                (cls.id == latest_log_subq.c.activity_id) & (latest_log_subq.c.rn == 1),
-            )
-            .where(latest_log_subq.c.status.in_([Status.QUEUED, Status.RUNNING]))
-        )
-
-        result = await session.execute(query)
-        return result.scalar() or 0
+        result = await session.execute(_active_count_stmt())
+        count = result.scalar() or 0
+        _cache_status_query(session, "active_count", count)
+        return count
 
 
 class ActivityLog(Base):
@@ -340,12 +780,24 @@ class ActivityLog(Base):
     def __tablename__(cls) -> str:
         return f"{CONF.table_prefix}activity_log"
 
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Index, ...]:
+        # Serves "latest log per activity" lookups with a single index seek;
+        # its activity_id prefix also covers plain lookups by activity.
+        return (
+            Index(
+                f"ix_{CONF.table_prefix}activity_log_activity_created",
+                "activity_id",
+                "created_at",
+            ),
+        )
+
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     activity_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("agentexec_activity.id"), nullable=False, index=True
+        Uuid, ForeignKey(f"{CONF.table_prefix}activity.id"), nullable=False
     )
     message: Mapped[str] = mapped_column(Text, nullable=False)
-    status: Mapped[Status] = mapped_column(Enum(Status), nullable=False, index=True)
+    status: Mapped[Status] = mapped_column(StatusType, nullable=False, index=True)
     percentage: Mapped[int | None] = mapped_column(Integer, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -354,3 +806,354 @@ class ActivityLog(Base):
     )
 
     activity: Mapped[Activity] = relationship("Activity", back_populates="logs")
+
+
+# Statement cache
+#
+# The hot queries are built once per structural shape and reused, so each
+# call only binds parameters. Metadata filter values, pagination and cursors
+# are bind parameters; only the sorted tuple of filter keys changes the
+# statement's shape. Reused statement objects also keep their SQLAlchemy
+# cache key, so the engine's compiled cache is hit without regenerating it.
+
+
+def _metadata_params(
+    metadata_filter: dict[str, Any] | None,
+) -> tuple[tuple[tuple[str, bool], ...], dict[str, str]]:
+    """Split a metadata filter into its cache key and bind parameters.
+
+    The cache key is ``(key, is_str)`` per sorted key, so string and
+    non-string values compile to their own statements.
+    """
+    if not metadata_filter:
+        return (), {}
+    keys = tuple((key, type(metadata_filter[key]) is str) for key in sorted(metadata_filter))
+    params = {}
+    for i, (key, is_str) in enumerate(keys):
+        value = metadata_filter[key]
+        params[f"filter_{i}"] = value if is_str else str(value)
+    return keys, params
+
+
+class _MetadataMatch(ColumnElement[bool]):
+    """``Activity.metadata_[key] == value`` for every pair, comparing as strings.
+
+    On PostgreSQL the pairs whose filter value is a string compile to a
+    single JSONB containment, one probe of the GIN index on ``metadata``.
+    Containment is type-exact (``{"n": "3"}`` does not contain ``{"n": 3}``),
+    so the other pairs, and every pair on other dialects, extract the key
+    and compare its text.
+    """
+
+    inherit_cache = True
+    type = Boolean()
+    _is_implicitly_boolean = True
+    _traverse_internals = [
+        ("keys", InternalTraversal.dp_string_list),
+        ("values", InternalTraversal.dp_clauseelement_tuple),
+        ("contained", InternalTraversal.dp_plain_obj),
+    ]
+
+    def __init__(
+        self,
+        keys: tuple[str, ...],
+        values: tuple[BindParameter[str], ...],
+        contained: tuple[bool, ...],
+    ) -> None:
+        self.keys = keys
+        self.values = values
+        self.contained = contained
+
+
+@compiles(_MetadataMatch)
+def _compile_metadata_match(element: _MetadataMatch, compiler: Any, **kw: Any) -> str:
+    match = and_(
+        *(
+            Activity.metadata_[key].as_string() == value
+            for key, value in zip(element.keys, element.values)
+        )
+    )
+    return compiler.process(match, **kw)
+
+
+@compiles(_MetadataMatch, "postgresql")
+def _compile_metadata_match_pg(element: _MetadataMatch, compiler: Any, **kw: Any) -> str:
+    pairs = list(zip(element.keys, element.values, element.contained))
+    contained = [arg for key, value, is_str in pairs if is_str for arg in (key, cast(value, Text))]
+    clauses = [Activity.metadata_[key].as_string() == value for key, value, is_str in pairs if not is_str]
+    if contained:
+        match = func.jsonb_build_object(*contained)
+        clauses.insert(0, Activity.metadata_.op("@>", is_comparison=True)(match))
+    return compiler.process(and_(*clauses), **kw)
+
+
+class _LogsJson(ColumnElement[Any]):
+    """The enclosing activity's log entries as a JSON array.
+
+    PostgreSQL aggregates them in ``created_at`` order; SQLite's
+    ``json_group_array`` has no ordering guarantee, so ``get_detail`` sorts.
+    """
+
+    inherit_cache = True
+    type = JSON()
+    _traverse_internals: list[Any] = []
+
+
+def _log_fields() -> list[Any]:
+    return [
+        "id", ActivityLog.id,
+        "message", ActivityLog.message,
+        "status", ActivityLog.status,
+        "percentage", ActivityLog.percentage,
+        "created_at", ActivityLog.created_at,
+    ]  # fmt: skip
+
+
+@compiles(_LogsJson)
+def _compile_logs_json(element: _LogsJson, compiler: Any, **kw: Any) -> str:
+    logs = (
+        select(func.json_group_array(func.json_object(*_log_fields())))
+        .where(ActivityLog.activity_id == Activity.id)
+        .scalar_subquery()
+    )
+    return compiler.process(logs, **kw)
+
+
+@compiles(_LogsJson, "postgresql")
+def _compile_logs_json_pg(element: _LogsJson, compiler: Any, **kw: Any) -> str:
+    entry = func.json_build_object(*_log_fields())
+    logs = (
+        select(
+            func.coalesce(
+                func.json_agg(aggregate_order_by(entry, ActivityLog.created_at)),
+                literal_column("'[]'::json"),
+            )
+        )
+        .where(ActivityLog.activity_id == Activity.id)
+        .scalar_subquery()
+    )
+    return compiler.process(logs, **kw)
+
+
+def _where_metadata(query: Select, metadata_keys: tuple[tuple[str, bool], ...]) -> Select:
+    if not metadata_keys:
+        return query
+    keys, contained = zip(*metadata_keys)
+    values = tuple(bindparam(f"filter_{i}", type_=String) for i in range(len(metadata_keys)))
+    return query.where(_MetadataMatch(keys, values, contained))
+
+
+@functools.cache
+def _activity_ids_stmt() -> Select:
+    return select(Activity.agent_id, Activity.id).where(
+        Activity.agent_id.in_(bindparam("agent_ids", expanding=True))
+    )
+
+
+@functools.cache
+def _insert_log_stmt() -> Any:
+    return insert(ActivityLog)
+
+
+@functools.cache
+def _update_latest_stmt() -> Any:
+    return update(Activity)
+
+
+@functools.cache
+def _append_logs_pg_stmt() -> Any:
+    """``WITH ins AS (INSERT ... SELECT FROM unnest(...)) UPDATE ... FROM unnest(...)``.
+
+    Rows travel as one array parameter per column, so the statement has the
+    same shape (and compiled form) for any batch size.
+    """
+    logs = (
+        func.unnest(
+            bindparam("log_ids", type_=ARRAY(Uuid)),
+            bindparam("log_activity_ids", type_=ARRAY(Uuid)),
+            bindparam("log_messages", type_=ARRAY(Text)),
+            bindparam("log_statuses", type_=ARRAY(StatusType)),
+            bindparam("log_percentages", type_=ARRAY(Integer)),
+            bindparam("log_created_ats", type_=ARRAY(DateTime(timezone=True))),
+        )
+        .table_valued("id", "activity_id", "message", "status", "percentage", "created_at")
+        .render_derived(name="logs")
+    )
+    inserted = (
+        insert(ActivityLog)
+        .from_select(
+            ["id", "activity_id", "message", "status", "percentage", "created_at"],
+            select(
+                logs.c.id,
+                logs.c.activity_id,
+                logs.c.message,
+                logs.c.status,
+                logs.c.percentage,
+                logs.c.created_at,
+            ),
+        )
+        .cte("inserted_logs")
+    )
+    latest = (
+        func.unnest(
+            bindparam("ids", type_=ARRAY(Uuid)),
+            bindparam("statuses", type_=ARRAY(StatusType)),
+            bindparam("messages", type_=ARRAY(Text)),
+            bindparam("percentages", type_=ARRAY(Integer)),
+            bindparam("log_ats", type_=ARRAY(DateTime(timezone=True))),
+        )
+        .table_valued("id", "status", "message", "percentage", "log_at")
+        .render_derived(name="latest")
+    )
+    return (
+        update(Activity)
+        .where(Activity.id == latest.c.id)
+        .values(
+            latest_status=latest.c.status,
+            latest_message=latest.c.message,
+            latest_percentage=latest.c.percentage,
+            latest_log_at=latest.c.log_at,
+        )
+        .add_cte(inserted)
+    )
+
+
+@functools.cache
+def _cancel_pending_pg_stmt() -> Any:
+    """``WITH canceled AS (UPDATE ... RETURNING id) INSERT INTO activity_log SELECT ...``."""
+    message = bindparam("message", type_=Text)
+    now = bindparam("now", type_=DateTime(timezone=True))
+    canceled = (
+        update(Activity)
+        .where(_is_active())
+        .values(
+            latest_status=Status.CANCELED,
+            latest_message=message,
+            latest_percentage=None,
+            latest_log_at=now,
+        )
+        .returning(Activity.id)
+        .cte("canceled")
+    )
+    return insert(ActivityLog).from_select(
+        ["id", "activity_id", "message", "status", "percentage", "created_at"],
+        select(
+            func.gen_random_uuid(),
+            canceled.c.id,
+            message,
+            literal_column(str(_STATUS_CODES[Status.CANCELED]), SmallInteger),
+            literal_column("NULL", Integer),
+            now,
+        ),
+    )
+
+
+def _append_logs_pg_params(
+    rows: list[dict[str, Any]], latest: dict[uuid.UUID, dict[str, Any]]
+) -> dict[str, list[Any]]:
+    return {
+        "log_ids": [uuid.uuid4() for _ in rows],
+        "log_activity_ids": [row["activity_id"] for row in rows],
+        "log_messages": [row["message"] for row in rows],
+        "log_statuses": [row["status"] for row in rows],
+        "log_percentages": [row["percentage"] for row in rows],
+        "log_created_ats": [row["created_at"] for row in rows],
+        "ids": list(latest),
+        "statuses": [entry["latest_status"] for entry in latest.values()],
+        "messages": [entry["latest_message"] for entry in latest.values()],
+        "percentages": [entry["latest_percentage"] for entry in latest.values()],
+        "log_ats": [entry["latest_log_at"] for entry in latest.values()],
+    }
+
+
+@functools.lru_cache(maxsize=64)
+def _by_agent_id_stmt(metadata_keys: tuple[tuple[str, bool], ...]) -> Select:
+    query = (
+        select(Activity)
+        .options(selectinload(Activity.logs))
+        .where(Activity.agent_id == bindparam("agent_id"))
+    )
+    return _where_metadata(query, metadata_keys)
+
+
+@functools.lru_cache(maxsize=64)
+def _detail_stmt(metadata_keys: tuple[tuple[str, bool], ...]) -> Select:
+    query = select(
+        Activity.id,
+        Activity.agent_id,
+        Activity.agent_type,
+        Activity.created_at,
+        Activity.updated_at,
+        Activity.metadata_.label("metadata"),
+        _LogsJson().label("logs"),
+    ).where(Activity.agent_id == bindparam("agent_id"))
+    return _where_metadata(query, metadata_keys)
+
+
+@functools.lru_cache(maxsize=64)
+def _list_stmt(metadata_keys: tuple[tuple[str, bool], ...], count_total: bool = False) -> Select:
+    is_active = case(
+        (Activity.latest_status.in_(_ACTIVE_STATUSES), 0),
+        else_=1,
+    )
+    active_priority = case(
+        (Activity.latest_status == Status.RUNNING, 1),
+        (Activity.latest_status == Status.QUEUED, 2),
+        else_=3,
+    )
+    query = Activity._summary_query(metadata_keys)
+    if count_total:
+        query = query.add_columns(func.count().over().label("total"))
+    return (
+        query
+        .order_by(is_active, active_priority, Activity.started_at.desc().nullslast())
+        .offset(bindparam("offset"))
+        .limit(bindparam("limit"))
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _stream_list_stmt(metadata_keys: tuple[tuple[str, bool], ...]) -> Select:
+    return Activity._summary_query(metadata_keys).order_by(
+        Activity.created_at.desc(), Activity.agent_id.desc()
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _list_after_stmt(metadata_keys: tuple[tuple[str, bool], ...], has_cursor: bool) -> Select:
+    query = Activity._summary_query(metadata_keys)
+    if has_cursor:
+        created_at = bindparam("cursor_created_at", type_=Activity.created_at.type)
+        agent_id = bindparam("cursor_agent_id", type_=Activity.agent_id.type)
+        query = query.where(
+            (Activity.created_at < created_at)
+            | ((Activity.created_at == created_at) & (Activity.agent_id < agent_id))
+        )
+    return query.order_by(Activity.created_at.desc(), Activity.agent_id.desc()).limit(
+        bindparam("limit")
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _count_stmt(metadata_keys: tuple[tuple[str, bool], ...]) -> Select:
+    return _where_metadata(select(func.count(Activity.id)), metadata_keys)
+
+
+def _is_active() -> ColumnElement[bool]:
+    """``latest_status IN (...)`` with the codes inlined.
+
+    Literal values let the planner match ``ix_<prefix>activity_active``'s
+    predicate even under generic prepared-statement plans.
+    """
+    active = bindparam("active_statuses", list(_ACTIVE_STATUSES), expanding=True, literal_execute=True)
+    return Activity.latest_status.in_(active)
+
+
+@functools.cache
+def _pending_ids_stmt() -> Select:
+    return select(Activity.agent_id).where(_is_active())
+
+
+@functools.cache
+def _active_count_stmt() -> Select:
+    return select(func.count()).select_from(Activity).where(_is_active())
@@ -2,14 +2,20 @@
 
 All activity methods emit typed events routed through ``activity.handler``.
 By default, events are written directly to Postgres. In worker processes,
-the handler is swapped to send events via IPC to the pool.
+the handler is swapped to send events via IPC to the pool. The exception
+is ``cancel_pending``, which only runs where the database is reachable and
+writes its cancel entries in bulk.
 
 See ``activity.handlers`` for the handler implementations.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import uuid
+from collections.abc import Sequence
+from contextlib import suppress
 from typing import Any
 
 import agentexec.activity as activity
@@ -22,10 +28,15 @@ def generate_agent_id() -> uuid.UUID:
     return uuid.uuid4()
 
 
+# The same agent_id string arrives with every update for a task; parsing it
+# once is several times cheaper than ``uuid.UUID(s)`` on each call.
+_parse_uuid = functools.lru_cache(maxsize=4096)(uuid.UUID)
+
+
 def normalize_agent_id(agent_id: str | uuid.UUID) -> uuid.UUID:
     """Coerce a string or UUID to a UUID object."""
     if isinstance(agent_id, str):
-        return uuid.UUID(agent_id)
+        return _parse_uuid(agent_id)
     return agent_id
 
 
@@ -64,6 +75,41 @@ async def create(
     return agent_id
 
 
+async def create_many(
+    task_name: str,
+    metadatas: list[dict[str, Any] | None],
+    message: str = "Agent queued",
+) -> list[uuid.UUID]:
+    """Create one activity record per metadata entry for the same task.
+
+    Handlers that provide ``create_many`` (such as ``PostgresHandler``) write
+    the whole batch in one transaction; others receive one event per record.
+
+    Args:
+        task_name: The registered task name.
+        metadatas: Metadata for each record, in order (``None`` for none).
+        message: Initial log message.
+
+    Returns:
+        The agent_ids of the created records, in the same order.
+    """
+    events = [
+        ActivityCreated(
+            agent_id=generate_agent_id(),
+            task_name=task_name,
+            message=message,
+            metadata=metadata,
+        )
+        for metadata in metadatas
+    ]
+    if (bulk := getattr(activity.handler, "create_many", None)) is not None:
+        await bulk(events)
+    else:
+        for event in events:
+            await activity.handler(event)
+    return [event.agent_id for event in events]
+
+
 async def update(
     agent_id: str | uuid.UUID,
     message: str,
@@ -93,6 +139,43 @@ async def update(
     return True
 
 
+async def update_many(
+    agent_ids: Sequence[str | uuid.UUID],
+    message: str,
+    percentage: int | None = None,
+    status: Status | None = None,
+) -> None:
+    """Append the same log entry to several activity records.
+
+    Handlers that provide ``update_many`` (such as ``PostgresHandler``) write
+    the whole batch in one transaction; others receive one event per record.
+
+    Args:
+        agent_ids: The agents to update.
+        message: Log message describing the current state.
+        percentage: Optional completion percentage (0-100).
+        status: Optional status override (default: ``RUNNING``).
+
+    Example::
+
+        await activity.update_many(child_ids, "Parent step finished")
+    """
+    events = [
+        ActivityUpdated(
+            agent_id=normalize_agent_id(agent_id),
+            message=message,
+            status=status or Status.RUNNING,
+            percentage=percentage,
+        )
+        for agent_id in agent_ids
+    ]
+    if (bulk := getattr(activity.handler, "update_many", None)) is not None:
+        await bulk(events)
+    else:
+        for event in events:
+            await activity.handler(event)
+
+
 async def complete(
     agent_id: str | uuid.UUID,
     message: str = "Agent completed",
@@ -143,11 +226,76 @@ async def error(
     return True
 
 
+class ProgressBuffer:
+    """Coalesce rapid progress updates for one agent into fewer writes.
+
+    The first update is emitted right away; updates arriving within the
+    next ``flush_interval`` seconds replace each other and only the most
+    recent is written when the interval elapses. Use as an async context
+    manager so the last pending update is always flushed.
+
+    Example::
+
+        async with activity.ProgressBuffer(agent_id) as progress:
+            progress.update("Extracting text...", percentage=25)
+            ...
+            progress.update("Generating summary...", percentage=75)
+    """
+
+    agent_id: uuid.UUID
+    flush_interval: float
+
+    def __init__(self, agent_id: str | uuid.UUID, flush_interval: float = 0.25) -> None:
+        self.agent_id = normalize_agent_id(agent_id)
+        self.flush_interval = flush_interval
+        self._pending: tuple[str, int | None] | None = None
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._flusher: asyncio.Task[None] | None = None
+
+    def update(self, message: str, percentage: int | None = None) -> None:
+        """Record the latest progress; it is written on the next flush."""
+        self._pending = (message, percentage)
+        self._wake.set()
+
+    async def flush(self) -> None:
+        """Write the pending update, if any."""
+        async with self._lock:
+            if self._pending is None:
+                return
+            message, percentage = self._pending
+            self._pending = None
+            await update(self.agent_id, message, percentage=percentage)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            await self.flush()
+            await asyncio.sleep(self.flush_interval)
+
+    async def __aenter__(self) -> ProgressBuffer:
+        self._flusher = asyncio.create_task(self._flush_loop())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._flusher is not None:
+            # Holding the lock guarantees the flusher isn't mid-write when cancelled.
+            async with self._lock:
+                self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+        await self.flush()
+
+
 async def cancel_pending(session=None) -> int:
     """Cancel all queued and running activities.
 
     Typically called during pool shutdown to mark in-flight tasks as
-    canceled. Reads pending IDs from Postgres and emits cancel events.
+    canceled. Runs in a process with database access, so the cancel log
+    entries are written to Postgres in bulk rather than emitted as one
+    event per activity.
 
     Args:
         session: Optional async SQLAlchemy session. Falls back to ``get_session()``.
@@ -159,12 +307,4 @@ async def cancel_pending(session=None) -> int:
     from agentexec.core.db import get_session
 
     async with session or get_session() as db:
-        pending_ids = await Activity.get_pending_ids(db)
-        for agent_id in pending_ids:
-            await activity.handler(ActivityUpdated(
-                agent_id=agent_id,
-                message="Canceled due to shutdown",
-                status=Status.CANCELED,
-                percentage=None,
-            ))
-        return len(pending_ids)
+        return await Activity.cancel_pending(db)
@@ -75,3 +75,15 @@ class ActivityListSchema(BaseModel):
     @computed_field
     def total_pages(self) -> int:
         return (self.total + self.page_size - 1) // self.page_size
+
+
+class ActivityCursorListSchema(BaseModel):
+    """Keyset-paginated list of activity summaries.
+
+    Pass ``next_cursor`` back as ``cursor`` to fetch the following page;
+    it is None once the last page has been returned.
+    """
+
+    items: list[ActivityListItemSchema]
+    page_size: int
+    next_cursor: str | None = None
@@ -73,6 +73,8 @@ async def run(args):
 
     if args.workers is not None:
         CONF.num_workers = args.workers
+    if args.batch_size is not None:
+        CONF.worker_batch_size = args.batch_size
     if args.max_retries is not None:
         CONF.max_task_retries = args.max_retries
     if args.shutdown_timeout is not None:
@@ -118,6 +120,12 @@ def main():
         default=None,
         help="Number of worker processes (default: AGENTEXEC_NUM_WORKERS or 4)",
     )
+    run_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=None,
+        help="Tasks each worker dequeues and runs at once (default: AGENTEXEC_WORKER_BATCH_SIZE or 1)",
+    )
     run_parser.add_argument(
         "--create-tables",
         action="store_true",
@@ -27,6 +27,24 @@ class Config(BaseSettings):
         description="Number of worker processes to spawn",
         validation_alias="AGENTEXEC_NUM_WORKERS",
     )
+    worker_batch_size: int = Field(
+        default=1,
+        description=(
+            "Maximum number of tasks each worker process keeps in flight. Tasks run "
+            "as coroutines on the worker's event loop and free slots are refilled "
+            "with one batched dequeue, so values above 1 suit I/O-bound handlers "
+            "(LLM calls, HTTP, database)."
+        ),
+        validation_alias="AGENTEXEC_WORKER_BATCH_SIZE",
+    )
+    worker_uvloop: bool = Field(
+        default=True,
+        description=(
+            "Run each worker's event loop on uvloop when it is installed "
+            "(pip install agentexec[uvloop])"
+        ),
+        validation_alias="AGENTEXEC_WORKER_UVLOOP",
+    )
     graceful_shutdown_timeout: int = Field(
         default=300,
         description="Maximum seconds to wait for workers to finish on shutdown",
@@ -53,6 +71,22 @@ class Config(BaseSettings):
         description="Default message when an agent activity encounters an error",
         validation_alias="AGENTEXEC_ACTIVITY_MESSAGE_ERROR",
     )
+    activity_batch_size: int = Field(
+        default=256,
+        description=(
+            "Maximum number of worker activity updates the pool writes to the "
+            "database in one transaction"
+        ),
+        validation_alias="AGENTEXEC_ACTIVITY_BATCH_SIZE",
+    )
+    activity_count_ttl: float = Field(
+        default=0.25,
+        description=(
+            "Seconds a process reuses its active-count and pending-id query "
+            "results; 0 disables caching"
+        ),
+        validation_alias="AGENTEXEC_ACTIVITY_COUNT_TTL",
+    )
 
     redis_url: str | None = Field(
         default=None,
@@ -64,11 +98,28 @@ class Config(BaseSettings):
         description="Redis connection pool size",
         validation_alias=AliasChoices("AGENTEXEC_REDIS_POOL_SIZE", "REDIS_POOL_SIZE"),
     )
+    redis_pool_size_per_worker: int | None = Field(
+        default=None,
+        description=(
+            "Redis connection pool size inside each worker process. Every worker "
+            "has its own pool, so a host opens up to num_workers times this many "
+            "connections. Defaults to redis_pool_size."
+        ),
+        validation_alias="AGENTEXEC_REDIS_POOL_SIZE_PER_WORKER",
+    )
     redis_pool_timeout: int = Field(
         default=5,
         description="Redis connection pool timeout in seconds",
         validation_alias=AliasChoices("AGENTEXEC_REDIS_POOL_TIMEOUT", "REDIS_POOL_TIMEOUT"),
     )
+    redis_health_check_interval: int = Field(
+        default=30,
+        description=(
+            "Seconds a pooled Redis connection may sit idle before it is "
+            "pinged on checkout; 0 disables the check"
+        ),
+        validation_alias="AGENTEXEC_REDIS_HEALTH_CHECK_INTERVAL",
+    )
 
     result_ttl: int = Field(
         default=3600,
@@ -1,11 +1,21 @@
+import json
+from typing import Any
+
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 __all__ = [
     "Base",
     "configure_engine",
     "get_session",
+    "json_deserializer",
+    "json_serializer",
 ]
 
 
@@ -21,6 +31,24 @@ class Base(DeclarativeBase):
     pass
 
 
+def json_serializer(value: Any) -> str:
+    """Encode JSON columns, using ``orjson`` when it's installed.
+
+    Pass as ``json_serializer`` to ``create_async_engine`` (``Pool`` does
+    this for engines it creates from a ``database_url``).
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def json_deserializer(value: str | bytes) -> Any:
+    """Decode JSON columns, using ``orjson`` when it's installed."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
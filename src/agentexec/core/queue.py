@@ -1,4 +1,5 @@
 import logging
+from collections.abc import Sequence
 from enum import Enum
 from typing import Any
 
@@ -59,7 +60,49 @@ async def enqueue(
         priority=priority,
     )
 
-    logger.info(f"Enqueued task {task.task_name} with agent_id {task.agent_id}")
+    logger.info("Enqueued task %s with agent_id %s", task.task_name, task.agent_id)
     return task
 
 
+async def enqueue_many(
+    task_name: str,
+    contexts: Sequence[BaseModel],
+    *,
+    priority: Priority = Priority.LOW,
+    metadata: Sequence[dict[str, Any] | None] | None = None,
+) -> list[Task]:
+    """Enqueue several tasks of the same type in bulk.
+
+    Equivalent to calling ``enqueue()`` for each context, but the activity
+    records are written in one transaction and the tasks are pushed to the
+    queue in one round-trip where the backend supports it.
+
+    Args:
+        task_name: Name of the registered task (must match a ``@pool.task()``).
+        contexts: Pydantic models with each task's input data.
+        priority: ``Priority.HIGH`` pushes to the front of the queue.
+        metadata: Optional per-task metadata dicts, aligned with ``contexts``.
+
+    Returns:
+        The created Tasks, in the same order as ``contexts``.
+
+    Example::
+
+        tasks = await ax.enqueue_many(
+            "research",
+            [ResearchContext(company="Acme"), ResearchContext(company="Globex")],
+        )
+    """
+    tasks = await Task.create_many(
+        task_name=task_name,
+        contexts=contexts,
+        metadatas=metadata,
+    )
+
+    await backend.queue.push_many(
+        [task.model_dump_json() for task in tasks],
+        priority=priority,
+    )
+
+    logger.info("Enqueued %d %s tasks", len(tasks), task_name)
+    return tasks
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import random
 import time
+from collections.abc import Iterator
+from contextlib import suppress
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -13,7 +16,7 @@ if TYPE_CHECKING:
     from agentexec.core.task import Task
 
 
-DEFAULT_TIMEOUT: int = 300  # TODO improve this polling approach
+DEFAULT_TIMEOUT: int = 300
 
 
 class TaskFailure(BaseModel):
@@ -45,22 +48,67 @@ async def _get_result(agent_id: str | UUID) -> BaseModel | None:
     return backend.deserialize(data) if data else None
 
 
+async def _get_finished(task: Task) -> BaseModel | None:
+    result = await _get_result(task.agent_id)
+    if isinstance(result, TaskFailure):
+        raise TaskFailedError(result)
+    return result
+
+
+def _poll_delays() -> Iterator[float]:
+    """Fallback re-read delays.
+
+    While the backend's notification channel is live, re-reads only catch
+    writers that don't notify (or a missed notification), so they start at
+    ``watch_interval`` and double up to ``watch_interval_max``, less up to
+    10% jitter so the cap is never exceeded. Without one they are the only
+    way to see the result and stay at ``poll_interval``.
+    """
+    delay = backend.state.watch_interval
+    while True:
+        if not backend.state.notifying:
+            yield backend.state.poll_interval
+            continue
+        yield delay * random.uniform(0.9, 1.0)
+        delay = min(delay * 2, backend.state.watch_interval_max)
+
+
+async def _get_results(agent_ids: list[UUID]) -> list[BaseModel | None]:
+    keys = [backend.format_key(*KEY_RESULT, str(agent_id)) for agent_id in agent_ids]
+    return [backend.deserialize(data) if data else None for data in await backend.state.get_many(keys)]
+
+
 async def get_result(task: Task, timeout: int = DEFAULT_TIMEOUT) -> BaseModel:
-    """Poll for a task result.
+    """Wait for a task result.
+
+    Watches the result key and re-reads it when the worker announces the
+    write (see ``BaseStateBackend.watch``), so the wait ends as soon as the
+    result lands instead of on the next poll. Re-reads without an
+    announcement back off exponentially from ``watch_interval`` while the
+    notification channel is live (see ``_poll_delays``).
 
     Raises:
         TaskFailedError: If the task permanently failed after exhausting retries.
         TimeoutError: If no result is available within the timeout.
     """
-    start = time.time()
-
-    while time.time() - start < timeout:
-        result = await _get_result(task.agent_id)
-        if isinstance(result, TaskFailure):
-            raise TaskFailedError(result)
-        if result is not None:
-            return result
-        await asyncio.sleep(0.5)
+    deadline = time.monotonic() + timeout
+    if (result := await _get_finished(task)) is not None:
+        return result
+
+    key = backend.format_key(*KEY_RESULT, str(task.agent_id))
+    delays = _poll_delays()
+    async with backend.state.watch(key) as written:
+        while True:
+            written.clear()
+            if (result := await _get_finished(task)) is not None:
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with suppress(TimeoutError):
+                wait = min(remaining, next(delays))
+                await asyncio.wait_for(written.wait(), wait)
 
     raise TimeoutError(f"Result for {task.agent_id} not available within {timeout}s")
 
@@ -68,6 +116,10 @@ async def get_result(task: Task, timeout: int = DEFAULT_TIMEOUT) -> BaseModel:
 async def gather(*tasks: Task, timeout: int = DEFAULT_TIMEOUT) -> tuple[BaseModel, ...]:
     """Wait for multiple tasks and return their results.
 
+    All pending results are read with one ``get_many`` per wake-up, and a
+    single watch covers every pending key, so the cost of a wake-up does
+    not grow with the number of tasks being waited on.
+
     Raises on the first permanently failed task. The remaining tasks keep
     running in their workers and their results stay retrievable — a
     subsequent gather over the same tasks resolves finished ones instantly.
@@ -76,5 +128,41 @@ async def gather(*tasks: Task, timeout: int = DEFAULT_TIMEOUT) -> tuple[BaseMode
         TaskFailedError: If any task permanently failed after exhausting retries.
         TimeoutError: If any result is not available within the timeout.
     """
-    results = await asyncio.gather(*[get_result(task, timeout) for task in tasks])
-    return tuple(results)
+    deadline = time.monotonic() + timeout
+    results: list[BaseModel | None] = [None] * len(tasks)
+    pending = list(range(len(tasks)))
+
+    async def collect() -> None:
+        nonlocal pending
+        found = await _get_results([tasks[i].agent_id for i in pending])
+        still_pending = []
+        for i, result in zip(pending, found):
+            if isinstance(result, TaskFailure):
+                raise TaskFailedError(result)
+            if result is None:
+                still_pending.append(i)
+            else:
+                results[i] = result
+        pending = still_pending
+
+    await collect()
+    if pending:
+        keys = [backend.format_key(*KEY_RESULT, str(tasks[i].agent_id)) for i in pending]
+        delays = _poll_delays()
+        async with backend.state.watch(*keys) as written:
+            while True:
+                written.clear()
+                await collect()
+                if not pending:
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Result for {tasks[pending[0]].agent_id} not available within {timeout}s"
+                    )
+                with suppress(TimeoutError):
+                    wait = min(remaining, next(delays))
+                    await asyncio.wait_for(written.wait(), wait)
+
+    return tuple(results)  # type: ignore[arg-type]
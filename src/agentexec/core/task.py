@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, TypeAlias, TypeVar, cast, get_type_hints
 from uuid import UUID
 
@@ -58,6 +59,8 @@ class TaskDefinition:
     context_type: type[BaseModel]
     result_type: type[BaseModel] | None
     lock_key: str | None
+    run_in_thread: bool
+    silent_start: bool
 
     def __init__(
         self,
@@ -67,6 +70,8 @@ class TaskDefinition:
         context_type: type[BaseModel] | None = None,
         result_type: type[BaseModel] | None = None,
         lock_key: str | None = None,
+        run_in_thread: bool = False,
+        silent_start: bool = False,
     ) -> None:
         """Initialize task definition.
 
@@ -78,16 +83,30 @@ class TaskDefinition:
             lock_key: String template for distributed locking, evaluated against
                 context fields (e.g. ``"user:{user_id}"``). When set, only one task
                 with the same evaluated lock key can run at a time.
+            run_in_thread: Run a sync handler in a thread instead of on the
+                worker's event loop, so a long call doesn't stall other tasks.
+            silent_start: Skip the "started" activity update and only record
+                completion or failure. Halves activity writes for short tasks.
 
         Raises:
             TypeError: If handler doesn't have a typed ``context`` parameter
-                with a BaseModel subclass.
+                with a BaseModel subclass, or ``run_in_thread`` is set for an
+                async handler.
         """
         self.name = name
         self.handler = handler
-        self.context_type = context_type or self._infer_context_type(handler)
-        self.result_type = result_type or self._infer_result_type(handler)
+        self._is_async = inspect.iscoroutinefunction(handler)
+        if run_in_thread and self._is_async:
+            raise TypeError(
+                f"Task handler '{handler.__name__}' is async; "
+                f"run_in_thread only applies to sync handlers"
+            )
+        hints = get_type_hints(handler) if context_type is None or result_type is None else {}
+        self.context_type = context_type or self._infer_context_type(handler, hints)
+        self.result_type = result_type or self._infer_result_type(handler, hints)
         self.lock_key = lock_key
+        self.run_in_thread = run_in_thread
+        self.silent_start = silent_start
 
     def get_lock_key(self, context: Mapping[str, Any]) -> str | None:
         """Evaluate the lock key template against context data."""
@@ -104,23 +123,29 @@ class TaskDefinition:
         """
         context = self.hydrate_context(task.context)
 
-        await activity.update(
-            agent_id=task.agent_id,
-            message=CONF.activity_message_started,
-            percentage=0,
-        )
+        if not self.silent_start:
+            await activity.update(
+                agent_id=task.agent_id,
+                message=CONF.activity_message_started,
+                percentage=0,
+            )
 
         try:
-            if inspect.iscoroutinefunction(self.handler):
+            if self._is_async:
                 handler = cast(_AsyncTaskHandler, self.handler)
                 result = await handler(agent_id=task.agent_id, context=context)
+            elif self.run_in_thread:
+                handler = cast(_SyncTaskHandler, self.handler)
+                result = await asyncio.to_thread(handler, agent_id=task.agent_id, context=context)
             else:
                 handler = cast(_SyncTaskHandler, self.handler)
                 result = handler(agent_id=task.agent_id, context=context)
 
             if isinstance(result, BaseModel):
                 key = backend.format_key(*KEY_RESULT, str(task.agent_id))
-                await backend.state.set(key, backend.serialize(result), ttl_seconds=CONF.result_ttl)
+                await backend.state.set_and_notify(
+                    key, backend.serialize(result), ttl_seconds=CONF.result_ttl
+                )
 
             await activity.update(
                 agent_id=task.agent_id,
@@ -137,8 +162,7 @@ class TaskDefinition:
             )
             raise e
 
-    def _infer_context_type(self, handler: TaskHandler) -> type[BaseModel]:
-        hints = get_type_hints(handler)
+    def _infer_context_type(self, handler: TaskHandler, hints: dict[str, Any]) -> type[BaseModel]:
         if "context" not in hints:
             raise TypeError(
                 f"Task handler '{handler.__name__}' must have a 'context' parameter "
@@ -152,8 +176,7 @@ class TaskDefinition:
             )
         return context_type
 
-    def _infer_result_type(self, handler: TaskHandler) -> type[BaseModel] | None:
-        hints = get_type_hints(handler)
+    def _infer_result_type(self, handler: TaskHandler, hints: dict[str, Any]) -> type[BaseModel] | None:
         if "return" not in hints:
             return None
         return_type = hints["return"]
@@ -211,3 +234,47 @@ class Task(BaseModel):
             context=context.model_dump(mode="json"),
             agent_id=agent_id,
         )
+
+    @classmethod
+    async def create_many(
+        cls,
+        task_name: str,
+        contexts: Sequence[BaseModel],
+        metadatas: Sequence[dict[str, Any] | None] | None = None,
+    ) -> list[Task]:
+        """Create several tasks of the same type, batching the activity writes.
+
+        Args:
+            task_name: Name of the registered task.
+            contexts: Pydantic models with each task's input data.
+            metadatas: Optional per-task metadata, aligned with ``contexts``.
+
+        Returns:
+            Task instances in the same order as ``contexts``.
+        """
+        if metadatas is None:
+            metadatas = [None] * len(contexts)
+        elif len(metadatas) != len(contexts):
+            raise ValueError(
+                f"Got {len(metadatas)} metadata entries for {len(contexts)} contexts"
+            )
+
+        agent_ids = await activity.create_many(
+            task_name=task_name,
+            metadatas=list(metadatas),
+            message=CONF.activity_message_create,
+        )
+        # Fan-out often repeats one context instance; dump each instance once.
+        # Task validation copies the dict, so the tasks don't share it.
+        dumped: dict[int, dict[str, Any]] = {}
+        for context in contexts:
+            if id(context) not in dumped:
+                dumped[id(context)] = context.model_dump(mode="json")
+        return [
+            cls(
+                task_name=task_name,
+                context=dumped[id(context)],
+                agent_id=agent_id,
+            )
+            for context, agent_id in zip(contexts, agent_ids)
+        ]
@@ -1,5 +1,4 @@
 from __future__ import annotations
-import asyncio
 import inspect
 import re
 from typing import (
@@ -64,9 +63,12 @@ class _AsyncStepHandler(Protocol):
 StepHandler: TypeAlias = _SyncStepHandler | _AsyncStepHandler
 
 
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
 def _format_pipeline_name(cls: type) -> str:
     """Generate a default pipeline name based on the class name."""
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", cls.__name__).lower()
+    return _CAMEL_BOUNDARY.sub("_", cls.__name__).lower()
 
 
 class _PipelineBaseMeta(type):
@@ -93,6 +95,7 @@ class _PipelineBase(metaclass=_PipelineBaseMeta):
     """Base class for pipeline definitions."""
 
     _pipeline: ClassVar[Pipeline]
+    _pipeline_name: ClassVar[str]
 
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
@@ -101,6 +104,7 @@ class _PipelineBase(metaclass=_PipelineBaseMeta):
         if cls.__name__ == "PipelineBase":
             return
 
+        cls._pipeline_name = _format_pipeline_name(cls)
         cls._pipeline._bind_user_pipeline(cls)
         cls._pipeline._register_task()
 
@@ -127,8 +131,10 @@ class StepDefinition:
         self.name = name
         self.order = order
         self.handler = handler
+        self._is_async = inspect.iscoroutinefunction(handler)
         self.return_type = return_type
         self.param_types = param_types
+        self.param_names = tuple(param_types)
         self._description = description
 
     @property
@@ -138,9 +144,17 @@ class StepDefinition:
             return self._description
         return self.handler.__name__
 
+    def bind_kwargs(self, context: StepResult) -> dict[str, BaseModel]:
+        """Map the previous step's output onto this step's parameters."""
+        if isinstance(context, tuple):
+            return dict(zip(self.param_names, context))
+        if self.param_names:
+            return {self.param_names[0]: context}
+        return {}
+
     async def __call__(self, instance: _PipelineBase, **kwargs: BaseModel) -> StepResult:
         """Invoke the step handler."""
-        if asyncio.iscoroutinefunction(self.handler):
+        if self._is_async:
             handler = cast(_AsyncStepHandler, self.handler)
             return await handler(instance, **kwargs)
         else:
@@ -178,6 +192,8 @@ class Pipeline:
     _pool: Pool | None
     _name: str | None
     _steps: dict[str, StepDefinition]
+    _steps_sorted: list[StepDefinition] | None
+    _validated: bool
     _user_pipeline_class: type[_PipelineBase] | None = None
     _user_pipeline_instance: _PipelineBase | None = None
 
@@ -194,6 +210,8 @@ class Pipeline:
             name: Optional name for task registration; defaults to class-based name.
         """
         self._steps = {}
+        self._steps_sorted = None
+        self._validated = False
         self._pool = pool
         self._name = name
 
@@ -203,7 +221,7 @@ class Pipeline:
         if self._name:  # overridden name
             return self._name
 
-        return _format_pipeline_name(self._get_user_pipeline_class())
+        return self._get_user_pipeline_class()._pipeline_name
 
     @property
     def Base(self) -> type[_PipelineBase]:
@@ -266,7 +284,9 @@ class Pipeline:
     @property
     def _sorted_steps(self) -> list[StepDefinition]:
         """Steps sorted by their order value."""
-        return sorted(self._steps.values(), key=lambda s: s.order)
+        if self._steps_sorted is None:
+            self._steps_sorted = sorted(self._steps.values(), key=lambda s: s.order)
+        return self._steps_sorted
 
     @property
     def _input_type(self) -> type[BaseModel]:
@@ -316,6 +336,8 @@ class Pipeline:
                 param_types=param_types,
                 description=description,
             )
+            self._steps_sorted = None
+            self._validated = False
             return func
 
         return decorator
@@ -348,9 +370,10 @@ class Pipeline:
             Output from the final step
         """
         self._validate_type_flow()
+        instance = self._get_user_pipeline_instance()
         _context: StepResult = context
         for step in self._sorted_steps:
-            _context = await self._run_step(step, _context)
+            _context = await self._run_step(step, instance, _context)
 
         return _context
 
@@ -371,6 +394,7 @@ class Pipeline:
         self._validate_type_flow()
         steps = self._sorted_steps
         total_steps = len(steps)
+        instance = self._get_user_pipeline_instance()
 
         _context: StepResult = context
         for i, step in enumerate(steps):
@@ -379,7 +403,7 @@ class Pipeline:
                 f"Started {step.description}",
                 percentage=int((i / total_steps) * 100),
             )
-            _context = await self._run_step(step, _context)
+            _context = await self._run_step(step, instance, _context)
 
         assert isinstance(_context, TaskResult), "Final step must return BaseModel"
         return _context
@@ -387,34 +411,30 @@ class Pipeline:
     async def _run_step(
         self,
         step: StepDefinition,
+        instance: _PipelineBase,
         context: StepResult,
     ) -> StepResult:
         """Run a single step of the pipeline.
 
         Args:
             step: StepDefinition to execute
-            **kwargs: Parameters to pass to the step
+            instance: Pipeline implementation instance the step is bound to
+            context: Output of the previous step (or the initial context)
         Returns:
             Output from the step
         """
-        instance = self._get_user_pipeline_instance()
-
-        param_names = list(step.param_types.keys())
-        if isinstance(context, tuple):
-            kwargs = dict(zip(param_names, context))
-        elif param_names:
-            kwargs = {param_names[0]: context}
-        else:
-            kwargs = {}
-
-        return await step(instance, **kwargs)
+        return await step(instance, **step.bind_kwargs(context))
 
     def _validate_type_flow(self) -> None:
         """Validate that all step types are BaseModel and flow correctly.
 
+        Runs once per set of steps; later calls return immediately.
+
         Raises:
             TypeError: If types aren't BaseModel subclasses or don't connect properly
         """
+        if self._validated:
+            return
         steps = self._sorted_steps
         assert steps, "Pipeline has no steps defined."  # caught on subclass init
 
@@ -458,3 +478,5 @@ class Pipeline:
         # Final step must return a single BaseModel
         if not _is_base_model(steps[-1].return_type):
             raise TypeError(f"Final step '{steps[-1].name}' must return a BaseModel.")
+
+        self._validated = True
@@ -1,16 +1,51 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import importlib
 import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any, Optional, TypedDict
 from pydantic import BaseModel
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from agentexec.core.queue import Priority
     from agentexec.schedule import ScheduledTask
 
 
+# Payloads popped from a partition carry its key under this field, so the
+# worker can release the partition even if the payload isn't a valid Task.
+PARTITION_KEY_FIELD = "ax_partition_key"
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode a JSON payload read from a backend, using ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(value: Any) -> bytes:
+    """Encode a JSON payload for a backend, using ``orjson`` when installed."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value).encode("utf-8")
+
+
+@functools.cache
+def _model_class(type_path: str) -> type[BaseModel]:
+    module_path, class_name = type_path.rsplit(".", 1)
+    module = importlib.import_module(module_path)
+    return getattr(module, class_name)
+
+
 class _SerializeWrapper(TypedDict):
     __type__: str
     data: dict[str, Any]
@@ -35,15 +70,12 @@ class BaseBackend(ABC):
             "__type__": f"{type(obj).__module__}.{type(obj).__qualname__}",
             "data": obj.model_dump(mode="json"),
         }
-        return json.dumps(wrapper).encode("utf-8")
+        return json_dumps(wrapper)
 
     def deserialize(self, data: bytes) -> BaseModel:
         """Deserialize bytes back to a typed Pydantic model."""
-        wrapper: _SerializeWrapper = json.loads(data.decode("utf-8"))
-        module_path, class_name = wrapper["__type__"].rsplit(".", 1)
-        module = importlib.import_module(module_path)
-        cls = getattr(module, class_name)
-        return cls.model_validate(wrapper["data"])
+        wrapper: _SerializeWrapper = json_loads(data)
+        return _model_class(wrapper["__type__"]).model_validate(wrapper["data"])
 
 
 class BaseStateBackend(ABC):
@@ -58,12 +90,52 @@ class BaseStateBackend(ABC):
     @abstractmethod
     async def delete(self, key: str) -> int: ...
 
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        """Read several keys at once; missing keys come back as ``None``."""
+        return [await self.get(key) for key in keys]
+
     @abstractmethod
     async def counter_incr(self, key: str) -> int: ...
 
     @abstractmethod
     async def counter_decr(self, key: str) -> int: ...
 
+    # While notifications are live, the first delay before a watcher re-reads
+    # its key without one; later re-reads double up to ``watch_interval_max``.
+    watch_interval: float = 0.1
+    watch_interval_max: float = 8.0
+    # Fixed re-read delay while no notification channel is live.
+    poll_interval: float = 0.5
+
+    @property
+    def notifying(self) -> bool:
+        """Whether ``notify()`` currently reaches this process's watchers.
+
+        The default implementation has no notification channel, so watchers
+        re-read the key every ``poll_interval`` seconds.
+        """
+        return False
+
+    async def notify(self, key: str) -> None:
+        """Wake callers watching ``key`` after it was written.
+
+        The default implementation does nothing (see ``notifying``).
+        """
+
+    async def set_and_notify(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        """Write ``key`` and wake its watchers."""
+        await self.set(key, value, ttl_seconds)
+        await self.notify(key)
+
+    @asynccontextmanager
+    async def watch(self, *keys: str) -> AsyncIterator[asyncio.Event]:
+        """Yield an event that is set whenever ``notify()`` is called for any of ``keys``.
+
+        Read the keys only after entering the context, so a write that lands
+        in between is not missed. The default event is never set.
+        """
+        yield asyncio.Event()
+
 
 class BaseQueueBackend(ABC):
     """Task queue with push/pop semantics and partition-level locking."""
@@ -77,9 +149,37 @@ class BaseQueueBackend(ABC):
         partition_key: str | None = None,
     ) -> None: ...
 
+    async def push_many(
+        self,
+        values: list[str],
+        *,
+        priority: Priority | None = None,
+    ) -> None:
+        """Push several tasks to the default queue.
+
+        The default implementation calls ``push()`` for each value.
+        Backends that can send several payloads per round-trip override this.
+        """
+        for value in values:
+            await self.push(value, priority=priority)
+
     @abstractmethod
     async def pop(self, *, timeout: int = 1) -> dict[str, Any] | None: ...
 
+    async def pop_batch(self, count: int, *, timeout: int = 1) -> list[dict[str, Any]]:
+        """Pop up to ``count`` tasks.
+
+        The default implementation calls ``pop()`` until the queue runs dry,
+        waiting up to ``timeout`` only for the first task.
+        Backends that can fetch several payloads per round-trip override this.
+        """
+        tasks: list[dict[str, Any]] = []
+        while len(tasks) < count:
+            if (data := await self.pop(timeout=timeout if not tasks else 0)) is None:
+                break
+            tasks.append(data)
+        return tasks
+
     @abstractmethod
     async def complete(self, partition_key: str | None) -> None:
         """Signal that the current task for this partition is done."""
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import os
 import socket
 import time
@@ -15,7 +13,14 @@ from aiokafka import AIOKafkaConsumer, AIOKafkaProducer, TopicPartition
 from aiokafka.admin import AIOKafkaAdminClient, NewTopic
 
 from agentexec.config import CONF
-from agentexec.state.base import BaseBackend, BaseQueueBackend, BaseScheduleBackend, BaseStateBackend
+from agentexec.state.base import (
+    PARTITION_KEY_FIELD,
+    BaseBackend,
+    BaseQueueBackend,
+    BaseScheduleBackend,
+    BaseStateBackend,
+    json_loads,
+)
 
 
 
@@ -169,10 +174,17 @@ class KafkaStateBackend(BaseStateBackend):
 
 
 class KafkaQueueBackend(BaseQueueBackend):
-    """Kafka queue: consumer groups for reliable fan-out."""
+    """Kafka queue: consumer groups for reliable fan-out.
+
+    Tasks with a partition key are produced with it as the record key, so
+    they share a partition and a consumer. ``pop_batch`` hands out at most
+    one record per key until ``complete()`` releases it; later records of
+    that partition are rewound and delivered after the running one.
+    """
 
     def __init__(self, backend: Backend) -> None:
         self.backend = backend
+        self._in_flight: set[bytes] = set()
 
     async def _get_consumer(self, topic: str) -> AIOKafkaConsumer:
         consumers = self.backend._consumers
@@ -204,7 +216,7 @@ class KafkaQueueBackend(BaseQueueBackend):
         await self.backend.ensure_topic(topic, compact=False)
 
         # Extract metadata for headers without altering the payload
-        task_data = json.loads(value)
+        task_data = json_loads(value)
         headers = {
             "ax_task_name": task_data.get("task_name", ""),
             "ax_agent_id": task_data.get("agent_id", ""),
@@ -217,22 +229,42 @@ class KafkaQueueBackend(BaseQueueBackend):
         *,
         timeout: int = 1,
     ) -> dict[str, Any] | None:
+        tasks = await self.pop_batch(1, timeout=timeout)
+        return tasks[0] if tasks else None
+
+    async def pop_batch(
+        self,
+        count: int,
+        *,
+        timeout: int = 1,
+    ) -> list[dict[str, Any]]:
         consumer = await self._get_consumer(self.backend.tasks_topic(CONF.queue_prefix))
 
-        try:
-            msg = await asyncio.wait_for(
-                consumer.getone(),
-                timeout=timeout,
-            )
-            await consumer.commit()
-            if msg.value is None:
-                return None
-            return json.loads(msg.value.decode("utf-8"))
-        except asyncio.TimeoutError:
-            return None
+        records = await consumer.getmany(timeout_ms=timeout * 1000, max_records=count)
+        tasks: list[dict[str, Any]] = []
+        offsets: dict[TopicPartition, int] = {}
+        for tp, tp_records in records.items():
+            for msg in tp_records:
+                if msg.key is not None and msg.key in self._in_flight:
+                    # Same key still running: rewind so this record and the
+                    # rest of the partition are fetched again, in order.
+                    consumer.seek(tp, msg.offset)
+                    break
+                offsets[tp] = msg.offset + 1
+                if msg.value is None:
+                    continue  # tombstone: nothing to run, so nothing to hold
+                data = json_loads(msg.value)
+                if msg.key is not None:
+                    self._in_flight.add(msg.key)
+                    data[PARTITION_KEY_FIELD] = msg.key.decode("utf-8")
+                tasks.append(data)
+        if offsets:
+            await consumer.commit(offsets)
+        return tasks
 
     async def complete(self, partition_key: str | None) -> None:
-        pass  # Kafka uses partition assignment, no explicit locks
+        if partition_key is not None:
+            self._in_flight.discard(partition_key.encode("utf-8"))
 
 
 class KafkaScheduleBackend(BaseScheduleBackend):
@@ -22,7 +22,7 @@ partition queue keyed by that value.
 Dequeue Strategy
 ~~~~~~~~~~~~~~~~
 
-Workers call ``queue.pop()`` which uses Redis SCAN to iterate all keys
+Workers call ``queue.pop()`` (or ``queue.pop_batch()``) which uses Redis SCAN to iterate all keys
 matching the queue prefix. SCAN returns keys in hash-table order, which
 is effectively random — providing fair distribution across partitions
 without explicit shuffling.
@@ -34,7 +34,14 @@ For each key discovered:
    an existing lock. If found, skip. Otherwise attempt ``SET NX EX`` to
    acquire the lock. If acquisition fails, skip.
 3. ``RPOP`` the queue key. If successful, return the task payload.
-4. On task completion, the pool calls ``queue.complete(partition_key)``
+   ``pop_batch()`` keeps scanning until it has collected ``count`` tasks,
+   taking up to the remaining count from the default queue in one
+   ``RPOP key count`` call.
+4. If the scan found nothing and ``timeout`` is positive, block on the
+   default queue with ``BLMPOP`` (``BRPOP`` before Redis 7) so an idle
+   worker wakes as soon as a task arrives, taking up to ``count`` tasks
+   in that round-trip.
+5. On task completion, the pool calls ``queue.complete(partition_key)``
    which deletes the lock key, allowing the next task in that partition
    to be picked up.
 
@@ -45,17 +52,38 @@ safety net for dead worker recovery.
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import socket
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from agentexec.core.queue import Priority
     from agentexec.schedule import ScheduledTask
-import json
 import redis
 import redis.asyncio
 
 from agentexec.config import CONF
-from agentexec.state.base import BaseBackend, BaseQueueBackend, BaseScheduleBackend, BaseStateBackend
+from agentexec.state.base import (
+    PARTITION_KEY_FIELD,
+    BaseBackend,
+    BaseQueueBackend,
+    BaseScheduleBackend,
+    BaseStateBackend,
+    json_loads,
+)
+
+logger = logging.getLogger(__name__)
+
+# Probe idle connections after 30s, every 10s, and drop them after 3 misses,
+# so dead peers are noticed before the next command instead of on it.
+_KEEPALIVE_OPTIONS = {
+    getattr(socket, name): value
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+}
 
 
 class Backend(BaseBackend):
@@ -76,6 +104,7 @@ class Backend(BaseBackend):
         return ":".join(args)
 
     async def close(self) -> None:
+        await self.state.close_watchers()
         if self._client is not None:
             await self._client.aclose()
             self._client = None
@@ -89,18 +118,40 @@ class Backend(BaseBackend):
                 CONF.redis_url,
                 max_connections=CONF.redis_pool_size,
                 socket_connect_timeout=CONF.redis_pool_timeout,
+                socket_keepalive=True,
+                socket_keepalive_options=_KEEPALIVE_OPTIONS,
+                health_check_interval=CONF.redis_health_check_interval,
                 decode_responses=False,
             )
         return self._client
 
 
 class RedisStateBackend(BaseStateBackend):
-    """Redis state: direct Redis commands."""
+    """Redis state: direct Redis commands.
+
+    ``notify()`` publishes the written key on a single notification channel.
+    Every watcher in the process shares one pub/sub connection subscribed to
+    that channel, and a listener task routes each message to the watchers
+    of its key, so watching costs no subscribe round-trip of its own. The
+    connection and listener exist only while something is being watched.
+    """
 
     backend: Backend
 
     def __init__(self, backend: Backend) -> None:
         self.backend = backend
+        self._pubsub: redis.asyncio.client.PubSub | None = None
+        self._subscribed: asyncio.Future[Any] | None = None
+        self._listener: asyncio.Task[None] | None = None
+        self._watchers: dict[bytes, set[asyncio.Event]] = {}
+
+    @property
+    def notifying(self) -> bool:
+        return self._listener is not None and not self._listener.done()
+
+    @property
+    def _channel(self) -> str:
+        return self.backend.format_key(CONF.key_prefix, "written")
 
     async def get(self, key: str) -> Optional[bytes]:
         return await self.backend.client.get(key)  # type: ignore[return-value]
@@ -111,6 +162,11 @@ class RedisStateBackend(BaseStateBackend):
         else:
             return await self.backend.client.set(key, value)  # type: ignore[return-value]
 
+    async def get_many(self, keys: list[str]) -> list[Optional[bytes]]:
+        if not keys:
+            return []
+        return await self.backend.client.mget(keys)  # type: ignore[return-value]
+
     async def delete(self, key: str) -> int:
         return await self.backend.client.delete(key)  # type: ignore[return-value]
 
@@ -120,6 +176,84 @@ class RedisStateBackend(BaseStateBackend):
     async def counter_decr(self, key: str) -> int:
         return await self.backend.client.decr(key)  # type: ignore[return-value]
 
+    async def notify(self, key: str) -> None:
+        await self.backend.client.publish(self._channel, key.encode())
+
+    async def set_and_notify(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        # One round-trip, and watchers can't see the notification before the value.
+        async with self.backend.client.pipeline(transaction=True) as pipe:
+            pipe.set(key, value, ex=ttl_seconds)
+            pipe.publish(self._channel, key.encode())
+            await pipe.execute()
+
+    @asynccontextmanager
+    async def watch(self, *keys: str) -> AsyncIterator[asyncio.Event]:
+        event = asyncio.Event()
+        names = [key.encode() for key in keys]
+        for name in names:
+            self._watchers.setdefault(name, set()).add(event)
+        try:
+            if self._subscribed is None:
+                pubsub = self.backend.client.pubsub(ignore_subscribe_messages=True)
+                self._pubsub = pubsub
+                self._subscribed = asyncio.ensure_future(pubsub.subscribe(self._channel))
+                self._listener = asyncio.create_task(self._listen(pubsub, self._subscribed))
+            subscribed = self._subscribed
+            try:
+                await asyncio.shield(subscribed)
+            except Exception as e:
+                # Waiters fall back to polling rather than failing; the next
+                # watch() tries to subscribe again.
+                logger.warning(f"Result notification subscribe failed, falling back to polling: {e}")
+                if self._subscribed is subscribed:
+                    self._pubsub = self._subscribed = self._listener = None
+                live = False
+            else:
+                live = True
+            yield event if live else asyncio.Event()
+        finally:
+            for name in names:
+                events = self._watchers.get(name)
+                if events is not None:
+                    events.discard(event)
+                    if not events:
+                        del self._watchers[name]
+
+    async def _listen(self, pubsub: redis.asyncio.client.PubSub, subscribed: asyncio.Future[Any]) -> None:
+        try:
+            await subscribed
+            # Linger for one idle read after the last watcher leaves, so
+            # back-to-back waits reuse the subscription.
+            while self._watchers:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                if message is not None:
+                    for event in self._watchers.get(message["data"], ()):
+                        event.set()
+        except Exception as e:
+            logger.warning(f"Result notification listener failed, falling back to polling: {e}")
+        finally:
+            if self._pubsub is pubsub:
+                self._pubsub = self._subscribed = self._listener = None
+                # Wake every watcher so it re-reads now and polls at the
+                # fixed interval instead of sleeping out a backed-off delay.
+                for events in self._watchers.values():
+                    for event in events:
+                        event.set()
+            with suppress(Exception):
+                await pubsub.aclose()
+
+    async def close_watchers(self) -> None:
+        """Stop the listener and close the shared pub/sub connection."""
+        listener, pubsub = self._listener, self._pubsub
+        self._listener = self._pubsub = self._subscribed = None
+        if listener is not None:
+            listener.cancel()
+            with suppress(BaseException):
+                await listener
+        if pubsub is not None:
+            with suppress(Exception):
+                await pubsub.aclose()
+
 
 class RedisQueueBackend(BaseQueueBackend):
     """Redis queue: partitioned lists with per-group locking.
@@ -133,11 +267,13 @@ class RedisQueueBackend(BaseQueueBackend):
     _lock_suffix: bytes = b":lock"
     _prefix: str
     _default_key: bytes
+    _blmpop: bool
 
     def __init__(self, backend: Backend) -> None:
         self.backend = backend
         self._prefix = CONF.queue_prefix
         self._default_key = self._prefix.encode()
+        self._blmpop = True
 
     def _queue_key(self, partition_key: str | None = None) -> str:
         if partition_key:
@@ -181,6 +317,26 @@ class RedisQueueBackend(BaseQueueBackend):
         else:
             await self.backend.client.lpush(key, value)  # type: ignore[misc]
 
+    async def push_many(
+        self,
+        values: list[str],
+        *,
+        priority: Priority | None = None,
+    ) -> None:
+        """Push several tasks to the default queue in one round-trip.
+
+        Equivalent to calling ``push()`` for each value in order.
+        """
+        from agentexec.core.queue import Priority
+
+        if not values:
+            return
+        key = self._queue_key(None)
+        if priority is Priority.HIGH:
+            await self.backend.client.rpush(key, *values)  # type: ignore[misc]
+        else:
+            await self.backend.client.lpush(key, *values)  # type: ignore[misc]
+
     async def pop(self, *, timeout: int = 1) -> dict[str, Any] | None:
         """Pop the next eligible task from any queue.
 
@@ -188,11 +344,24 @@ class RedisQueueBackend(BaseQueueBackend):
         for the selected partition, and pops the task. Returns ``None``
         if no eligible tasks are available.
         """
+        tasks = await self.pop_batch(1, timeout=timeout)
+        return tasks[0] if tasks else None
+
+    async def pop_batch(self, count: int, *, timeout: int = 1) -> list[dict[str, Any]]:
+        """Pop up to ``count`` eligible tasks across all queues.
+
+        Follows the same scan as ``pop()``. The default queue is drained
+        with a single ``RPOP key count`` round-trip; partition queues yield
+        at most one task each, since their lock serializes execution. When
+        nothing is eligible, waits up to ``timeout`` seconds (``0`` doesn't
+        wait) for tasks on the default queue.
+        """
+        tasks: list[dict[str, Any]] = []
         locks_seen: set[bytes] = set()
 
         # SCAN returns keys in hash-table order (effectively random),
         # so we don't need to collect all keys before choosing.
-        # We try each key eagerly and exit on the first successful pop.
+        # We try each key eagerly and stop once the batch is full.
         async for key in self.backend.client.scan_iter(match=self._prefix.encode() + b"*", count=100):
             if self._needs_lock(key):
                 if key.endswith(self._lock_suffix):
@@ -205,15 +374,39 @@ class RedisQueueBackend(BaseQueueBackend):
                 if not await self._acquire_lock(key):
                     continue  # another worker holds this partition, find another
 
-            result = await self.backend.client.rpop(key)  # type: ignore[misc]
-            if result is None:
-                if self._needs_lock(key):
+                result = await self.backend.client.rpop(key)  # type: ignore[misc]
+                if result is None:
                     # TODO this should never happen; we can improve on the ergonomics of recovery later.
                     raise RuntimeError(f"Partition queue {key!r} was empty after lock acquired")
+                data = json_loads(result)
+                data[PARTITION_KEY_FIELD] = key[len(self._default_key) + 1 :].decode()
+                tasks.append(data)
+            else:
+                results = await self.backend.client.rpop(key, count - len(tasks))  # type: ignore[misc]
+                # payload may have been grabbed in a race condition; keep scanning
+                tasks.extend(json_loads(result) for result in results or [])
+
+            if len(tasks) >= count:
+                break
+
+        if not tasks and timeout > 0:
+            tasks = await self._wait_default(count, timeout)
+        return tasks
 
-                continue  # payload was grabbed in a race condition, find another
-
-            return json.loads(result)
+    async def _wait_default(self, count: int, timeout: int) -> list[dict[str, Any]]:
+        """Block up to ``timeout`` seconds for tasks on the default queue."""
+        client = self.backend.client
+        if self._blmpop:
+            try:
+                result = await client.blmpop(  # type: ignore[misc]
+                    timeout, 1, self._default_key, direction="RIGHT", count=count
+                )
+            except redis.exceptions.ResponseError:
+                self._blmpop = False  # BLMPOP needs Redis 7.0
+            else:
+                return [json_loads(value) for value in result[1]] if result else []
+        result = await client.brpop([self._default_key], timeout=timeout)  # type: ignore[misc]
+        return [json_loads(result[1])] if result else []
 
     async def complete(self, partition_key: str | None) -> None:
         """Signal that the current task for this partition is done.
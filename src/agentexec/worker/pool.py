@@ -3,6 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import multiprocessing as mp
+from logging.handlers import QueueHandler, QueueListener
 from dataclasses import dataclass
 from multiprocessing.synchronize import Event as MPEvent
 from typing import Any, Callable
@@ -12,12 +13,23 @@ from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from agentexec.config import CONF
 from agentexec.state import KEY_RESULT, backend
+from agentexec.state.base import PARTITION_KEY_FIELD
 import queue as stdlib_queue
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None  # type: ignore[assignment]
+
 from agentexec import activity
-from agentexec.activity.events import ActivityEvent
+from agentexec.activity.events import ActivityEvent, ActivityUpdated
 from agentexec.activity.handlers import IPCHandler
-from agentexec.core.db import configure_engine, dispose_engine
+from agentexec.core.db import (
+    configure_engine,
+    dispose_engine,
+    json_deserializer,
+    json_serializer,
+)
 from agentexec.core.queue import enqueue
 from agentexec.core.results import TaskFailure
 from agentexec.core.task import Task, TaskDefinition, TaskHandler
@@ -31,6 +43,22 @@ __all__ = [
 ]
 
 
+def _eager_event_loop() -> asyncio.AbstractEventLoop:
+    """Event loop whose tasks start running as soon as they are created.
+
+    Task coroutines that finish without blocking (e.g. an unregistered task
+    name) then complete inside ``create_task`` instead of costing a trip
+    through the loop's ready queue. Uses uvloop when it is installed and
+    ``CONF.worker_uvloop`` is on.
+    """
+    if uvloop is not None and CONF.worker_uvloop:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.new_event_loop()
+    loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
+
 class Message(BaseModel):
     """Base event sent from a worker to the pool."""
 
@@ -106,25 +134,38 @@ class Worker:
         except (OSError, AttributeError):
             pass
 
+        if CONF.redis_pool_size_per_worker is not None:
+            CONF.redis_pool_size = CONF.redis_pool_size_per_worker
+
         # Spawn doesn't inherit log handlers; bootstrap stderr for this process.
+        # Records are written by a listener thread so a slow stderr pipe never
+        # blocks the worker's event loop.
+        listener: QueueListener | None = None
         root = logging.getLogger()
         if not root.handlers:
             handler = logging.StreamHandler()
             handler.setFormatter(logging.Formatter(
                 "[%(levelname)s/%(processName)s] %(name)s: %(message)s"
             ))
-            root.addHandler(handler)
+            records: stdlib_queue.Queue[logging.LogRecord] = stdlib_queue.Queue()
+            root.addHandler(QueueHandler(records))
             root.setLevel(logging.INFO)
+            listener = QueueListener(records, handler)
+            listener.start()
 
-        instance = cls(worker_id, context)
-        instance.run()
+        try:
+            instance = cls(worker_id, context)
+            instance.run()
+        finally:
+            if listener is not None:
+                listener.stop()  # drains pending records
 
     def run(self) -> None:
         """Main worker entry point - sets up async loop and runs."""
         logger.info(f"Worker {self._worker_id} starting")
 
         try:
-            asyncio.run(self._run())
+            asyncio.run(self._run(), loop_factory=_eager_event_loop)
         except Exception as e:
             logger.exception(f"Worker {self._worker_id} fatal error: {e}")
             raise
@@ -133,41 +174,86 @@ class Worker:
         """Send a message to the pool via the multiprocessing queue."""
         self._context.tx.put_nowait(message)
 
+    async def _dequeue(self, count: int, timeout: int = 1) -> list[dict[str, Any]]:
+        """Pop up to ``count`` task payloads, waiting up to ``timeout`` seconds."""
+        if count > 1:
+            return await backend.queue.pop_batch(count, timeout=timeout)
+        data = await backend.queue.pop(timeout=timeout)
+        return [data] if data else []
+
+    async def _process(self, data: dict[str, Any]) -> None:
+        """Execute a single dequeued task payload and release its partition.
+
+        The partition is released on every exit path. The backend's tag on
+        the payload names it even when the payload is not a valid Task or
+        its task is not registered; otherwise it comes from the definition.
+        """
+        partition_key: str | None = data.pop(PARTITION_KEY_FIELD, None)
+        try:
+            task = Task.model_validate(data)
+            try:
+                definition = self._context.tasks[task.task_name]
+            except KeyError:
+                logger.error(
+                    f"Worker {self._worker_id}: task '{task.task_name}' is not registered"
+                )
+                return
+            if partition_key is None:
+                partition_key = definition.get_lock_key(task.context)
+
+            try:
+                logger.info(f"Worker {self._worker_id} processing: {task.task_name}")
+                await definition.execute(task)
+                logger.info(f"Worker {self._worker_id} completed: {task.task_name}")
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                # Catch BaseException so SystemExit/KeyboardInterrupt in user code don't kill the worker.
+                logger.exception(f"Worker {self._worker_id} failed: {task.task_name}")
+                self._send(TaskFailed.from_exception(task, e))
+        except Exception as e:
+            logger.exception(f"Worker {self._worker_id} error: {e}")
+        finally:
+            try:
+                await backend.queue.complete(partition_key)
+            except Exception as e:
+                logger.exception(f"Worker {self._worker_id} error releasing partition: {e}")
+
     async def _run(self) -> None:
-        """Async main loop - dequeue, execute, complete."""
+        """Async main loop - dequeue, execute, complete.
+
+        Keeps up to ``CONF.worker_batch_size`` tasks in flight as coroutines
+        on this worker's event loop. Free slots are refilled with a single
+        batched dequeue, so one slow task never holds up the rest.
+        """
+        in_flight: set[asyncio.Task[None]] = set()
         try:
             while not self._context.shutdown_event.is_set():
                 try:
-                    if data := await backend.queue.pop(timeout=1):
-                        task = Task.model_validate(data)
-                        try:
-                            definition = self._context.tasks[task.task_name]
-                        except KeyError:
-                            logger.error(
-                                f"Worker {self._worker_id}: task '{task.task_name}' is not registered"
-                            )
-                            continue
-                        partition_key = definition.get_lock_key(task.context)
-                    else:
-                        await asyncio.sleep(1)
+                    free = CONF.worker_batch_size - len(in_flight)
+                    # An idle worker blocks in the backend until work arrives;
+                    # a busy one only polls, then waits on its own tasks.
+                    timeout = 0 if in_flight else 1
+                    if free > 0 and (batch := await self._dequeue(free, timeout)):
+                        in_flight.update(asyncio.create_task(self._process(data)) for data in batch)
+                        continue
+
+                    if not in_flight:
                         continue
 
-                    try:
-                        logger.info(f"Worker {self._worker_id} processing: {task.task_name}")
-                        await definition.execute(task)
-                        logger.info(f"Worker {self._worker_id} completed: {task.task_name}")
-                    except asyncio.CancelledError:
-                        raise
-                    except BaseException as e:
-                        # Catch BaseException so SystemExit/KeyboardInterrupt in user code don't kill the worker.
-                        logger.exception(f"Worker {self._worker_id} failed: {task.task_name}")
-                        self._send(TaskFailed.from_exception(task, e))
-                    finally:
-                        await backend.queue.complete(partition_key)
+                    _, in_flight = await asyncio.wait(
+                        in_flight, timeout=1, return_when=asyncio.FIRST_COMPLETED
+                    )
                 except Exception as e:
                     logger.exception(f"Worker {self._worker_id} error: {e}")
                     await asyncio.sleep(1)  # avoid tight loop when backend is unreachable
+
+            # Let tasks that were already dequeued finish before exiting.
+            if in_flight:
+                await asyncio.gather(*in_flight)
         finally:
+            for task in in_flight:
+                task.cancel()
             await backend.close()
 
 
@@ -211,8 +297,58 @@ class _EventHandler:
         return self.tasks[task.task_name].get_lock_key(task.context)
 
     async def _handle(self) -> None:
-        """Handle a single worker event."""
-        message = self.queue.get_nowait()
+        """Handle the worker events currently queued, up to a batch.
+
+        Consecutive activity updates are written in one transaction rather
+        than one per event; any other message flushes the pending updates
+        first so events are still applied in order. A failing event is logged
+        and skipped; the rest of the batch is still handled.
+
+        Raises:
+            queue.Empty: If no events are waiting.
+        """
+        messages: list[Message | ActivityEvent] = [self.queue.get_nowait()]
+        while len(messages) < CONF.activity_batch_size:
+            try:
+                messages.append(self.queue.get_nowait())
+            except stdlib_queue.Empty:
+                break
+
+        updates: list[ActivityUpdated] = []
+        for message in messages:
+            if isinstance(message, ActivityUpdated):
+                updates.append(message)
+                continue
+            await self._write_updates(updates)
+            updates = []
+            try:
+                await self._handle_message(message)
+            except Exception as e:
+                logger.exception(f"Event handler failed on {type(message).__name__}: {e}")
+        await self._write_updates(updates)
+
+    async def _write_updates(self, updates: list[ActivityUpdated]) -> None:
+        """Persist a run of activity updates, batched when the handler supports it.
+
+        If the batched write fails, each update is retried on its own so one
+        bad event doesn't take the others down with it.
+        """
+        if not updates:
+            return
+        if (bulk := getattr(activity.handler, "update_many", None)) is not None:
+            try:
+                await bulk(updates)
+                return
+            except Exception as e:
+                logger.warning(f"Batched activity write failed, writing one by one: {e}")
+        for update in updates:
+            try:
+                await activity.handler(update)
+            except Exception as e:
+                logger.exception(f"Activity update for {update.agent_id} failed: {e}")
+
+    async def _handle_message(self, message: Message | ActivityEvent) -> None:
+        """Handle a single non-update worker event."""
         match message:
             case TaskFailed(task=task, error=error):
                 if task.retry_count < CONF.max_task_retries:
@@ -232,7 +368,7 @@ class _EventHandler:
                         attempts=task.retry_count + 1,
                     )
                     key = backend.format_key(*KEY_RESULT, str(task.agent_id))
-                    await backend.state.set(
+                    await backend.state.set_and_notify(
                         key, backend.serialize(failure), ttl_seconds=CONF.result_ttl
                     )
                     logger.info(
@@ -328,7 +464,11 @@ class Pool:
         if not engine and not database_url:
             raise ValueError("Either engine or database_url must be provided")
 
-        self._engine = engine or create_async_engine(database_url)  # type: ignore[arg-type]
+        self._engine = engine or create_async_engine(
+            database_url,  # type: ignore[arg-type]
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
+        )
         configure_engine(self._engine)
         self._mp_context = mp.get_context("spawn")
         self._worker_queue: mp.Queue = self._mp_context.Queue()
@@ -345,6 +485,8 @@ class Pool:
         name: str,
         *,
         lock_key: str | None = None,
+        run_in_thread: bool = False,
+        silent_start: bool = False,
     ) -> Callable[[TaskHandler], TaskHandler]:
         """Decorator to register a task handler with this pool.
 
@@ -356,6 +498,10 @@ class Pool:
             lock_key: Optional string template for distributed locking. Evaluated
                 against context fields (e.g., "user:{user_id}"). When set, only
                 one task with the same evaluated lock key can run at a time.
+            run_in_thread: Run a sync handler in a thread so it doesn't block
+                the worker's event loop.
+            silent_start: Skip the "started" activity update; only completion
+                or failure is recorded. Useful for short, high-volume tasks.
 
         Returns:
             Decorator function that returns the handler.
@@ -371,7 +517,13 @@ class Pool:
         """
 
         def decorator(func: TaskHandler) -> TaskHandler:
-            self.add_task(name, func, lock_key=lock_key)
+            self.add_task(
+                name,
+                func,
+                lock_key=lock_key,
+                run_in_thread=run_in_thread,
+                silent_start=silent_start,
+            )
             return func
 
         return decorator
@@ -384,6 +536,8 @@ class Pool:
         context_type: type[BaseModel] | None = None,
         result_type: type[BaseModel] | None = None,
         lock_key: str | None = None,
+        run_in_thread: bool = False,
+        silent_start: bool = False,
     ) -> None:
         """Register a task handler with this pool.
 
@@ -397,6 +551,10 @@ class Pool:
             lock_key: Optional string template for distributed locking. Evaluated
                 against context fields (e.g., "user:{user_id}"). When set, only
                 one task with the same evaluated lock key can run at a time.
+            run_in_thread: Run a sync handler in a thread so it doesn't block
+                the worker's event loop.
+            silent_start: Skip the "started" activity update; only completion
+                or failure is recorded. Useful for short, high-volume tasks.
 
         Raises:
             ValueError: If a task with the same name is already registered.
@@ -414,6 +572,8 @@ class Pool:
             context_type=context_type,
             result_type=result_type,
             lock_key=lock_key,
+            run_in_thread=run_in_thread,
+            silent_start=silent_start,
         )
         self._context.tasks[name] = definition
 
@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 import pytest
@@ -66,6 +67,28 @@ def test_normalize_agent_id():
     assert str(result) == uuid_str
     assert isinstance(result, uuid.UUID)
 
+    # Repeated strings are parsed once; invalid ones still raise
+    assert normalize_agent_id(uuid_str) is result
+    with pytest.raises(ValueError):
+        normalize_agent_id("not-a-uuid")
+
+
+async def test_status_stored_as_small_integer(db_session: AsyncSession):
+    """Statuses round-trip through SMALLINT codes."""
+    from sqlalchemy import text
+
+    agent_id = await activity.create(task_name="test_task", message="Queued")
+    await activity.complete(agent_id)
+
+    raw = await db_session.execute(
+        text("SELECT status FROM agentexec_activity_log ORDER BY created_at")
+    )
+    assert [row[0] for row in raw.all()] == [1, 3]
+
+    record = await Activity.get_by_agent_id(db_session, agent_id)
+    assert record.latest_status == Status.COMPLETE
+    assert [log.status for log in record.logs] == [Status.QUEUED, Status.COMPLETE]
+
 
 async def test_database_tables_created():
     """Test that database tables are created correctly."""
@@ -86,6 +109,35 @@ async def test_database_tables_created():
     await engine.dispose()
 
 
+async def test_create_many_activities(db_session: AsyncSession):
+    """Test creating a batch of activities in one call."""
+    agent_ids = await activity.create_many(
+        task_name="batch_task",
+        metadatas=[{"organization_id": "org-A"}, None],
+    )
+
+    assert len(agent_ids) == 2
+    for agent_id, metadata in zip(agent_ids, [{"organization_id": "org-A"}, None]):
+        record = await activity.detail(db_session, agent_id)
+        assert record is not None
+        assert record.agent_type == "batch_task"
+        assert record.metadata == metadata
+        assert [log.status for log in record.logs] == [Status.QUEUED]
+
+
+async def test_update_many_activities(db_session: AsyncSession):
+    """Test appending the same log entry to several activities in one call."""
+    agent_ids = await activity.create_many(task_name="batch_task", metadatas=[None, None])
+
+    await activity.update_many([str(agent_ids[0]), agent_ids[1]], "Halfway", percentage=50)
+
+    for agent_id in agent_ids:
+        record = await activity.detail(db_session, agent_id)
+        assert [log.message for log in record.logs][-1] == "Halfway"
+        assert record.logs[-1].status == Status.RUNNING
+        assert record.logs[-1].percentage == 50
+
+
 async def test_update_activity(db_session: AsyncSession):
     """Test updating an activity with a new log message."""
     # First create an activity
@@ -112,6 +164,125 @@ async def test_update_activity(db_session: AsyncSession):
     assert activity_record.logs[1].percentage == 50
 
 
+async def test_append_logs_batch(db_session: AsyncSession):
+    """Test appending several log entries in one transaction."""
+    first = await activity.create(task_name="a", message="Initial")
+    second = await activity.create(task_name="b", message="Initial")
+
+    await Activity.append_logs(
+        db_session,
+        [
+            (first, "Step 1", Status.RUNNING, 10),
+            (second, "Step 1", Status.RUNNING, 20),
+            (uuid.uuid4(), "Orphan", Status.RUNNING, None),
+            (first, "Step 2", Status.RUNNING, 30),
+        ],
+    )
+
+    first_detail = await activity.detail(db_session, first)
+    second_detail = await activity.detail(db_session, second)
+    assert [log.message for log in first_detail.logs] == ["Initial", "Step 1", "Step 2"]
+    assert first_detail.logs[-1].percentage == 30
+    assert [log.message for log in second_detail.logs] == ["Initial", "Step 1"]
+
+
+async def test_append_logs_resolves_activity_ids_from_cache(db_session: AsyncSession):
+    """Known agents skip the id lookup; unknown ones fall back to the query."""
+    from agentexec.activity import models
+
+    cached = await activity.create(task_name="cached", message="Initial")
+    uncached = await activity.create(task_name="uncached", message="Initial")
+    assert cached in models._activity_id_cache
+    models._activity_id_cache.pop(uncached)
+
+    await Activity.append_logs(
+        db_session,
+        [
+            (cached, "Step", Status.RUNNING, 10),
+            (uncached, "Step", Status.RUNNING, 20),
+        ],
+    )
+
+    assert uncached in models._activity_id_cache
+    for agent_id in (cached, uncached):
+        detail = await activity.detail(db_session, agent_id)
+        assert [log.message for log in detail.logs] == ["Initial", "Step"]
+
+
+async def test_append_logs_skips_deleted_activity_with_cached_id(db_session: AsyncSession, caplog):
+    """A deleted activity whose id is still cached is warned about and skipped."""
+    from sqlalchemy import delete
+
+    from agentexec.activity import models
+
+    deleted = await activity.create(task_name="deleted", message="Initial")
+    kept = await activity.create(task_name="kept", message="Initial")
+    assert deleted in models._activity_id_cache
+
+    await db_session.execute(delete(ActivityLog))
+    await db_session.execute(delete(Activity).where(Activity.agent_id == deleted))
+    await db_session.commit()
+
+    await Activity.append_logs(
+        db_session,
+        [
+            (deleted, "Step", Status.RUNNING, 10),
+            (kept, "Step", Status.RUNNING, 20),
+        ],
+    )
+
+    assert deleted not in models._activity_id_cache
+    assert f"No activity record for agent_id {deleted}" in caplog.text
+    assert await Activity.get_by_agent_id(db_session, deleted) is None
+    detail = await activity.detail(db_session, kept)
+    assert [log.message for log in detail.logs] == ["Step"]
+
+
+async def test_get_by_agent_id_repeat_lookup_uses_identity_map(db_session: AsyncSession):
+    """A second lookup in the same session is answered without SQL."""
+    from sqlalchemy import event
+
+    agent_id = await activity.create(task_name="test_task", message="Initial")
+    first = await Activity.get_by_agent_id(db_session, agent_id)
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        again = await Activity.get_by_agent_id(db_session, str(agent_id))
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert again is first
+    assert [log.message for log in again.logs] == ["Initial"]
+    assert statements == []
+
+
+async def test_updated_at_stamped_by_database_on_update(db_session: AsyncSession):
+    """Log appends bump updated_at through the column's server-side onupdate."""
+    from sqlalchemy import event
+
+    agent_id = await activity.create(task_name="test_task", message="Initial")
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        await activity.update(agent_id, "Working", percentage=10)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    (update_sql,) = [sql for sql in statements if sql.startswith("UPDATE agentexec_activity ")]
+    assert "updated_at=CURRENT_TIMESTAMP" in update_sql
+
+    detail = await activity.detail(db_session, agent_id)
+    assert detail.updated_at.replace(tzinfo=None) >= detail.created_at.replace(
+        tzinfo=None, microsecond=0
+    )
+
+
 async def test_update_activity_with_custom_status(db_session: AsyncSession):
     """Test updating an activity with a custom status."""
     agent_id = await activity.create(
@@ -132,6 +303,26 @@ async def test_update_activity_with_custom_status(db_session: AsyncSession):
     assert latest_log.status == Status.RUNNING
 
 
+async def test_progress_buffer_coalesces_updates(db_session: AsyncSession):
+    """Updates within one flush interval collapse to the latest one."""
+    agent_id = await activity.create(task_name="test_task", message="Initial")
+
+    async with activity.ProgressBuffer(agent_id, flush_interval=60) as progress:
+        progress.update("Extracting text...", percentage=25)
+        await asyncio.sleep(0)  # let the flusher emit the first update
+        progress.update("Analyzing content...", percentage=50)
+        progress.update("Generating summary...", percentage=75)
+
+    activity_record = await Activity.get_by_agent_id(db_session, agent_id)
+    assert activity_record is not None
+    assert [log.message for log in activity_record.logs] == [
+        "Initial",
+        "Extracting text...",
+        "Generating summary...",
+    ]
+    assert activity_record.logs[-1].percentage == 75
+
+
 async def test_complete_activity(db_session: AsyncSession):
     """Test marking an activity as complete."""
     agent_id = await activity.create(
@@ -238,6 +429,28 @@ async def test_cancel_pending_activities(db_session: AsyncSession):
     assert complete_record.logs[-1].status == Status.COMPLETE  # Not changed
 
 
+async def test_cancel_pending_updates_with_returning(db_session: AsyncSession):
+    """Canceling takes the ids from the UPDATE itself, with no SELECT first."""
+    from sqlalchemy import event
+
+    for i in range(3):
+        await activity.create(task_name=f"task_{i}", message="Waiting")
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        assert await activity.cancel_pending(session=db_session) == 3
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert statements[0].startswith("UPDATE agentexec_activity SET")
+    assert "RETURNING" in statements[0]
+    assert not any(sql.startswith("SELECT") for sql in statements)
+    assert await activity.count_active(session=db_session) == 0
+
+
 async def test_list_activities(db_session: AsyncSession):
     """Test listing activities with pagination."""
     # Create several activities
@@ -271,6 +484,134 @@ async def test_list_activities_second_page(db_session: AsyncSession):
     assert result.page == 2
 
 
+async def test_list_total_comes_from_page_query(db_session: AsyncSession):
+    """The total rides on the page rows; only a page past the end re-counts."""
+    from sqlalchemy import event
+
+    for i in range(5):
+        await activity.create(task_name=f"task_{i}", message=f"Message {i}")
+
+    statements: list[str] = []
+    engine = db_session.bind.sync_engine
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        result = await activity.list(db_session, page=1, page_size=3)
+        past_end = await activity.list(db_session, page=3, page_size=3)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert result.total == 5
+    assert past_end.items == []
+    assert past_end.total == 5
+    assert len(statements) == 3
+    assert "OVER ()" in statements[0]
+
+
+async def test_count_active_and_list_order_use_latest_log(db_session: AsyncSession):
+    """Test that status comes from each activity's most recent log entry."""
+    queued = await activity.create(task_name="queued", message="Queued")
+    running = await activity.create(task_name="running", message="Queued")
+    done = await activity.create(task_name="done", message="Queued")
+    await activity.update(running, "Working", percentage=10)
+    await activity.update(done, "Working", percentage=10)
+    await activity.complete(done)
+
+    assert await activity.count_active() == 2
+
+    result = await activity.list(db_session)
+    assert [item.agent_id for item in result.items] == [running, queued, done]
+    assert result.items[0].latest_log_message == "Working"
+    assert result.items[2].status == Status.COMPLETE
+
+
+async def test_count_active_reused_until_ttl_or_local_write(
+    db_session: AsyncSession, monkeypatch
+):
+    """Counts are reused within the TTL, and a status write in this process refreshes them."""
+    from sqlalchemy import update as sa_update
+
+    from agentexec.config import CONF
+
+    monkeypatch.setattr(CONF, "activity_count_ttl", 60.0)
+    agent_id = await activity.create(task_name="task", message="Queued")
+    assert await activity.count_active() == 1
+
+    # A write that bypasses this process's write path isn't seen until the TTL lapses
+    await db_session.execute(sa_update(Activity).values(latest_status=Status.COMPLETE))
+    await db_session.commit()
+    assert await activity.count_active() == 1
+
+    await activity.complete(agent_id)
+    assert await activity.count_active() == 0
+
+    monkeypatch.setattr(CONF, "activity_count_ttl", 0)
+    await activity.create(task_name="task", message="Queued")
+    await db_session.execute(sa_update(Activity).values(latest_status=Status.COMPLETE))
+    await db_session.commit()
+    assert await activity.count_active() == 0
+
+
+async def test_count_active_cache_is_per_engine(db_session: AsyncSession, monkeypatch):
+    """Cached counts for one database are never served for another."""
+    from agentexec.config import CONF
+
+    monkeypatch.setattr(CONF, "activity_count_ttl", 60.0)
+    await activity.create(task_name="task", message="Queued")
+    assert await activity.count_active(db_session) == 1
+
+    other_engine = create_async_engine("sqlite+aiosqlite:///:memory:", echo=False)
+    async with other_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    try:
+        async with async_sessionmaker(bind=other_engine)() as other_session:
+            assert await Activity.get_active_count(other_session) == 0
+            assert await Activity.get_pending_ids(other_session) == []
+    finally:
+        await other_engine.dispose()
+
+    assert await activity.count_active(db_session) == 1
+
+
+async def test_list_after_walks_all_pages(db_session: AsyncSession):
+    """Test cursor pagination returns every activity once, newest first."""
+    created = [
+        await activity.create(task_name=f"task_{i}", message=f"Message {i}")
+        for i in range(5)
+    ]
+
+    first = await activity.list_after(page_size=3)
+    assert len(first.items) == 3
+    assert first.next_cursor is not None
+
+    second = await activity.list_after(cursor=first.next_cursor, page_size=3)
+    assert len(second.items) == 2
+    assert second.next_cursor is None
+
+    seen = [item.agent_id for item in first.items + second.items]
+    assert sorted(seen) == sorted(created)
+    assert seen[0] == created[-1]
+
+
+async def test_list_after_invalid_cursor(db_session: AsyncSession):
+    """Test a malformed cursor is rejected."""
+    with pytest.raises(ValueError):
+        await activity.list_after(cursor="not-a-cursor")
+
+
+async def test_stream_logs(db_session: AsyncSession):
+    """Test streaming log entries in order."""
+    agent_id = await activity.create(task_name="streamed", message="Initial")
+    await activity.update(agent_id, "Processing", percentage=50)
+    await activity.complete(agent_id)
+
+    logs = [log async for log in activity.stream_logs(agent_id=agent_id)]
+
+    assert [log.message for log in logs] == ["Initial", "Processing", "Agent completed"]
+    assert logs[-1].status == Status.COMPLETE
+    assert [log async for log in activity.stream_logs(agent_id=uuid.uuid4())] == []
+
+
 async def test_detail_activity(db_session: AsyncSession):
     """Test getting activity detail with all logs."""
     agent_id = await activity.create(
@@ -437,6 +778,80 @@ async def test_list_activities_with_multiple_metadata_filters(db_session: AsyncS
     assert result.total == 1
 
 
+async def test_list_statement_reused_across_filter_values(db_session: AsyncSession):
+    """Filters with the same keys share one cached statement but bind their own values."""
+    from agentexec.activity.models import _list_stmt
+
+    await activity.create(task_name="a", message="A", metadata={"organization_id": "org-A"})
+    await activity.create(task_name="b", message="B", metadata={"organization_id": "org-B"})
+
+    result_a = await activity.list(db_session, metadata_filter={"organization_id": "org-A"})
+    result_b = await activity.list(db_session, metadata_filter={"organization_id": "org-B"})
+
+    assert [item.agent_type for item in result_a.items] == ["a"]
+    assert [item.agent_type for item in result_b.items] == ["b"]
+    keys = (("organization_id", True),)
+    assert _list_stmt(keys) is _list_stmt(keys)
+
+
+async def test_stream_list_yields_all_newest_first(db_session: AsyncSession):
+    """stream_list walks every matching activity newest first."""
+    agent_ids = [
+        await activity.create(task_name=f"task_{i}", message="Queued", metadata={"org": "A"})
+        for i in range(3)
+    ]
+    await activity.create(task_name="other", message="Queued", metadata={"org": "B"})
+
+    items = [item async for item in activity.stream_list(metadata_filter={"org": "A"})]
+
+    assert [item.agent_id for item in items] == agent_ids[::-1]
+
+
+async def test_detail_matches_orm_loaded_activity(db_session: AsyncSession):
+    """The JSON-aggregated detail equals validating the ORM object with its logs."""
+    from agentexec.activity.schemas import ActivityDetailSchema
+
+    agent_id = await activity.create(
+        task_name="detail_task", message="Queued", metadata={"organization_id": "org-A"}
+    )
+    await activity.update(agent_id, "Working", percentage=40)
+    await activity.complete(agent_id)
+
+    detail = await activity.detail(db_session, agent_id)
+    record = await Activity.get_by_agent_id(db_session, agent_id)
+    expected = ActivityDetailSchema.model_validate(record)
+
+    assert detail == expected
+    assert [log.status for log in detail.logs] == [
+        Status.QUEUED,
+        Status.RUNNING,
+        Status.COMPLETE,
+    ]
+
+
+async def test_get_detail_orders_logs_oldest_first(db_session: AsyncSession):
+    """Logs come back by created_at whatever order the rows were inserted in."""
+    from datetime import UTC, datetime, timedelta
+
+    agent_id = await activity.create(task_name="task", message="Queued")
+    record = await Activity.get_by_agent_id(db_session, agent_id)
+    start = record.logs[0].created_at.replace(tzinfo=UTC)
+    for minutes, message in ((3, "Third"), (1, "First"), (2, "Second")):
+        db_session.add(
+            ActivityLog(
+                activity_id=record.id,
+                message=message,
+                status=Status.RUNNING,
+                created_at=start + timedelta(minutes=minutes),
+            )
+        )
+    await db_session.commit()
+
+    detail = await Activity.get_detail(db_session, agent_id)
+
+    assert [log["message"] for log in detail["logs"]] == ["Queued", "First", "Second", "Third"]
+
+
 async def test_detail_activity_with_metadata(db_session: AsyncSession):
     """Test getting activity detail includes metadata."""
     agent_id = await activity.create(
@@ -38,6 +38,11 @@ class TestConfig:
         config = Config()
         assert config.redis_pool_size == 10
 
+    def test_default_redis_pool_size_per_worker(self):
+        """Test workers use the main pool size unless overridden."""
+        config = Config()
+        assert config.redis_pool_size_per_worker is None
+
     def test_default_redis_pool_timeout(self):
         """Test default Redis pool timeout."""
         config = Config()
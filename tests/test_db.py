@@ -37,3 +37,120 @@ def test_get_session_without_configure_raises():
             get_session()
     finally:
         db_module._session_factory = old_factory
+
+
+def test_json_serializer_round_trip():
+    """json_serializer/json_deserializer round-trip metadata dicts."""
+    from agentexec.core.db import json_deserializer, json_serializer
+
+    value = {"organization_id": "org-1", "tags": ["a", "b"], "n": 3}
+    encoded = json_serializer(value)
+    assert isinstance(encoded, str)
+    assert json_deserializer(encoded) == value
+
+
+def test_metadata_filter_uses_jsonb_containment_on_postgres():
+    """On PostgreSQL metadata filters compile to @> so the GIN index applies."""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    from agentexec.activity.models import Activity, _count_stmt
+
+    sql = str(_count_stmt((("organization_id", True),)).compile(dialect=postgresql.dialect()))
+    assert "@> jsonb_build_object" in sql
+
+    keys = (("organization_id", True), ("user_id", True))
+    sql = str(_count_stmt(keys).compile(dialect=postgresql.dialect()))
+    assert sql.count("@>") == 1
+    assert "%(filter_0)s" in sql and "%(filter_1)s" in sql
+
+    (gin,) = [ix for ix in Activity.__table__.indexes if ix.name.endswith("activity_metadata")]
+    ddl = str(CreateIndex(gin).compile(dialect=postgresql.dialect()))
+    assert "USING gin (metadata jsonb_path_ops)" in ddl
+
+
+def test_metadata_filter_compares_non_string_values_as_text_on_postgres():
+    """Non-string filter values skip containment, which would only match JSON strings."""
+    from sqlalchemy.dialects import postgresql
+
+    from agentexec.activity.models import _count_stmt, _metadata_params
+
+    keys, params = _metadata_params({"attempt": 3, "org": "org-1"})
+    assert keys == (("attempt", False), ("org", True))
+    assert params == {"filter_0": "3", "filter_1": "org-1"}
+
+    sql = str(_count_stmt(keys).compile(dialect=postgresql.dialect()))
+    assert sql.count("@>") == 1
+    assert "metadata ->> %(metadata_1)s" in sql
+    assert "CAST(%(filter_1)s::VARCHAR AS TEXT)" in sql
+
+    keys, _ = _metadata_params({"attempt": 3})
+    sql = str(_count_stmt(keys).compile(dialect=postgresql.dialect()))
+    assert "@>" not in sql
+
+
+def test_activity_log_foreign_key_honors_table_prefix():
+    """A custom table_prefix produces a log table whose FK targets the prefixed activity table."""
+    import os
+    import subprocess
+    import sys
+
+    code = (
+        "from sqlalchemy import create_engine, inspect\n"
+        "from agentexec.activity.models import Base\n"
+        "engine = create_engine('sqlite://')\n"
+        "Base.metadata.create_all(engine)\n"
+        "fks = inspect(engine).get_foreign_keys('custom_activity_log')\n"
+        "print(fks[0]['referred_table'])\n"
+    )
+    env = {**os.environ, "AGENTEXEC_TABLE_PREFIX": "custom_"}
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+    )
+    assert result.stdout.strip() == "custom_activity"
+
+
+def test_append_logs_fuses_insert_and_update_on_postgres():
+    """On PostgreSQL, log appends are one UPDATE carrying the INSERT as a CTE."""
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    from agentexec.activity.models import Status, _append_logs_pg_stmt
+
+    compiled = _append_logs_pg_stmt().compile(dialect=asyncpg.dialect())
+    sql = str(compiled)
+    assert sql.startswith("WITH inserted_logs AS \n(INSERT INTO agentexec_activity_log")
+    assert "UPDATE agentexec_activity SET updated_at=now()" in sql
+    assert "FROM unnest(" in sql
+    assert compiled._bind_processors["log_statuses"]([Status.RUNNING, Status.ERROR]) == [2, 4]
+
+
+def test_active_queries_match_partial_index_predicate():
+    """Active-status filters inline their codes so the partial index applies."""
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    from agentexec.activity.models import Activity, _active_count_stmt
+
+    (active,) = [ix for ix in Activity.__table__.indexes if ix.name.endswith("activity_active")]
+    ddl = str(CreateIndex(active).compile(dialect=postgresql.dialect()))
+    assert ddl.endswith("(agent_id) WHERE latest_status IN (1, 2)")
+
+    sql = str(
+        _active_count_stmt().compile(
+            dialect=postgresql.dialect(), compile_kwargs={"render_postcompile": True}
+        )
+    )
+    assert "latest_status IN (2, 1)" in sql
+
+
+def test_cancel_pending_is_one_statement_on_postgres():
+    """On PostgreSQL, canceling writes logs from the UPDATE's RETURNING rows."""
+    from sqlalchemy.dialects.postgresql import asyncpg
+
+    from agentexec.activity.models import _cancel_pending_pg_stmt
+
+    sql = str(_cancel_pending_pg_stmt().compile(dialect=asyncpg.dialect()))
+    assert sql.startswith("WITH canceled AS \n(UPDATE agentexec_activity SET")
+    assert "RETURNING agentexec_activity.id" in sql
+    assert "INSERT INTO agentexec_activity_log" in sql
+    assert "FROM canceled" in sql
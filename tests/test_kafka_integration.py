@@ -39,6 +39,7 @@ if _skip_reason:
 
 
 from agentexec.state import backend  # noqa: E402
+from agentexec.state.base import PARTITION_KEY_FIELD  # noqa: E402
 from agentexec.state.kafka import Backend as KafkaBackend  # noqa: E402
 
 _kb: KafkaBackend = backend  # type: ignore[assignment]
@@ -132,8 +133,31 @@ class TestQueue:
         assert result is not None
         assert result["task_name"] == "keyed_task"
 
+    async def test_pop_batch_holds_back_same_key_until_complete(self):
+        """Two tasks with one partition key never run at the same time."""
+        import json
+
+        key = f"user-{uuid.uuid4()}"
+        for i in range(2):
+            task_data = {"task_name": "locked", "context": {"i": i}, "agent_id": str(uuid.uuid4())}
+            await _kb.queue.push(json.dumps(task_data), partition_key=key)
+
+        first = []
+        for _ in range(10):
+            first = [t for t in await _kb.queue.pop_batch(10, timeout=2) if t["task_name"] == "locked"]
+            if first:
+                break
+        assert [t["context"]["i"] for t in first] == [0]
+        assert first[0][PARTITION_KEY_FIELD] == key
+        assert not [t for t in await _kb.queue.pop_batch(10, timeout=1) if t["task_name"] == "locked"]
+
+        await _kb.queue.complete(key)
+        second = await _kb.queue.pop_batch(10, timeout=5)
+        assert [t["context"]["i"] for t in second if t["task_name"] == "locked"] == [1]
+        await _kb.queue.complete(key)
+
     async def test_complete_is_noop(self):
-        """complete() is a no-op for Kafka (partition assignment handles it)."""
+        """complete() tolerates keys that aren't in flight, and no key at all."""
         await _kb.queue.complete("any-key")
         await _kb.queue.complete(None)
 
@@ -97,6 +97,7 @@ def test_base_class_registration(pipeline) -> None:
             return IntermediateA(a_value=ctx.value)
 
     assert pipeline._user_pipeline_class is MyPipeline
+    assert pipeline.name == MyPipeline._pipeline_name == "my_pipeline"
 
 
 async def test_pipeline_run_executes_steps_in_order(pipeline) -> None:
@@ -168,3 +169,25 @@ def test_step_ordering_with_string_keys(pipeline) -> None:
 
     assert steps[0].name == "first_step"
     assert steps[1].name == "second_step"
+
+
+async def test_pipeline_validates_once_per_step_set(pipeline, monkeypatch) -> None:
+    """Repeat runs reuse the sorted steps and skip re-validation."""
+
+    class TwoStepPipeline(pipeline.Base):
+        @pipeline.step(0)
+        async def first(self, ctx: InputContext) -> IntermediateA:
+            return IntermediateA(a_value=ctx.value)
+
+        @pipeline.step(1)
+        async def second(self, x: IntermediateA) -> FinalResult:
+            return FinalResult(result=str(x.a_value))
+
+    await pipeline.run(InputContext(value=1))
+    sorted_steps = pipeline._sorted_steps
+    monkeypatch.setattr("agentexec.pipeline.get_origin", MagicMock(side_effect=AssertionError))
+
+    result = await pipeline.run(InputContext(value=2))
+
+    assert result.result == "2"
+    assert pipeline._sorted_steps is sorted_steps
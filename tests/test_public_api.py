@@ -44,6 +44,27 @@ def test_runner_imports() -> None:
     assert OpenAIRunner is not None
 
 
+def test_import_does_not_load_worker_or_agents() -> None:
+    """Test that importing the package defers the pool and runner modules."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, agentexec; "
+        "print(any(m in sys.modules for m in ('agents', 'agentexec.worker', 'agentexec.runners.openai')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_unknown_attribute_raises() -> None:
+    """Test that the lazy attribute hook only resolves known names."""
+    with pytest.raises(AttributeError):
+        ax.DoesNotExist
+
+
 def test_runner_initialization() -> None:
     """Test that OpenAIRunner can be initialized."""
     pytest.importorskip("agents")
@@ -6,7 +6,7 @@ from fakeredis import aioredis as fake_aioredis
 from pydantic import BaseModel
 
 import agentexec as ax
-from agentexec.core.queue import Priority, enqueue
+from agentexec.core.queue import Priority, enqueue, enqueue_many
 from agentexec.state import backend
 
 
@@ -170,3 +170,58 @@ async def test_multiple_enqueue_fifo_order(fake_redis, mock_activity_create) ->
         result = await backend.queue.pop(timeout=1)
         assert result is not None
         assert result["task_name"] == f"task_{i}"
+
+
+async def test_enqueue_many_fifo_order(fake_redis, monkeypatch) -> None:
+    """Test that enqueue_many pushes every task and preserves FIFO order."""
+    received: list[list] = []
+
+    async def mock_create_many(task_name, metadatas, message):
+        received.append(metadatas)
+        return [uuid.uuid4() for _ in metadatas]
+
+    monkeypatch.setattr("agentexec.core.task.activity.create_many", mock_create_many)
+
+    contexts = [SampleContext(message=f"msg{i}") for i in range(3)]
+    metadata = [{"org": "a"}, None, {"org": "b"}]
+    tasks = await enqueue_many("batch_task", contexts, metadata=metadata)
+
+    assert received == [metadata]
+    assert [t.context["message"] for t in tasks] == ["msg0", "msg1", "msg2"]
+    for task in tasks:
+        result = await backend.queue.pop(timeout=1)
+        assert result is not None
+        assert result["agent_id"] == str(task.agent_id)
+
+
+async def test_enqueue_many_repeated_context_dumped_once(fake_redis, monkeypatch) -> None:
+    """Test that one context reused across a fan-out is serialized once."""
+
+    async def mock_create_many(task_name, metadatas, message):
+        return [uuid.uuid4() for _ in metadatas]
+
+    monkeypatch.setattr("agentexec.core.task.activity.create_many", mock_create_many)
+
+    context = SampleContext(message="shared")
+    dumps = 0
+    original = SampleContext.model_dump
+
+    def counting_dump(self, **kwargs):
+        nonlocal dumps
+        dumps += 1
+        return original(self, **kwargs)
+
+    monkeypatch.setattr(SampleContext, "model_dump", counting_dump)
+    tasks = await enqueue_many("batch_task", [context] * 3)
+
+    assert dumps == 1
+    assert [t.context["message"] for t in tasks] == ["shared"] * 3
+    assert tasks[0].context is not tasks[1].context
+
+
+async def test_enqueue_many_metadata_length_mismatch(fake_redis) -> None:
+    """Test that misaligned metadata is rejected before anything is written."""
+    with pytest.raises(ValueError):
+        await enqueue_many("batch_task", [SampleContext(message="a")], metadata=[None, None])
+
+    assert await fake_redis.llen(ax.CONF.queue_prefix) == 0
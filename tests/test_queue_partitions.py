@@ -10,6 +10,7 @@ from pydantic import BaseModel
 import agentexec as ax
 from agentexec.core.queue import Priority
 from agentexec.state import backend
+from agentexec.state.base import PARTITION_KEY_FIELD
 
 
 def _task_json(task_name: str = "test", **overrides) -> str:
@@ -60,6 +61,7 @@ class TestPartitionLocking:
         result = await backend.queue.pop(timeout=1)
 
         assert result is not None
+        assert result[PARTITION_KEY_FIELD] == "user:42"
         lock_key = f"{ax.CONF.queue_prefix}:user:42:lock".encode()
         assert await fake_redis.exists(lock_key)
 
@@ -172,3 +174,47 @@ class TestMultiPartitionDequeue:
         result = await backend.queue.pop(timeout=1)
         assert result is not None
         assert result["task_name"] == "high"
+
+
+class TestBatchDequeue:
+    async def test_pop_batch_drains_default_queue(self, fake_redis):
+        """pop_batch takes up to ``count`` tasks from the default queue in order."""
+        for name in ("t1", "t2", "t3"):
+            await backend.queue.push(_task_json(name))
+
+        results = await backend.queue.pop_batch(2, timeout=1)
+        assert [r["task_name"] for r in results] == ["t1", "t2"]
+        assert await fake_redis.llen(ax.CONF.queue_prefix) == 1
+
+    async def test_pop_batch_one_task_per_partition(self, fake_redis):
+        """A batch never holds two tasks from the same partition."""
+        await backend.queue.push(_task_json("first"), partition_key="user:1")
+        await backend.queue.push(_task_json("second"), partition_key="user:1")
+        await backend.queue.push(_task_json("other"), partition_key="user:2")
+        await backend.queue.push(_task_json("default_task"))
+
+        results = await backend.queue.pop_batch(10, timeout=1)
+        assert sorted(r["task_name"] for r in results) == ["default_task", "first", "other"]
+
+    async def test_pop_batch_empty_queue(self, fake_redis):
+        assert await backend.queue.pop_batch(5, timeout=1) == []
+
+    async def test_pop_batch_zero_timeout_does_not_wait(self, fake_redis):
+        import time
+
+        start = time.monotonic()
+        assert await backend.queue.pop_batch(5, timeout=0) == []
+        assert time.monotonic() - start < 0.5
+
+    async def test_pop_batch_wakes_for_tasks_pushed_while_waiting(self, fake_redis):
+        """An idle pop blocks on the default queue and takes the arrivals in one call."""
+        import asyncio
+
+        async def push_later():
+            await asyncio.sleep(0.1)
+            await fake_redis.lpush(ax.CONF.queue_prefix, _task_json("a"), _task_json("b"))
+
+        pusher = asyncio.create_task(push_later())
+        results = await backend.queue.pop_batch(5, timeout=2)
+        await pusher
+        assert [r["task_name"] for r in results] == ["a", "b"]
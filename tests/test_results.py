@@ -3,10 +3,19 @@ import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from fakeredis import aioredis as fake_aioredis
 from pydantic import BaseModel
 
 import agentexec as ax
-from agentexec.core.results import TaskFailedError, TaskFailure, gather, get_result, _get_result
+from agentexec.core.results import (
+    TaskFailedError,
+    TaskFailure,
+    gather,
+    get_result,
+    _get_result,
+    _poll_delays,
+)
+from agentexec.state import KEY_RESULT, backend
 
 
 class SampleContext(BaseModel):
@@ -24,7 +33,20 @@ class ComplexResult(BaseModel):
 
 
 @pytest.fixture
-def mock_get_result():
+async def fake_redis(monkeypatch):
+    fake = fake_aioredis.FakeRedis(decode_responses=False)
+    monkeypatch.setattr(backend, "_client", fake)
+    yield fake
+    await backend.state.close_watchers()
+
+
+async def store_result(task: ax.Task, result: BaseModel) -> None:
+    key = backend.format_key(*KEY_RESULT, str(task.agent_id))
+    await backend.state.set(key, backend.serialize(result))
+
+
+@pytest.fixture
+def mock_get_result(fake_redis):
     """Mock the internal _get_result function."""
     with patch("agentexec.core.results._get_result") as mock:
         yield mock
@@ -45,7 +67,8 @@ async def test_get_result_returns_deserialized_data(mock_get_result) -> None:
     mock_get_result.assert_called_once_with(task.agent_id)
 
 
-async def test_get_result_polls_until_available(mock_get_result) -> None:
+async def test_get_result_polls_until_available(mock_get_result, monkeypatch) -> None:
+    monkeypatch.setattr(backend.state, "watch_interval", 0.05)
     task = ax.Task(
         task_name="test_task",
         context={"message": "test"},
@@ -70,6 +93,69 @@ async def test_get_result_polls_until_available(mock_get_result) -> None:
     assert call_count == 3
 
 
+async def test_poll_delays_back_off_with_jitter(fake_redis) -> None:
+    """Re-reads start at 0.1s and double to an absolute 8s cap, jittered below it."""
+    async with backend.state.watch("key"):
+        assert backend.state.notifying
+        delays = _poll_delays()
+        waits = [next(delays) for _ in range(10)]
+
+    for wait, base in zip(waits, [0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4, 8.0, 8.0, 8.0]):
+        assert base * 0.9 <= wait <= base
+
+
+def test_poll_delays_fixed_without_notifications(monkeypatch) -> None:
+    """With no live notification channel, re-reads keep the fixed poll interval."""
+    monkeypatch.setattr(backend.state, "watch_interval", 1.0)
+    monkeypatch.setattr(backend.state, "poll_interval", 0.25)
+    assert not backend.state.notifying
+
+    delays = _poll_delays()
+    assert [next(delays) for _ in range(4)] == [0.25] * 4
+
+
+async def test_subscribe_failure_falls_back_to_polling(fake_redis, monkeypatch) -> None:
+    """A failed pub/sub subscribe doesn't fail the wait; the result is found by polling."""
+    monkeypatch.setattr(backend.state, "poll_interval", 0.05)
+    task = ax.Task(task_name="test_task", context={}, agent_id=uuid.uuid4())
+    pubsub = fake_redis.pubsub
+
+    def failing_pubsub(**kwargs):
+        ps = pubsub(**kwargs)
+        ps.subscribe = AsyncMock(side_effect=ConnectionError("subscribe refused"))
+        return ps
+
+    monkeypatch.setattr(fake_redis, "pubsub", failing_pubsub)
+
+    async with backend.state.watch("key") as written:
+        assert not backend.state.notifying
+        assert backend.state._subscribed is None
+        assert next(_poll_delays()) == 0.05
+
+    async def finish_later():
+        await asyncio.sleep(0.1)
+        await store_result(task, SampleResult(status="done", value=3))
+
+    writer = asyncio.create_task(finish_later())
+    result = await get_result(task, timeout=5)
+    await writer
+
+    assert result == SampleResult(status="done", value=3)
+    assert not written.is_set()
+
+
+async def test_listener_failure_wakes_watchers(fake_redis) -> None:
+    """If the pub/sub listener dies, watchers are woken and drop to fixed polling."""
+    async with backend.state.watch("key") as written:
+        pubsub = backend.state._pubsub
+        pubsub.get_message = AsyncMock(side_effect=ConnectionError("connection lost"))
+        await backend.state.notify("other")
+
+        await asyncio.wait_for(written.wait(), 5)
+        assert not backend.state.notifying
+        assert next(_poll_delays()) == backend.state.poll_interval
+
+
 async def test_get_result_timeout(mock_get_result) -> None:
     task = ax.Task(
         task_name="test_task",
@@ -82,7 +168,94 @@ async def test_get_result_timeout(mock_get_result) -> None:
         await get_result(task, timeout=1)
 
 
-async def test_gather_multiple_tasks(mock_get_result) -> None:
+async def test_get_result_wakes_on_notify(fake_redis, monkeypatch) -> None:
+    """A waiter re-reads the result as soon as the writer notifies, not on a poll."""
+    monkeypatch.setattr(backend.state, "watch_interval", 5.0)
+    task = ax.Task(task_name="test_task", context={}, agent_id=uuid.uuid4())
+    key = backend.format_key(*KEY_RESULT, str(task.agent_id))
+
+    async def finish_later():
+        await asyncio.sleep(0.1)
+        await backend.state.set(key, backend.serialize(SampleResult(status="done", value=1)))
+        await backend.state.notify(key)
+
+    writer = asyncio.create_task(finish_later())
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await get_result(task, timeout=10)
+    await writer
+
+    assert result == SampleResult(status="done", value=1)
+    assert loop.time() - start < 1.0
+
+
+async def test_set_and_notify_stores_and_wakes(fake_redis, monkeypatch) -> None:
+    """Writing a result and announcing it happen in one call."""
+    monkeypatch.setattr(backend.state, "watch_interval", 5.0)
+    task = ax.Task(task_name="test_task", context={}, agent_id=uuid.uuid4())
+    key = backend.format_key(*KEY_RESULT, str(task.agent_id))
+
+    async def finish_later():
+        await asyncio.sleep(0.1)
+        await backend.state.set_and_notify(
+            key, backend.serialize(SampleResult(status="done", value=2)), ttl_seconds=60
+        )
+
+    writer = asyncio.create_task(finish_later())
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    result = await get_result(task, timeout=10)
+    await writer
+
+    assert result == SampleResult(status="done", value=2)
+    assert loop.time() - start < 1.0
+    assert 0 < await fake_redis.ttl(key) <= 60
+
+
+async def test_concurrent_waiters_share_one_subscription(fake_redis) -> None:
+    """Waiting on many tasks uses a single subscriber, whatever the count."""
+    tasks = [ax.Task(task_name="t", context={}, agent_id=uuid.uuid4()) for _ in range(20)]
+    waiting = asyncio.ensure_future(gather(*tasks, timeout=10))
+    await asyncio.sleep(0.1)
+
+    channel = backend.state._channel
+    assert await fake_redis.pubsub_numsub(channel) == [(channel.encode(), 1)]
+
+    for i, task in enumerate(tasks):
+        key = backend.format_key(*KEY_RESULT, str(task.agent_id))
+        await backend.state.set(key, backend.serialize(SampleResult(status="ok", value=i)))
+        await backend.state.notify(key)
+
+    results = await waiting
+    assert [r.value for r in results] == list(range(20))
+
+
+async def test_gather_reads_pending_results_with_one_mget(fake_redis, monkeypatch) -> None:
+    """Each wake-up re-reads only the still-pending keys, in a single MGET."""
+    monkeypatch.setattr(backend.state, "watch_interval", 0.05)
+    tasks = [ax.Task(task_name="t", context={}, agent_id=uuid.uuid4()) for _ in range(3)]
+    await store_result(tasks[0], SampleResult(status="ok", value=0))
+
+    calls: list[list[str]] = []
+    mget = fake_redis.mget
+
+    async def recording_mget(keys):
+        calls.append(list(keys))
+        values = await mget(keys)
+        if len(calls) == 2:
+            for i, task in enumerate(tasks[1:], start=1):
+                await store_result(task, SampleResult(status="ok", value=i))
+        return values
+
+    monkeypatch.setattr(fake_redis, "mget", recording_mget)
+
+    results = await gather(*tasks, timeout=10)
+
+    assert [r.value for r in results] == [0, 1, 2]
+    assert [len(keys) for keys in calls] == [3, 2, 2]
+
+
+async def test_gather_multiple_tasks(fake_redis) -> None:
     task1 = ax.Task(
         task_name="task1",
         context={"message": "test1"},
@@ -97,14 +270,8 @@ async def test_gather_multiple_tasks(mock_get_result) -> None:
     result1 = SampleResult(status="task1", value=100)
     result2 = SampleResult(status="task2", value=200)
 
-    async def mock_result(agent_id):
-        if agent_id == task1.agent_id:
-            return result1
-        elif agent_id == task2.agent_id:
-            return result2
-        return None
-
-    mock_get_result.side_effect = mock_result
+    await store_result(task1, result1)
+    await store_result(task2, result2)
 
     results = await gather(task1, task2)
 
@@ -112,7 +279,7 @@ async def test_gather_multiple_tasks(mock_get_result) -> None:
     assert len(results) == 2
 
 
-async def test_gather_single_task(mock_get_result) -> None:
+async def test_gather_single_task(fake_redis) -> None:
     task = ax.Task(
         task_name="single_task",
         context={"message": "test"},
@@ -120,14 +287,14 @@ async def test_gather_single_task(mock_get_result) -> None:
     )
 
     expected = SampleResult(status="single", value=1)
-    mock_get_result.return_value = expected
+    await store_result(task, expected)
 
     results = await gather(task)
 
     assert results == (expected,)
 
 
-async def test_gather_preserves_order(mock_get_result) -> None:
+async def test_gather_preserves_order(fake_redis) -> None:
     tasks = [
         ax.Task(
             task_name=f"task{i}",
@@ -137,12 +304,8 @@ async def test_gather_preserves_order(mock_get_result) -> None:
         for i in range(5)
     ]
 
-    results_map = {task.agent_id: SampleResult(status=f"result_{i}", value=i) for i, task in enumerate(tasks)}
-
-    async def mock_result(agent_id):
-        return results_map.get(agent_id)
-
-    mock_get_result.side_effect = mock_result
+    for i, task in reversed(list(enumerate(tasks))):
+        await store_result(task, SampleResult(status=f"result_{i}", value=i))
 
     results = await gather(*tasks)
 
@@ -175,7 +338,7 @@ async def test_get_result_raises_on_task_failure(mock_get_result) -> None:
     mock_get_result.assert_called_once_with(task.agent_id)
 
 
-async def test_gather_propagates_task_failure(mock_get_result) -> None:
+async def test_gather_propagates_task_failure(fake_redis) -> None:
     """gather raises when any task has permanently failed."""
     ok_task = ax.Task(
         task_name="ok_task",
@@ -188,17 +351,16 @@ async def test_gather_propagates_task_failure(mock_get_result) -> None:
         agent_id=uuid.uuid4(),
     )
 
-    async def mock_result(agent_id):
-        if agent_id == ok_task.agent_id:
-            return SampleResult(status="ok", value=1)
-        return TaskFailure(
+    await store_result(ok_task, SampleResult(status="ok", value=1))
+    await store_result(
+        doomed_task,
+        TaskFailure(
             task_name="doomed_task",
             agent_id=doomed_task.agent_id,
             error="fatal",
             attempts=4,
-        )
-
-    mock_get_result.side_effect = mock_result
+        ),
+    )
 
     with pytest.raises(TaskFailedError, match="doomed_task"):
         await gather(ok_task, doomed_task, timeout=30)
@@ -57,8 +57,12 @@ async def test_gather_without_task_definitions(monkeypatch) -> None:
     async def mock_state_get(key):
         return storage.get(key)
 
+    async def mock_state_get_many(keys):
+        return [storage.get(key) for key in keys]
+
     monkeypatch.setattr(backend.state, "set", mock_state_set)
     monkeypatch.setattr(backend.state, "get", mock_state_get)
+    monkeypatch.setattr(backend.state, "get_many", mock_state_get_many)
 
     # Store results via the same path task.execute() would
     for task, result in [(task1, result1), (task2, result2)]:
@@ -21,6 +21,24 @@ class TestSerialization:
         assert isinstance(restored, ResultModel)
         assert restored == model
 
+    def test_deserialize_resolves_type_once(self):
+        data = backend.serialize(ResultModel(status="success", value=42))
+        backend.deserialize(data)
+
+        with patch("importlib.import_module") as import_module:
+            restored = backend.deserialize(data)
+
+        import_module.assert_not_called()
+        assert restored == ResultModel(status="success", value=42)
+
+    def test_json_helpers_roundtrip_bytes(self):
+        from agentexec.state.base import json_dumps, json_loads
+
+        payload = {"task_name": "t", "context": {"n": 1}, "retry_count": 0}
+        data = json_dumps(payload)
+        assert isinstance(data, bytes)
+        assert json_loads(data) == payload
+
 
 class TestFormatKey:
     """Tests for key formatting."""
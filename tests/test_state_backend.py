@@ -114,6 +114,17 @@ class TestConnectionManagement:
         mock_client.aclose.assert_called_once()
         assert redis_backend._client is None
 
+    async def test_client_enables_keepalive_and_health_checks(self, monkeypatch):
+        from agentexec.config import CONF
+
+        monkeypatch.setattr(CONF, "redis_url", "redis://localhost:6379/0")
+        client = RedisBackend().client
+        kwargs = client.connection_pool.connection_kwargs
+
+        assert kwargs["socket_keepalive"] is True
+        assert kwargs["health_check_interval"] == CONF.redis_health_check_interval
+        await client.aclose()
+
     async def test_close_handles_none_clients(self):
         redis_backend = cast(RedisBackend, backend)
         redis_backend._client = None
@@ -121,3 +132,26 @@ class TestConnectionManagement:
         await backend.close()
 
         assert redis_backend._client is None
+
+
+class TestDefaultPopBatch:
+    async def test_waits_only_for_first_task(self):
+        from agentexec.state.base import BaseQueueBackend
+
+        class ListQueue(BaseQueueBackend):
+            def __init__(self, tasks):
+                self.tasks = tasks
+                self.timeouts = []
+
+            async def push(self, value, *, priority=None, partition_key=None): ...
+
+            async def pop(self, *, timeout=1):
+                self.timeouts.append(timeout)
+                return self.tasks.pop(0) if self.tasks else None
+
+            async def complete(self, partition_key): ...
+
+        queue = ListQueue([{"n": 1}, {"n": 2}])
+
+        assert await queue.pop_batch(5, timeout=3) == [{"n": 1}, {"n": 2}]
+        assert queue.timeouts == [3, 0, 0]
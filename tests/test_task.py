@@ -1,5 +1,6 @@
 import json
 import uuid
+from unittest.mock import AsyncMock
 
 import pytest
 from pydantic import BaseModel
@@ -131,7 +132,7 @@ async def test_definition_execute_async(pool, monkeypatch) -> None:
         pass
 
     monkeypatch.setattr("agentexec.core.task.activity.update", mock_update)
-    monkeypatch.setattr("agentexec.core.task.backend.state.set", mock_state_set)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", mock_state_set)
 
     execution_result = TaskResult(status="success")
 
@@ -165,7 +166,7 @@ async def test_definition_execute_sync(pool, monkeypatch) -> None:
         pass
 
     monkeypatch.setattr("agentexec.core.task.activity.update", mock_update)
-    monkeypatch.setattr("agentexec.core.task.backend.state.set", mock_state_set)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", mock_state_set)
 
     @pool.task("sync_task")
     def sync_handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
@@ -186,6 +187,55 @@ async def test_definition_execute_sync(pool, monkeypatch) -> None:
     assert len(activity_updates) == 2
 
 
+async def test_definition_execute_sync_in_thread(pool, monkeypatch) -> None:
+    """A run_in_thread handler runs off the event loop's thread."""
+    import threading
+
+    monkeypatch.setattr("agentexec.core.task.activity.update", AsyncMock())
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", AsyncMock())
+
+    @pool.task("threaded_task", run_in_thread=True)
+    def threaded_handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
+        return TaskResult(status=threading.current_thread().name)
+
+    definition = pool._context.tasks["threaded_task"]
+    task = ax.Task(task_name="threaded_task", context={"message": "test"}, agent_id=uuid.uuid4())
+
+    result = await definition.execute(task)
+
+    assert isinstance(result, TaskResult)
+    assert result.status != threading.current_thread().name
+
+
+async def test_definition_execute_silent_start(pool, monkeypatch) -> None:
+    """A silent_start task records only its completion."""
+    from agentexec.activity.status import Status
+
+    update = AsyncMock()
+    monkeypatch.setattr("agentexec.core.task.activity.update", update)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", AsyncMock())
+
+    @pool.task("quiet_task", silent_start=True)
+    async def quiet_handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
+        return TaskResult(status="done")
+
+    definition = pool._context.tasks["quiet_task"]
+    task = ax.Task(task_name="quiet_task", context={"message": "test"}, agent_id=uuid.uuid4())
+
+    await definition.execute(task)
+
+    update.assert_awaited_once()
+    assert update.await_args.kwargs["status"] == Status.COMPLETE
+
+
+def test_run_in_thread_rejects_async_handler(pool) -> None:
+    with pytest.raises(TypeError, match="run_in_thread only applies to sync handlers"):
+
+        @pool.task("async_threaded", run_in_thread=True)
+        async def handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
+            return TaskResult(status="never")
+
+
 async def test_definition_execute_error(pool, monkeypatch) -> None:
     """TaskDefinition.execute() marks activity as errored on exception."""
     from agentexec.activity.status import Status
@@ -199,7 +249,7 @@ async def test_definition_execute_error(pool, monkeypatch) -> None:
         pass
 
     monkeypatch.setattr("agentexec.core.task.activity.update", mock_update)
-    monkeypatch.setattr("agentexec.core.task.backend.state.set", mock_state_set)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", mock_state_set)
 
     @pool.task("failing_task")
     async def failing_handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
@@ -231,7 +281,7 @@ async def test_definition_execute_none_result_not_stored(pool, monkeypatch) -> N
         state_set_calls.append(key)
 
     monkeypatch.setattr("agentexec.core.task.activity.update", mock_update)
-    monkeypatch.setattr("agentexec.core.task.backend.state.set", mock_state_set)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", mock_state_set)
 
     @pool.task("void_task")
     async def void_handler(agent_id: uuid.UUID, context: SampleContext) -> None:
@@ -262,7 +312,7 @@ async def test_definition_execute_stores_result_with_ttl(pool, monkeypatch) -> N
         state_set_calls.append({"key": key, "ttl_seconds": ttl_seconds})
 
     monkeypatch.setattr("agentexec.core.task.activity.update", mock_update)
-    monkeypatch.setattr("agentexec.core.task.backend.state.set", mock_state_set)
+    monkeypatch.setattr("agentexec.core.task.backend.state.set_and_notify", mock_state_set)
 
     @pool.task("result_task")
     async def result_handler(agent_id: uuid.UUID, context: SampleContext) -> TaskResult:
@@ -272,7 +272,7 @@ class TestEventHandlerLogging:
 
         _, buf = _capture_handler()
         monkeypatch.setattr(ax.CONF, "max_task_retries", 3)
-        monkeypatch.setattr("agentexec.state.backend.state.set", AsyncMock())
+        monkeypatch.setattr("agentexec.state.backend.state.set_and_notify", AsyncMock())
 
         import queue
         q = queue.Queue()
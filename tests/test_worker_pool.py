@@ -1,3 +1,4 @@
+import asyncio
 import json
 import multiprocessing as mp
 import uuid
@@ -232,6 +233,45 @@ async def test_dequeue_returns_none_on_empty_queue(pool, monkeypatch) -> None:
     assert data is None
 
 
+def test_worker_runs_on_eager_event_loop(pool, monkeypatch) -> None:
+    """Worker tasks start executing inside create_task."""
+    from agentexec.worker.pool import Worker, WorkerContext
+
+    factories = []
+
+    async def fake_run(self) -> None:
+        factories.append(asyncio.get_running_loop().get_task_factory())
+
+    monkeypatch.setattr(Worker, "_run", fake_run)
+    context = WorkerContext(shutdown_event=mp.Event(), tasks=pool._context.tasks, tx=mp.Queue())
+    Worker(0, context).run()
+
+    assert factories == [asyncio.eager_task_factory]
+
+
+def test_worker_loop_uses_uvloop_when_available(monkeypatch) -> None:
+    """uvloop builds the worker loop when installed, unless disabled."""
+    from types import SimpleNamespace
+
+    from agentexec.worker import pool as pool_module
+
+    created = []
+
+    def new_event_loop():
+        created.append(asyncio.new_event_loop())
+        return created[-1]
+
+    monkeypatch.setattr(pool_module, "uvloop", SimpleNamespace(new_event_loop=new_event_loop))
+
+    loop = pool_module._eager_event_loop()
+    loop.close()
+    assert created == [loop]
+
+    monkeypatch.setattr(ax.CONF, "worker_uvloop", False)
+    pool_module._eager_event_loop().close()
+    assert len(created) == 1
+
+
 async def test_worker_pool_shutdown_with_no_processes(pool) -> None:
     """Test shutdown when no processes have been started."""
     # Should not raise even with empty process list
@@ -377,6 +417,136 @@ class TestWorkerFailurePath:
         assert completed_keys == ["msg:test"]
 
 
+class TestWorkerBatchDequeue:
+    """Test that Worker._run processes batches when worker_batch_size > 1."""
+
+    async def test_batch_runs_concurrently(self, pool, monkeypatch):
+        """All tasks in a popped batch execute before the next pop."""
+        from agentexec.worker.pool import Worker, WorkerContext
+
+        started = []
+        release = asyncio.Event()
+
+        @pool.task("batched")
+        async def handler(agent_id: uuid.UUID, context: SampleContext):
+            started.append(context.message)
+            if len(started) == 3:
+                release.set()
+            await asyncio.wait_for(release.wait(), timeout=1)
+
+        shutdown = mp.Event()
+        context = WorkerContext(
+            shutdown_event=shutdown,
+            tasks=pool._context.tasks,
+            tx=mp.Queue(),
+        )
+
+        batch_sizes = []
+
+        async def mock_pop_batch(count, *, timeout=1):
+            batch_sizes.append(count)
+            if len(batch_sizes) == 1:
+                return [
+                    {
+                        "task_name": "batched",
+                        "context": {"message": str(i)},
+                        "agent_id": str(uuid.uuid4()),
+                    }
+                    for i in range(3)
+                ]
+            shutdown.set()
+            return []
+
+        import agentexec.activity as activity_mod
+        monkeypatch.setattr(activity_mod, "update", AsyncMock())
+        monkeypatch.setattr("agentexec.state.backend.queue.pop_batch", mock_pop_batch)
+        monkeypatch.setattr("agentexec.state.backend.queue.complete", AsyncMock())
+        monkeypatch.setattr(ax.CONF, "worker_batch_size", 3)
+
+        await Worker(0, context)._run()
+
+        assert sorted(started) == ["0", "1", "2"]
+        assert batch_sizes[0] == 3
+
+    async def test_free_slot_refilled_while_task_runs(self, pool, monkeypatch):
+        """A long-running task doesn't stop the worker from dequeuing more work."""
+        from agentexec.worker.pool import Worker, WorkerContext
+
+        fast_done = asyncio.Event()
+
+        @pool.task("slow")
+        async def slow(agent_id: uuid.UUID, context: SampleContext):
+            await asyncio.wait_for(fast_done.wait(), timeout=1)
+
+        @pool.task("fast")
+        async def fast(agent_id: uuid.UUID, context: SampleContext):
+            fast_done.set()
+
+        shutdown = mp.Event()
+        context = WorkerContext(
+            shutdown_event=shutdown,
+            tasks=pool._context.tasks,
+            tx=mp.Queue(),
+        )
+
+        payloads = [
+            [{"task_name": "slow", "context": {"message": "a"}, "agent_id": str(uuid.uuid4())}],
+            [{"task_name": "fast", "context": {"message": "b"}, "agent_id": str(uuid.uuid4())}],
+        ]
+        requested = []
+
+        async def mock_pop(*, timeout=1):
+            requested.append(1)
+            if payloads:
+                return payloads.pop(0)[0]
+            shutdown.set()
+            return None
+
+        import agentexec.activity as activity_mod
+        monkeypatch.setattr(activity_mod, "update", AsyncMock())
+        monkeypatch.setattr("agentexec.state.backend.queue.pop", mock_pop)
+        monkeypatch.setattr("agentexec.state.backend.queue.complete", AsyncMock())
+        monkeypatch.setattr(ax.CONF, "worker_batch_size", 2)
+
+        async def mock_pop_batch(count, *, timeout=1):
+            data = await mock_pop(timeout=timeout)
+            return [data] if data else []
+
+        monkeypatch.setattr("agentexec.state.backend.queue.pop_batch", mock_pop_batch)
+
+        await Worker(0, context)._run()
+
+        assert fast_done.is_set()
+
+    async def test_unregistered_task_releases_partition(self, pool, monkeypatch):
+        """A payload the worker can't run still releases the partition it was popped from."""
+        from agentexec.state.base import PARTITION_KEY_FIELD
+        from agentexec.worker.pool import Worker, WorkerContext
+
+        context = WorkerContext(
+            shutdown_event=mp.Event(),
+            tasks=pool._context.tasks,
+            tx=mp.Queue(),
+        )
+        complete = AsyncMock()
+        monkeypatch.setattr("agentexec.state.backend.queue.complete", complete)
+        worker = Worker(0, context)
+
+        await worker._process(
+            {
+                "task_name": "unknown",
+                "context": {},
+                "agent_id": str(uuid.uuid4()),
+                PARTITION_KEY_FIELD: "user:42",
+            }
+        )
+        complete.assert_awaited_once_with("user:42")
+
+        complete.reset_mock()
+        await worker._process({"task_name": "broken", PARTITION_KEY_FIELD: "user:43"})
+        complete.assert_awaited_once_with("user:43")
+
+
 class TestPoolRetryLogic:
     """Test that _EventHandler handles TaskFailed correctly."""
 
@@ -449,7 +619,7 @@ class TestPoolRetryLogic:
             return True
 
         monkeypatch.setattr("agentexec.state.backend.queue.push", mock_push)
-        monkeypatch.setattr("agentexec.state.backend.state.set", mock_set)
+        monkeypatch.setattr("agentexec.state.backend.state.set_and_notify", mock_set)
         monkeypatch.setattr(ax.CONF, "max_task_retries", 3)
 
         eh = self._make_handler(pool)
@@ -502,3 +672,91 @@ class TestPoolRetryLogic:
         await eh._handle()
 
         assert pushed[0]["partition_key"] == "msg:hello"
+
+
+class TestEventHandlerActivityBatching:
+    """Test that _EventHandler coalesces worker activity updates."""
+
+    async def test_updates_written_in_batches_and_in_order(self, pool, monkeypatch):
+        """Consecutive updates share one write; other events split the run."""
+        import queue
+        from agentexec import activity
+        from agentexec.activity.events import ActivityCreated, ActivityUpdated
+        from agentexec.worker.pool import _EventHandler
+
+        calls: list = []
+
+        class RecordingHandler:
+            async def __call__(self, event):
+                calls.append(("one", event.message))
+
+            async def update_many(self, events):
+                calls.append(("many", [e.message for e in events]))
+
+        monkeypatch.setattr(activity, "handler", RecordingHandler())
+
+        agent_id = uuid.uuid4()
+        q: queue.Queue = queue.Queue()
+        for message in ["a", "b"]:
+            q.put(ActivityUpdated(agent_id=agent_id, message=message, status=ax.activity.Status.RUNNING))
+        q.put(ActivityCreated(agent_id=uuid.uuid4(), task_name="t", message="created"))
+        q.put(ActivityUpdated(agent_id=agent_id, message="c", status=ax.activity.Status.RUNNING))
+
+        eh = _EventHandler(
+            shutdown_event=pool._context.shutdown_event,
+            queue=q,  # type: ignore[arg-type]
+            tasks=pool._context.tasks,
+        )
+        await eh._handle()
+
+        assert calls == [("many", ["a", "b"]), ("one", "created"), ("many", ["c"])]
+        assert q.empty()
+
+    async def test_failed_update_does_not_drop_rest_of_batch(self, pool, monkeypatch):
+        """A bad update falls back to per-event writes and later events still run."""
+        import queue
+        from agentexec import activity
+        from agentexec.activity.events import ActivityUpdated
+        from agentexec.worker.pool import TaskFailed, _EventHandler
+
+        @pool.task("flaky_task")
+        async def handler(agent_id: uuid.UUID, context: SampleContext):
+            pass
+
+        bad_id = uuid.uuid4()
+        written: list = []
+
+        class FailingHandler:
+            async def __call__(self, event):
+                if event.agent_id == bad_id:
+                    raise RuntimeError("activity not found")
+                written.append(event.message)
+
+            async def update_many(self, events):
+                raise RuntimeError("FK violation")
+
+        pushed = []
+
+        async def mock_push(value, *, priority=None, partition_key=None):
+            pushed.append(value)
+
+        monkeypatch.setattr(activity, "handler", FailingHandler())
+        monkeypatch.setattr("agentexec.state.backend.queue.push", mock_push)
+        monkeypatch.setattr(ax.CONF, "max_task_retries", 3)
+
+        task = ax.Task(task_name="flaky_task", context={"message": "m"}, agent_id=uuid.uuid4())
+        q: queue.Queue = queue.Queue()
+        q.put(ActivityUpdated(agent_id=bad_id, message="bad", status=ax.activity.Status.RUNNING))
+        q.put(ActivityUpdated(agent_id=uuid.uuid4(), message="good", status=ax.activity.Status.RUNNING))
+        q.put(TaskFailed(task=task, error="boom"))
+
+        eh = _EventHandler(
+            shutdown_event=pool._context.shutdown_event,
+            queue=q,  # type: ignore[arg-type]
+            tasks=pool._context.tasks,
+        )
+        await eh._handle()
+
+        assert written == ["good"]
+        assert len(pushed) == 1
+        assert q.empty()